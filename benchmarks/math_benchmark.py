@@ -0,0 +1,62 @@
+import argparse
+import sys
+from time import perf_counter
+
+import numpy as np
+
+from turbo_nerf.utility.math import (
+    DEFAULT_NGP_ORIGIN,
+    DEFAULT_NGP_SCALE,
+    bl2nerf_pos,
+    bl2nerf_positions,
+    blender_matrices_to_nerf,
+    blender_matrix_to_nerf,
+)
+
+# Micro-benchmark for the blender <-> NeRF coordinate conversions in utility/math.py.
+# Compares converting one matrix (or point) per call against one stacked call, and prints the cost per camera.
+# Run with the TurboNeRF addon installed:
+#
+#   blender -b --python <addon dir>/benchmarks/math_benchmark.py -- --n-cams 3000
+
+def get_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="math_benchmark")
+    parser.add_argument("--n-cams", type=int, default=3000, help="Number of camera matrices to convert")
+    parser.add_argument("--n-repeats", type=int, default=10, help="Number of timed repetitions, the best one is reported")
+    return parser
+
+# Blender passes the script's own arguments after "--"
+def get_script_args() -> list[str]:
+    if "--" in sys.argv:
+        return sys.argv[sys.argv.index("--") + 1:]
+    return []
+
+def time_best(fn, n_repeats: int) -> float:
+    best = float("inf")
+    for _ in range(n_repeats):
+        t0 = perf_counter()
+        fn()
+        best = min(best, perf_counter() - t0)
+    return best
+
+def main(argv: list[str]):
+    args = get_arg_parser().parse_args(argv)
+    n = args.n_cams
+
+    rng = np.random.default_rng(0)
+    matrices = rng.random((n, 4, 4))
+    points = rng.random((n, 3))
+    offset = np.zeros(3)
+
+    results = {
+        "matrices, per call": time_best(lambda: [blender_matrix_to_nerf(m, offset, DEFAULT_NGP_ORIGIN, DEFAULT_NGP_SCALE) for m in matrices], args.n_repeats),
+        "matrices, stacked": time_best(lambda: blender_matrices_to_nerf(matrices, offset, DEFAULT_NGP_ORIGIN, DEFAULT_NGP_SCALE), args.n_repeats),
+        "points, per call": time_best(lambda: [bl2nerf_pos(p) for p in points], args.n_repeats),
+        "points, stacked": time_best(lambda: bl2nerf_positions(points), args.n_repeats),
+    }
+
+    for name, seconds in results.items():
+        print(f"{name:>20}: {1000.0 * seconds:8.3f} ms total, {1e6 * seconds / n:8.3f} us per camera")
+
+if __name__ == "__main__":
+    main(get_script_args())
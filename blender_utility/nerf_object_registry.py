@@ -0,0 +1,115 @@
+import bpy
+
+from turbo_nerf.blender_utility.obj_type_utility import is_nerf_obj_type
+from turbo_nerf.constants import NERF_ITEM_IDENTIFIER_ID, OBJ_TYPE_NERF
+
+# Keeps track of the NeRF objects in a scene and the nerf id each one points to.
+# It is kept current from the objects the depsgraph reports as updated, so keeping it up to date costs
+# in proportion to the number of changed objects instead of the number of objects in the scene.
+# A full scan of the scene only happens when the registry is first used and after undo or redo.
+
+def is_obj_in_scene(obj: bpy.types.Object, scene: bpy.types.Scene) -> bool:
+    try:
+        return obj.name in scene.objects
+    except ReferenceError:
+        # the object has been freed
+        return False
+
+class NeRFObjectRegistry:
+    def __init__(self):
+        # keyed by the object's pointer, which survives renaming
+        self.nerf_objs: dict[int, bpy.types.Object] = {}
+        self.nerf_ids: dict[int, int] = {}
+        self.needs_reconcile = True
+
+    def add(self, obj: bpy.types.Object):
+        key = obj.as_pointer()
+        self.nerf_objs[key] = obj
+        self.nerf_ids[key] = obj[NERF_ITEM_IDENTIFIER_ID]
+
+    def remove(self, key: int) -> int:
+        del self.nerf_objs[key]
+        return self.nerf_ids.pop(key)
+
+    def get_nerf_ids(self) -> set[int]:
+        return set(self.nerf_ids.values())
+
+    # Registers NeRF objects that are not in the registry yet.
+    # Returns the ones whose nerf id is already taken by another registered object, those are duplicates.
+    def add_new_objs(self, objs: list[bpy.types.Object]) -> list[bpy.types.Object]:
+        duplicated_objs = []
+        taken_ids = self.get_nerf_ids()
+
+        for obj in objs:
+            nerf_id = obj[NERF_ITEM_IDENTIFIER_ID]
+            if nerf_id in taken_ids:
+                duplicated_objs.append(obj)
+
+            taken_ids.add(nerf_id)
+            self.add(obj)
+
+        return duplicated_objs
+
+    # Unregisters the objects with the given keys.
+    # Returns the nerf ids no remaining object points to.
+    def remove_objs(self, keys: list[int]) -> list[int]:
+        removed_ids = {self.remove(key) for key in keys}
+        return list(removed_ids - self.get_nerf_ids())
+
+    # Brings the registry up to date with the objects changed in a depsgraph update.
+    # Returns (duplicated NeRF objects, nerf ids that are no longer used).
+    def apply_updates(self, scene: bpy.types.Scene, depsgraph: bpy.types.Depsgraph) -> tuple[list[bpy.types.Object], list[int]]:
+        if self.needs_reconcile:
+            return self.reconcile(scene)
+
+        # objects only leave the scene through changes to its collections
+        removed_keys = []
+        if depsgraph.id_type_updated('SCENE') or depsgraph.id_type_updated('COLLECTION'):
+            removed_keys = [key for key, obj in self.nerf_objs.items() if not is_obj_in_scene(obj, scene)]
+
+        deleted_nerf_ids = self.remove_objs(removed_keys)
+
+        new_objs = []
+        if depsgraph.id_type_updated('OBJECT'):
+            for update in depsgraph.updates:
+                if not isinstance(update.id, bpy.types.Object):
+                    continue
+
+                obj = update.id.original
+                if not is_nerf_obj_type(obj, OBJ_TYPE_NERF):
+                    continue
+
+                if obj.as_pointer() in self.nerf_objs:
+                    # the nerf id may have been reassigned
+                    self.add(obj)
+                else:
+                    new_objs.append(obj)
+
+        duplicated_objs = self.add_new_objs(new_objs)
+
+        return duplicated_objs, deleted_nerf_ids
+
+    # Rebuilds the registry from a full scan of the scene.
+    # Returns (duplicated NeRF objects, nerf ids that are no longer used), compared to what was registered before.
+    def reconcile(self, scene: bpy.types.Scene) -> tuple[list[bpy.types.Object], list[int]]:
+        prev_nerf_ids = self.get_nerf_ids()
+        prev_keys = set(self.nerf_objs.keys())
+
+        self.nerf_objs = {}
+        self.nerf_ids = {}
+        self.needs_reconcile = False
+
+        scene_nerf_objs = [o for o in scene.objects if is_nerf_obj_type(o, OBJ_TYPE_NERF)]
+
+        # objects that were registered before keep their nerf, so they claim their ids first
+        scene_nerf_objs.sort(key=lambda o: o.as_pointer() not in prev_keys)
+
+        duplicated_objs = self.add_new_objs(scene_nerf_objs)
+        deleted_nerf_ids = list(prev_nerf_ids - self.get_nerf_ids())
+
+        return duplicated_objs, deleted_nerf_ids
+
+    def clear(self):
+        self.nerf_objs = {}
+        self.nerf_ids = {}
+        self.needs_reconcile = True
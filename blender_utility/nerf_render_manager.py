@@ -1,6 +1,6 @@
 import bpy
 
-from turbo_nerf.blender_utility.obj_type_utility import get_nerf_obj_type
+from turbo_nerf.blender_utility.obj_type_utility import get_all_objs_of_type, get_nerf_obj_type
 from turbo_nerf.constants import (
     OBJ_TYPE_MASK_SHAPE,
     OBJ_TYPE_RENDER_CAMERA,
@@ -10,7 +10,7 @@ from turbo_nerf.constants import (
 class NeRFRenderManager:
     @classmethod
     def get_all_cameras(cls):
-        return [obj for obj in bpy.data.objects if cls.is_render_camera(obj)]
+        return get_all_objs_of_type(OBJ_TYPE_RENDER_CAMERA)
     
     @classmethod
     def is_render_camera(cls, obj):
@@ -27,4 +27,4 @@ class NeRFRenderManager:
     
     @classmethod
     def get_all_masks(cls):
-        return [obj for obj in bpy.data.objects if cls.is_mask(obj)]
+        return get_all_objs_of_type(OBJ_TYPE_MASK_SHAPE)
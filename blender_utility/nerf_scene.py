@@ -2,7 +2,7 @@ __reload_order_index__ = -2
 
 import bpy
 from turbo_nerf.blender_utility.driver_utility import force_update_drivers
-from turbo_nerf.blender_utility.obj_type_utility import get_nerf_obj_type
+from turbo_nerf.blender_utility.obj_type_utility import get_all_objs_of_type, get_nerf_obj_type
 from turbo_nerf.blender_utility.object_utility import (
     add_collection,
     add_cube,
@@ -287,7 +287,7 @@ class NeRFScene:
     
     @classmethod
     def get_all_cameras(cls):
-        return [obj for obj in bpy.data.objects if cls.is_nerf_camera(obj)]
+        return [obj for obj in get_all_objs_of_type(OBJ_TYPE_TRAIN_CAMERA) if obj.type == 'CAMERA']
     
     @classmethod
     def select_all_cameras(cls):
@@ -1,75 +1,56 @@
 import bpy
 import numpy as np
 
-from turbo_nerf.blender_utility.obj_type_utility import get_closest_parent_of_type, get_nerf_obj_type
-from turbo_nerf.constants import CAMERA_INDEX_ID, NERF_ITEM_IDENTIFIER_ID, OBJ_TYPE_NERF, OBJ_TYPE_TRAIN_CAMERA
+from turbo_nerf.blender_utility.nerf_object_registry import NeRFObjectRegistry
+from turbo_nerf.blender_utility.obj_type_utility import get_closest_parent_of_type, get_nerf_obj_type, hierarchy_index
+from turbo_nerf.blender_utility.training_camera_sync import training_camera_sync
+from turbo_nerf.constants import NERF_ITEM_IDENTIFIER_ID, OBJ_TYPE_NERF, OBJ_TYPE_TRAIN_CAMERA
+from turbo_nerf.utility.camera_intrinsics_cache import camera_intrinsics_cache
 from turbo_nerf.utility.nerf_manager import NeRFManager
 from turbo_nerf.utility.pylib import PyTurboNeRF as tn
-from turbo_nerf.utility.render_camera_utils import bl2nerf_cam_train
 
-scene_objects: dict = {}
+# one registry per scene, keyed by scene name
+nerf_object_registries: dict[str, NeRFObjectRegistry] = {}
 
-def filter_nerf_objs(objs: set) -> list:
-    return [o for o in objs if get_nerf_obj_type(o) == OBJ_TYPE_NERF]
-
-def get_duplicated_nerf_objs(prev_objs: set, cur_objs: set) -> list:
-    added_objs = cur_objs - prev_objs
-
-    if len(added_objs) == 0:
-        return []
+def get_nerf_object_registry(scene: bpy.types.Scene) -> NeRFObjectRegistry:
+    registry = nerf_object_registries.get(scene.name)
+    if registry is None:
+        registry = NeRFObjectRegistry()
+        nerf_object_registries[scene.name] = registry
     
-    prev_nerf_objs = filter_nerf_objs(prev_objs)
-    added_nerf_objs = filter_nerf_objs(added_objs)
-  
-    prev_nerf_ids = [o[NERF_ITEM_IDENTIFIER_ID] for o in prev_nerf_objs]
-    added_nerf_ids = [o[NERF_ITEM_IDENTIFIER_ID] for o in added_nerf_objs]
-
-    duplicate_nerf_ids = set(prev_nerf_ids).intersection(set(added_nerf_ids))
-
-    return [o for o in added_nerf_objs if o[NERF_ITEM_IDENTIFIER_ID] in duplicate_nerf_ids]
-
-def get_deleted_nerf_ids(prev_objs: set, cur_objs: set) -> list:
-    removed_objs = prev_objs - cur_objs
-    
-    if (len(removed_objs) == 0):
-        return []
-
-    all_nerf_ids = [nerf.id for nerf in NeRFManager.get_all_nerfs()]
-    cur_nerf_ids = [o[NERF_ITEM_IDENTIFIER_ID] for o in filter_nerf_objs(cur_objs)]
-
-    return [id for id in all_nerf_ids if id not in cur_nerf_ids]
+    return registry
 
 @bpy.app.handlers.persistent
 def depsgraph_update(scene: bpy.types.Scene, depsgraph: bpy.types.Depsgraph):
     
-    # check if we have new objects
-    global scene_objects
-    prev_scene_objs = scene_objects.get(scene.name, set())
-    cur_scene_objs = set(scene.objects)
-    scene_objects[scene.name] = cur_scene_objs
+    # drop the cached hierarchy if parenting changed
+    hierarchy_index.update(depsgraph)
 
-    duplicated_nerf_objs = get_duplicated_nerf_objs(
-        prev_objs=prev_scene_objs,
-        cur_objs=cur_scene_objs
-    )
+    # check for new and deleted NeRF objects
+    registry = get_nerf_object_registry(scene)
+    duplicated_nerf_objs, deleted_nerf_ids = registry.apply_updates(scene, depsgraph)
 
     # if we have any duplicated objects, we need to create new nerfs for them.
     # each nerf obj must have a unique nerf associated with it.
     for nerf_obj in duplicated_nerf_objs:
         new_nerf_id = NeRFManager.clone(nerf_obj)
         nerf_obj[NERF_ITEM_IDENTIFIER_ID] = new_nerf_id
-
-    # check if we have deleted objects
-    deleted_nerf_ids = get_deleted_nerf_ids(
-        prev_objs=prev_scene_objs,
-        cur_objs=cur_scene_objs
-    )
-
-    for nerf_id in deleted_nerf_ids:
-        NeRFManager.destroy(nerf_id)
+        registry.add(nerf_obj)
+
+    # destroy the nerfs of deleted objects
+    if len(deleted_nerf_ids) > 0:
+        all_nerf_ids = {nerf.id for nerf in NeRFManager.get_all_nerfs()}
+        for nerf_id in deleted_nerf_ids:
+            if nerf_id in all_nerf_ids:
+                NeRFManager.destroy(nerf_id)
     
     # update object transforms, etc
     for update in depsgraph.updates:
+        # lens, sensor or shift may have changed
+        if isinstance(update.id, bpy.types.Camera):
+            camera_intrinsics_cache.invalidate(update.id)
+            continue
+
         if update.is_updated_transform:
             obj = update.id
             if not isinstance(obj, bpy.types.Object):
@@ -84,19 +65,40 @@ def depsgraph_update(scene: bpy.types.Scene, depsgraph: bpy.types.Depsgraph):
             if nerf_obj is None:
                 continue
 
-            # Training Camera
+            # Training Camera, moved cameras are written to the dataset in batches
             if nerf_obj_type == OBJ_TYPE_TRAIN_CAMERA:
-                cam_obj = obj
-                nerf_id = nerf_obj[NERF_ITEM_IDENTIFIER_ID]
-                nerf = NeRFManager.get_nerf_by_id(nerf_id)
-                camera_idx = cam_obj[CAMERA_INDEX_ID]
-                nerf.dataset.set_camera_at(camera_idx, bl2nerf_cam_train(cam_obj, relative_to=nerf_obj))
-                nerf.is_dataset_dirty = True
+                training_camera_sync.add(nerf_obj.original, obj.original)
+
+# datablocks are reallocated on file load and undo, so nothing cached by pointer survives them
+
+@bpy.app.handlers.persistent
+def load_post(*args):
+    # a new file starts with fresh registries, they scan their scene on the next update
+    nerf_object_registries.clear()
+    camera_intrinsics_cache.clear()
+    training_camera_sync.clear()
+    hierarchy_index.invalidate()
+
+@bpy.app.handlers.persistent
+def undo_redo_post(*args):
+    # undo can bring back or remove any object, the registries rescan their scene on the next update
+    for registry in nerf_object_registries.values():
+        registry.needs_reconcile = True
+    
+    camera_intrinsics_cache.clear()
+    training_camera_sync.clear()
+    hierarchy_index.invalidate()
 
 def register_depsgraph_updates():
-    global scene_objects
-    scene_objects = {}
+    nerf_object_registries.clear()
     bpy.app.handlers.depsgraph_update_post.append(depsgraph_update)
+    bpy.app.handlers.load_post.append(load_post)
+    bpy.app.handlers.undo_post.append(undo_redo_post)
+    bpy.app.handlers.redo_post.append(undo_redo_post)
 
 def unregister_depsgraph_updates():
+    training_camera_sync.clear()
     bpy.app.handlers.depsgraph_update_post.remove(depsgraph_update)
+    bpy.app.handlers.load_post.remove(load_post)
+    bpy.app.handlers.undo_post.remove(undo_redo_post)
+    bpy.app.handlers.redo_post.remove(undo_redo_post)
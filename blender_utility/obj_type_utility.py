@@ -17,40 +17,29 @@ def get_nerf_obj_type(obj: bpy.types.Object) -> str | None:
 
 def set_nerf_obj_type(obj: bpy.types.Object, obj_type: str):
     obj[OBJ_TYPE_ID] = obj_type
+    hierarchy_index.invalidate()
 
 def is_nerf_obj_type(obj: bpy.types.Object, obj_type: str) -> bool:
     return get_nerf_obj_type(obj) == obj_type
 
 def get_closest_parent_of_type(obj: bpy.types.Object, obj_type: str) -> bpy.types.Object | None:
-    target = obj
-    while target is not None:
-        if is_nerf_obj_type(target, obj_type):
-            return target
-        target = target.parent
-    return None
+    if obj is None:
+        return None
+    
+    return hierarchy_index.get_closest_parent_of_type(obj, obj_type)
 
 def is_self_or_some_parent_of_type(obj: bpy.types.Object, obj_type: str) -> bool:
     return get_closest_parent_of_type(obj, obj_type) is not None
 
 def get_first_child_of_type(obj: bpy.types.Object, obj_type: str) -> bpy.types.Object | None:
-    for child in obj.children:
-        if is_nerf_obj_type(child, obj_type):
-            return child
-
-    for child in obj.children:
-        target = get_first_child_of_type(child, obj_type)
-        if target is not None:
-            return target
-
-    return None
+    return hierarchy_index.get_first_child_of_type(obj, obj_type)
 
 def get_all_training_cam_objs(nerf_obj: bpy.types.Object) -> list[bpy.types.Object]:
-    cams_container = get_first_child_of_type(nerf_obj, OBJ_TYPE_CAMERAS_CONTAINER)
-    
-    if cams_container is None:
-        return []
-    
-    return [c for c in cams_container.children if is_nerf_obj_type(c, OBJ_TYPE_TRAIN_CAMERA)]
+    return hierarchy_index.get_all_training_cam_objs(nerf_obj)
+
+# all objects in bpy.data.objects whose OBJ_TYPE_ID is obj_type
+def get_all_objs_of_type(obj_type: str) -> list[bpy.types.Object]:
+    return hierarchy_index.get_objs_of_type(obj_type)
 
 def get_active_nerf_obj(context) -> bpy.types.Object | None:
     active_obj = context.active_object
@@ -73,3 +62,148 @@ def get_nerf_training_cams(nerf_obj, context) -> list[bpy.types.Object]:
         return []
     
     return cam_objs
+
+# Caches the object hierarchy and every object's type, so the lookups above don't walk child chains,
+# scan bpy.data.objects or read ID properties on every call. The index is rebuilt lazily with a single pass over bpy.data.objects.
+# It is invalidated when the depsgraph reports a new parent or type for any updated object, or a change in collections,
+# on load and undo, and whenever the addon creates, deletes or types an object (see set_nerf_obj_type and object_utility).
+# Parent lookups follow the live parent pointers and only take the types from the index, so they are never stale
+# and return objects of the same kind (original or evaluated) as the object they are given, like walking obj.parent.
+# Child lookups return original objects, like obj.children, and only see re-parenting once a depsgraph update reported it.
+
+class HierarchyIndex:
+    def __init__(self):
+        self.invalidate()
+    
+    def invalidate(self):
+        self.is_valid = False
+        self.objs: dict[int, bpy.types.Object] = {}
+        self.parents: dict[int, int | None] = {}
+        self.children: dict[int, list[int]] = {}
+        self.types: dict[int, str | None] = {}
+        self.first_child_cache: dict[tuple[int, str], int | None] = {}
+        self.training_cams_cache: dict[int, list[bpy.types.Object]] = {}
+        self.objs_of_type_cache: dict[str, list[bpy.types.Object]] = {}
+    
+    def rebuild(self):
+        self.invalidate()
+
+        for obj in bpy.data.objects:
+            key = obj.as_pointer()
+            parent = obj.parent
+            parent_key = parent.as_pointer() if parent is not None else None
+
+            self.objs[key] = obj
+            self.parents[key] = parent_key
+            self.types[key] = obj.get(OBJ_TYPE_ID)
+
+            # bpy.data.objects is iterated in the same order as obj.children
+            if parent_key is not None:
+                self.children.setdefault(parent_key, []).append(key)
+
+        self.is_valid = True
+
+    # returns the key of an object, which is the pointer of its original, rebuilding the index first if it does not know the object
+    def get_valid_key(self, obj: bpy.types.Object) -> int:
+        key = obj.original.as_pointer()
+
+        if not self.is_valid or key not in self.types:
+            self.rebuild()
+        
+        return key
+
+    def get_obj(self, key: int | None) -> bpy.types.Object | None:
+        if key is None:
+            return None
+        
+        return self.objs[key]
+
+    def get_closest_parent_of_type(self, obj: bpy.types.Object, obj_type: str) -> bpy.types.Object | None:
+        target = obj
+        while target is not None:
+            key = self.get_valid_key(target)
+            if self.types.get(key) == obj_type:
+                return target
+            target = target.parent
+        
+        return None
+
+    def find_first_child_of_type(self, key: int, obj_type: str) -> int | None:
+        children = self.children.get(key, [])
+
+        for child in children:
+            if self.types[child] == obj_type:
+                return child
+        
+        for child in children:
+            target = self.find_first_child_of_type(child, obj_type)
+            if target is not None:
+                return target
+        
+        return None
+
+    def get_first_child_of_type(self, obj: bpy.types.Object, obj_type: str) -> bpy.types.Object | None:
+        key = self.get_valid_key(obj)
+        cache_key = (key, obj_type)
+
+        if cache_key not in self.first_child_cache:
+            self.first_child_cache[cache_key] = self.find_first_child_of_type(key, obj_type)
+        
+        return self.get_obj(self.first_child_cache[cache_key])
+
+    def get_all_training_cam_objs(self, nerf_obj: bpy.types.Object) -> list[bpy.types.Object]:
+        key = self.get_valid_key(nerf_obj)
+
+        if key not in self.training_cams_cache:
+            cams_container = self.get_first_child_of_type(nerf_obj, OBJ_TYPE_CAMERAS_CONTAINER)
+
+            if cams_container is None:
+                cam_objs = []
+            else:
+                container_key = cams_container.as_pointer()
+                cam_objs = [self.objs[c] for c in self.children.get(container_key, []) if self.types[c] == OBJ_TYPE_TRAIN_CAMERA]
+            
+            self.training_cams_cache[key] = cam_objs
+        
+        # callers may modify the list
+        return list(self.training_cams_cache[key])
+
+    def get_objs_of_type(self, obj_type: str) -> list[bpy.types.Object]:
+        if not self.is_valid:
+            self.rebuild()
+        
+        if obj_type not in self.objs_of_type_cache:
+            self.objs_of_type_cache[obj_type] = [self.objs[key] for key, t in self.types.items() if t == obj_type]
+        
+        # callers may modify the list
+        return list(self.objs_of_type_cache[obj_type])
+
+    # Invalidates the index if a depsgraph update changed the hierarchy anywhere,
+    # checking the parent and type of every updated object against the cached ones.
+    def update(self, depsgraph: bpy.types.Depsgraph):
+        if not self.is_valid:
+            return
+        
+        # objects were added or removed
+        if depsgraph.id_type_updated('COLLECTION'):
+            self.invalidate()
+            return
+        
+        if not depsgraph.id_type_updated('OBJECT'):
+            return
+        
+        for update in depsgraph.updates:
+            if not isinstance(update.id, bpy.types.Object):
+                continue
+
+            obj = update.id.original
+            key = obj.as_pointer()
+
+            parent = obj.parent
+            parent_key = parent.as_pointer() if parent is not None else None
+
+            if key not in self.parents or self.parents[key] != parent_key or self.types[key] != obj.get(OBJ_TYPE_ID):
+                self.invalidate()
+                return
+
+hierarchy_index = HierarchyIndex()
@@ -3,6 +3,7 @@ import bmesh
 import mathutils
 
 from turbo_nerf.blender_utility.logging_utility import log_report
+from turbo_nerf.blender_utility.obj_type_utility import hierarchy_index
 
 
 def add_empty(name, collection=None, type='PLAIN_AXES') -> bpy.types.Object:
@@ -12,6 +13,7 @@ def add_empty(name, collection=None, type='PLAIN_AXES') -> bpy.types.Object:
     empty_obj = bpy.data.objects.new(name, None)
     empty_obj.empty_display_type = type
     collection.objects.link(empty_obj)
+    hierarchy_index.invalidate()
     return empty_obj
 
 def add_obj(data, obj_name, collection=None) -> bpy.types.Object:
@@ -21,6 +23,7 @@ def add_obj(data, obj_name, collection=None) -> bpy.types.Object:
 
     new_obj = bpy.data.objects.new(obj_name, data)
     collection.objects.link(new_obj)
+    hierarchy_index.invalidate()
     new_obj.select_set(state=True)
 
     if (
@@ -45,6 +48,7 @@ def add_cube(name, size=2.0, collection=None):
     bm.free()
 
     collection.objects.link(cube)
+    hierarchy_index.invalidate()
 
     return cube
 
@@ -62,6 +66,7 @@ def add_cylinder(name="Cylinder", radius=1.0, depth=2.0, collection=None):
     bm.free()
 
     collection.objects.link(cylinder)
+    hierarchy_index.invalidate()
 
     return cylinder
 
@@ -74,6 +79,7 @@ def add_sphere(name="UV Sphere", radius=1.0, collection=None):
     sphere = bpy.data.objects.new(name, mesh)
     
     collection.objects.link(sphere)
+    hierarchy_index.invalidate()
 
     bm = bmesh.new()
     bmesh.ops.create_uvsphere(bm, u_segments=16, v_segments=8, radius=radius)
@@ -145,3 +151,4 @@ def delete_object(obj):
         delete_object(child)
     
     bpy.data.objects.remove(obj)
+    hierarchy_index.invalidate()
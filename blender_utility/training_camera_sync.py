@@ -0,0 +1,59 @@
+import bpy
+
+from turbo_nerf.constants import CAMERA_INDEX_ID, NERF_ITEM_IDENTIFIER_ID
+from turbo_nerf.constants.renderer import TRAINING_CAMERA_SYNC_INTERVAL
+from turbo_nerf.utility.nerf_manager import NeRFManager
+from turbo_nerf.utility.render_camera_utils import bl2nerf_cams_train
+
+# Collects the training cameras that moved and writes them to their NeRF's dataset in one batch.
+# Moving many cameras at once (or dragging them) would otherwise update and re-upload the dataset once per camera.
+# A flush happens a short while after the first pending camera, so all updates within that window are coalesced.
+
+class TrainingCameraSync:
+    def __init__(self):
+        # nerf id -> (nerf object, {camera object pointer: camera object})
+        self.pending: dict[int, tuple[bpy.types.Object, dict[int, bpy.types.Object]]] = {}
+
+    def add(self, nerf_obj: bpy.types.Object, cam_obj: bpy.types.Object):
+        nerf_id = nerf_obj[NERF_ITEM_IDENTIFIER_ID]
+        if nerf_id not in self.pending:
+            self.pending[nerf_id] = (nerf_obj, {})
+        
+        self.pending[nerf_id][1][cam_obj.as_pointer()] = cam_obj
+
+        if not bpy.app.timers.is_registered(flush_training_camera_sync):
+            bpy.app.timers.register(flush_training_camera_sync, first_interval=TRAINING_CAMERA_SYNC_INTERVAL)
+
+    def flush(self):
+        pending = self.pending
+        self.pending = {}
+
+        for nerf_id, (nerf_obj, cam_objs_by_ptr) in pending.items():
+            # the NeRF may have been destroyed within the sync interval, its queued cameras are dropped
+            nerf = NeRFManager.get_nerf_by_id(nerf_id)
+            if nerf is None or nerf.dataset is None:
+                continue
+            
+            try:
+                cam_objs = list(cam_objs_by_ptr.values())
+                cam_indices = [cam_obj[CAMERA_INDEX_ID] for cam_obj in cam_objs]
+                cams = bl2nerf_cams_train(cam_objs, relative_to=nerf_obj)
+            except ReferenceError:
+                # something was deleted before the flush, there is nothing left to update
+                continue
+            
+            for camera_idx, cam in zip(cam_indices, cams):
+                nerf.dataset.set_camera_at(camera_idx, cam)
+            
+            nerf.is_dataset_dirty = True
+    
+    def clear(self):
+        self.pending = {}
+        if bpy.app.timers.is_registered(flush_training_camera_sync):
+            bpy.app.timers.unregister(flush_training_camera_sync)
+
+training_camera_sync = TrainingCameraSync()
+
+def flush_training_camera_sync():
+    training_camera_sync.flush()
+    return None
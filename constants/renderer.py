@@ -0,0 +1,63 @@
+# Maximum time (in seconds) a final render waits on bridge events before polling for cancellation
+RENDER_CANCEL_CHECK_INTERVAL = 0.1
+
+# Byte offset of the pixel buffer pointer inside a RenderPass struct, see https://devtalk.blender.org/t/pass-a-render-result-as-a-numpy-array-to-bpy-types-renderengine/11615/8
+RENDER_PASS_RECT_PTR_OFFSET = 96
+
+# Default minimum time (in seconds) between update_result calls during a final render
+RENDER_MIN_UPDATE_INTERVAL_DEFAULT = 0.5
+
+# Default width and height of tiles in tiled final renders
+RENDER_TILE_SIZE_DEFAULT = 2048
+
+# How often (in seconds) the batch renderer checks for finished frames
+BATCH_RENDER_TIMER_INTERVAL = 0.01
+
+# Time (in seconds) without camera motion after which a downscaled viewport preview is refined at full resolution
+PREVIEW_MOTION_SETTLE_TIME = 0.15
+
+# Weight of the newest sample in the smoothed viewport preview latency
+PREVIEW_LATENCY_SMOOTHING = 0.5
+
+# Time (in seconds) after which a viewport preview that has not completed no longer blocks newer requests.
+# Only a safety net for a completion event that never arrives.
+PREVIEW_IN_FLIGHT_TIMEOUT = 2.0
+
+# Weight of the newest sample in the smoothed training step time and preview cost
+PREVIEW_SCHEDULER_SMOOTHING = 0.25
+
+# Maximum number of previews worth of GPU time the training preview scheduler can save up
+PREVIEW_SCHEDULER_MAX_TOKENS = 2.0
+
+# Number of most recent samples kept per render engine phase by the phase profiler
+PHASE_PROFILER_N_SAMPLES = 512
+
+# Resolution scale of the first pass of a progressive final render, each following pass doubles it
+PROGRESSIVE_RENDER_START_SCALE = 0.25
+
+# Default location and size cap (in megabytes) of the final render result cache
+RENDER_RESULT_CACHE_DIR_DEFAULT = "//turbo_nerf_cache/"
+RENDER_RESULT_CACHE_MAX_SIZE_DEFAULT = 4096
+
+# Number of threads that encode and write rendered images
+IMAGE_WRITER_N_THREADS = 4
+
+# Maximum number of rendered images waiting to be written before submitting another one blocks
+IMAGE_WRITER_MAX_PENDING = 8
+
+# Names of the extra render passes the engine can fill
+RENDER_PASS_DEPTH = "Depth"
+RENDER_PASS_OPACITY = "Opacity"
+
+# Maximum number of memoized intrinsics per camera datablock, one entry per output resolution
+CAMERA_INTRINSICS_CACHE_MAX_ENTRIES = 64
+
+# Far plane of render cameras that have no clip settings of their own (the quadrilateral rigs)
+RENDER_CAM_FAR_DEFAULT = 1e5
+
+# Render camera rigs with parallel rays are rendered with a pinhole this many sensor sizes behind their sensor.
+# Rays then deviate from parallel by at most 1 / (2 * RENDER_CAM_PARALLEL_RAYS_DISTANCE) radians at the edge of the image.
+RENDER_CAM_PARALLEL_RAYS_DISTANCE = 1e4
+
+# Time (in seconds) moved training cameras are collected before their NeRF's dataset is updated in one go
+TRAINING_CAMERA_SYNC_INTERVAL = 0.05
@@ -13,7 +13,7 @@ from pathlib import Path
 # invoke() function which calls the file selector.
 from bpy.props import StringProperty
 
-from turbo_nerf.utility.render_camera_utils import bl2nerf_cam
+from turbo_nerf.utility.render_camera_utils import bl2nerf_cam, get_render_cam_error
 
 class ExportRenderCamJSON(bpy.types.Operator):
 
@@ -53,15 +53,22 @@ class ExportRenderCamJSON(bpy.types.Operator):
             
             nerf_cam = bl2nerf_cam(active_cam, render_dims)
 
-            focal_len, _ = nerf_cam.focal_length
+            if nerf_cam is None:
+                self.report({'ERROR'}, get_render_cam_error(active_cam) or f'Could not convert {active_cam.name} to a TurboNeRF camera')
+                return {'CANCELLED'}
+
+            fl_x, fl_y = nerf_cam.focal_length
             
             # create dict for this frame
+            # focal_length is kept for readers that only know square pixels, the rigs can have different focal lengths per axis
             frame_dict = {
                 "camera": {
                     "transform": np.array(nerf_cam.transform.to_matrix()).tolist(),
                     "near": nerf_cam.near,
                     "far": nerf_cam.far,
-                    "focal_length": focal_len,
+                    "focal_length": fl_x,
+                    "fl_x": fl_x,
+                    "fl_y": fl_y,
                 }
             }
 
@@ -1,5 +1,8 @@
 import bpy
+from turbo_nerf.panels.nerf_panel_operators.export_render_profile_operator import ExportRenderProfileOperator
 from turbo_nerf.panels.nerf_panel_operators.preview_nerf_operator import PreviewNeRFOperator
+from turbo_nerf.renderer.phase_profiler_overlay import PhaseProfilerOverlay
+from turbo_nerf.renderer.training_preview_scheduler import training_preview_stats
 from turbo_nerf.utility.nerf_manager import NeRFManager
 from turbo_nerf.utility.pylib import PyTurboNeRF as tn
 
@@ -39,6 +42,94 @@ class NeRF3DViewPreviewPanelProps(bpy.types.PropertyGroup):
         precision=1,
     )
 
+    use_dynamic_resolution: bpy.props.BoolProperty(
+        name="use_dynamic_resolution",
+        description="Lower the preview resolution while the viewport camera is moving.",
+        default=False,
+    )
+
+    target_frame_time: bpy.props.FloatProperty(
+        name="target_frame_time",
+        description="Preview latency to aim for while the viewport camera is moving, in milliseconds.",
+        default=50,
+        min=5,
+        max=1000,
+        precision=0,
+    )
+
+    min_resolution_scale: bpy.props.FloatProperty(
+        name="min_resolution_scale",
+        description="Smallest fraction of the viewport resolution to render previews at.",
+        default=0.25,
+        min=0.05,
+        max=1.0,
+        precision=2,
+    )
+
+    use_camera_tolerance: bpy.props.BoolProperty(
+        name="use_camera_tolerance",
+        description="Ignore viewport camera changes that are smaller than the tolerances below.",
+        default=True,
+    )
+
+    camera_transform_tolerance: bpy.props.FloatProperty(
+        name="camera_transform_tolerance",
+        description="Largest change in any element of the camera transform that does not trigger a new preview.",
+        default=1e-5,
+        min=0.0,
+        max=1.0,
+        precision=6,
+    )
+
+    camera_focal_length_tolerance: bpy.props.FloatProperty(
+        name="camera_focal_length_tolerance",
+        description="Largest change in focal length (in pixels) that does not trigger a new preview.",
+        default=1e-3,
+        min=0.0,
+        max=100.0,
+        precision=4,
+    )
+
+    camera_near_far_tolerance: bpy.props.FloatProperty(
+        name="camera_near_far_tolerance",
+        description="Largest change in the near or far clipping distance that does not trigger a new preview.",
+        default=1e-5,
+        min=0.0,
+        max=1.0,
+        precision=6,
+    )
+
+    camera_shift_tolerance: bpy.props.FloatProperty(
+        name="camera_shift_tolerance",
+        description="Largest change in lens shift that does not trigger a new preview.",
+        default=1e-5,
+        min=0.0,
+        max=1.0,
+        precision=6,
+    )
+
+    preview_time_budget: bpy.props.FloatProperty(
+        name="preview_time_budget",
+        description="Fraction of GPU time that can be spent on previews during training.",
+        default=0.1,
+        min=0.01,
+        max=0.9,
+        precision=2,
+    )
+
+    def toggle_render_profiler(self, context):
+        if self.show_render_profiler:
+            PhaseProfilerOverlay.enable()
+        else:
+            PhaseProfilerOverlay.disable()
+
+    show_render_profiler: bpy.props.BoolProperty(
+        name="show_render_profiler",
+        description="Time the render engine phases and show their p50/p95 in the viewport.",
+        default=False,
+        update=toggle_render_profiler,
+    )
+
     def force_redraw(self, context):
         # TODO: we don't need to do this for all items
         for nerf in NeRFManager.get_all_nerfs():
@@ -79,6 +170,7 @@ class NeRF3DViewPreviewPanel(bpy.types.Panel):
     def register(cls):
         """Register properties and operators corresponding to this panel."""
         bpy.utils.register_class(PreviewNeRFOperator)
+        bpy.utils.register_class(ExportRenderProfileOperator)
         bpy.utils.register_class(NeRF3DViewPreviewPanelProps)
         bpy.types.Scene.nerf_preview_panel_props = bpy.props.PointerProperty(type=NeRF3DViewPreviewPanelProps)
 
@@ -86,7 +178,9 @@ class NeRF3DViewPreviewPanel(bpy.types.Panel):
     @classmethod
     def unregister(cls):
         """Unregister properties and operators corresponding to this panel."""
+        PhaseProfilerOverlay.disable()
         bpy.utils.unregister_class(PreviewNeRFOperator)
+        bpy.utils.unregister_class(ExportRenderProfileOperator)
         bpy.utils.unregister_class(NeRF3DViewPreviewPanelProps)
         del bpy.types.Scene.nerf_preview_panel_props
 
@@ -107,9 +201,55 @@ class NeRF3DViewPreviewPanel(bpy.types.Panel):
         if ui_props.update_preview:
             row = box.row()
             row.prop(ui_props, "time_between_preview_updates", text="Every (s):")
+
+            row = box.row()
+            row.prop(ui_props, "preview_time_budget", text="GPU Budget:")
+
+            if NeRFManager.is_training():
+                stats = training_preview_stats
+                preview_percent = 100.0 * stats.preview_time_fraction
+
+                row = box.row()
+                row.label(text=f"Training {100.0 - preview_percent:.0f}% / Preview {preview_percent:.0f}%")
+
+                row = box.row()
+                row.label(text=f"Step: {1000.0 * stats.step_time:.1f} ms, Preview: {1000.0 * stats.preview_cost:.0f} ms")
         
+        row = box.row()
+        row.prop(ui_props, "use_dynamic_resolution", text="Dynamic Resolution")
+
+        if ui_props.use_dynamic_resolution:
+            row = box.row()
+            row.prop(ui_props, "target_frame_time", text="Target (ms):")
+
+            row = box.row()
+            row.prop(ui_props, "min_resolution_scale", text="Min Scale:")
+
+        row = box.row()
+        row.prop(ui_props, "use_camera_tolerance", text="Camera Tolerance")
+
+        if ui_props.use_camera_tolerance:
+            row = box.row()
+            row.prop(ui_props, "camera_transform_tolerance", text="Transform:")
+
+            row = box.row()
+            row.prop(ui_props, "camera_focal_length_tolerance", text="Focal Length:")
+
+            row = box.row()
+            row.prop(ui_props, "camera_near_far_tolerance", text="Near/Far:")
+
+            row = box.row()
+            row.prop(ui_props, "camera_shift_tolerance", text="Shift:")
+
         row = box.row()
         row.prop(ui_props, "show_near_planes", text="Show Near Planes")
 
         row = box.row()
         row.prop(ui_props, "show_far_planes", text="Show Far Planes")
+
+        row = box.row()
+        row.prop(ui_props, "show_render_profiler", text="Profile Render Phases")
+
+        if ui_props.show_render_profiler:
+            row = box.row()
+            row.operator(ExportRenderProfileOperator.bl_idname, text="Export Profile CSV")
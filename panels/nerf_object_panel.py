@@ -22,7 +22,7 @@ from turbo_nerf.constants import (
 from turbo_nerf.utility.math import clamp
 from turbo_nerf.utility.nerf_manager import NeRFManager
 from turbo_nerf.utility.pylib import PyTurboNeRF as tn
-from turbo_nerf.utility.render_camera_utils import bl2nerf_cam_train
+from turbo_nerf.utility.render_camera_utils import bl2nerf_cams_train
 
 # helper methods
 # kinda dirty to put these in the global scope for this file
@@ -40,7 +40,7 @@ def set_props_for_cams(nerf_obj, nerf):
     cam_objs = get_all_training_cam_objs(nerf_obj)
 
     # todo: only update the cameras that have changed
-    nerf.dataset.cameras = [bl2nerf_cam_train(cam_obj, relative_to=nerf_obj) for cam_obj in cam_objs]
+    nerf.dataset.cameras = bl2nerf_cams_train(cam_objs, relative_to=nerf_obj)
     nerf.is_dataset_dirty = True
 
 # Custom property group
@@ -14,7 +14,7 @@ from turbo_nerf.constants import (
 )
 from turbo_nerf.utility.nerf_manager import NeRFManager
 from turbo_nerf.utility.pylib import PyTurboNeRF as tn
-from turbo_nerf.utility.render_camera_utils import bl2nerf_cam_train
+from turbo_nerf.utility.render_camera_utils import bl2nerf_cams_train
 
 class ExportNeRFDatasetOperator(bpy.types.Operator):
     """An Operator to export a NeRF dataset from a directory."""
@@ -42,12 +42,7 @@ class ExportNeRFDatasetOperator(bpy.types.Operator):
 
         cam_objs = get_all_training_cam_objs(nerf_obj)
 
-        nerf_cams = []
-        for cam_obj in cam_objs:
-            nerf_cam = bl2nerf_cam_train(cam_obj, relative_to=nerf_obj)
-            nerf_cams.append(nerf_cam)
-    
-        dataset.cameras = nerf_cams
+        dataset.cameras = bl2nerf_cams_train(cam_objs, relative_to=nerf_obj)
 
         json_data: dict = dataset.to_json()
 
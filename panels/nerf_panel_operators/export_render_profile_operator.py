@@ -0,0 +1,34 @@
+import bpy
+from pathlib import Path
+
+from turbo_nerf.renderer.phase_profiler import phase_profiler
+
+class ExportRenderProfileOperator(bpy.types.Operator):
+    """Export the timings of the render engine phases to a CSV file"""
+    bl_idname = "turbo_nerf.export_render_profile"
+    bl_label = "Export Render Profile"
+    bl_options = {'REGISTER'}
+
+    filepath: bpy.props.StringProperty(subtype='FILE_PATH')
+    filename_ext = ".csv"
+    filter_glob: bpy.props.StringProperty(default='*.csv', options={'HIDDEN'})
+
+    @classmethod
+    def poll(cls, context):
+        return len(phase_profiler.phases) > 0
+
+    def execute(self, context):
+        csv_path = Path(self.filepath)
+        if csv_path.suffix != ".csv":
+            csv_path = csv_path.with_suffix(".csv")
+        
+        phase_profiler.write_csv(csv_path)
+
+        return {'FINISHED'}
+
+    def invoke(self, context, event):
+        self.filepath = "render-profile.csv"
+        
+        context.window_manager.fileselect_add(self)
+
+        return {'RUNNING_MODAL'}
@@ -33,6 +33,7 @@ from turbo_nerf.panels.render_panel_operators.camera_manager_operators import Bl
 from turbo_nerf.panels.render_panel_operators.operator_export_nerf_render_json import BlenderNeRFExportRenderJSON
 from turbo_nerf.panels.render_panel_operators.mask_shape_operators import BlenderNeRFAddMaskShapeOperator
 from turbo_nerf.panels.render_panel_operators.ngp_snapshot_operators import ImportNGPSnapshotOperator
+from turbo_nerf.utility.render_camera_utils import get_render_cam_error
 
 CAMERA_TYPES = {
     RENDER_CAM_TYPE_PERSPECTIVE: {
@@ -41,11 +42,11 @@ CAMERA_TYPES = {
     },
     RENDER_CAM_TYPE_SPHERICAL_QUADRILATERAL: {
         "name": "Spherical Quadrilateral",
-        "description": "A rectangular quadrilateral that can be curved",
+        "description": "A rectangular quadrilateral that can be curved. Only flat (orthographic) ones can be rendered",
     },
     RENDER_CAM_TYPE_QUADRILATERAL_HEXAHEDRON: {
         "name": "Quadrilateral Hexahedron",
-        "description": "A 6-sided polyhedron that can be used for inverted perspective, ortho, or normal perspective.",
+        "description": "A 6-sided polyhedron that can be used for inverted perspective, ortho, or normal perspective. Inverted perspective cannot be rendered",
     }
 }
 
@@ -183,6 +184,12 @@ class NeRFRenderPanel(bpy.types.Panel):
             text=f"Create {CAMERA_TYPES[settings.camera_model]['name']} Camera"
         )
 
+        # warn before rendering if the scene camera is a rig TurboNeRF cannot render
+        if context.scene.camera is not None:
+            cam_error = get_render_cam_error(context.scene.camera)
+            if cam_error is not None:
+                section.label(text=cam_error, icon='ERROR')
+
         # Masks section
 
         section = layout.box()
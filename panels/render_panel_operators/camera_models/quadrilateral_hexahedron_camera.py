@@ -1,9 +1,9 @@
 import mathutils
 import numpy as np
 
+from turbo_nerf.blender_utility.obj_type_utility import set_nerf_obj_type
 from turbo_nerf.blender_utility.object_utility import add_empty, select_object
 from turbo_nerf.constants import (
-    OBJ_TYPE_ID,
     OBJ_TYPE_RENDER_CAMERA,
     RENDER_CAM_IS_ACTIVE_ID,
     RENDER_CAM_NEAR_ID,
@@ -98,7 +98,7 @@ def get_quadrilateral_hexahedron_camera_node_quaternion_rotation(front_sensor_si
 def add_quadrilateral_hexahedron_camera(name='Quadrilateral Hexahedron Camera', collection=None):
 
     cam_base = add_empty(name, collection=collection, type='ARROWS')
-    cam_base[OBJ_TYPE_ID] = OBJ_TYPE_RENDER_CAMERA
+    set_nerf_obj_type(cam_base, OBJ_TYPE_RENDER_CAMERA)
     cam_base[RENDER_CAM_TYPE_ID] = RENDER_CAM_TYPE_QUADRILATERAL_HEXAHEDRON
     cam_base[RENDER_CAM_IS_ACTIVE_ID] = True
 
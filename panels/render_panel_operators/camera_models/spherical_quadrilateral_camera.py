@@ -3,7 +3,6 @@ import math
 import mathutils
 import numpy as np
 from turbo_nerf.constants import (
-    OBJ_TYPE_ID,
     OBJ_TYPE_RENDER_CAMERA,
     RENDER_CAM_NEAR_ID,
     RENDER_CAM_SENSOR_DIAGONAL_ID,
@@ -14,6 +13,7 @@ from turbo_nerf.constants import (
     RENDER_CAM_TYPE_SPHERICAL_QUADRILATERAL,
 )
 
+from turbo_nerf.blender_utility.obj_type_utility import set_nerf_obj_type
 from turbo_nerf.blender_utility.object_utility import add_empty
 
 # https://www.desmos.com/calculator/gxvsrnpd0d
@@ -107,7 +107,7 @@ def add_spherical_quadrilateral_camera(name='Spherical Quadrilateral Camera', co
     coords = coords.reshape(-1, coords.shape[-1])
 
     cam_base = add_empty(name, collection=collection, type='ARROWS')
-    cam_base[OBJ_TYPE_ID] = OBJ_TYPE_RENDER_CAMERA
+    set_nerf_obj_type(cam_base, OBJ_TYPE_RENDER_CAMERA)
     cam_base[RENDER_CAM_TYPE_ID] = RENDER_CAM_TYPE_SPHERICAL_QUADRILATERAL
     cam_base[RENDER_CAM_SPHERICAL_QUAD_CURVATURE_ID] = 0.0
     prop = cam_base.id_properties_ui(RENDER_CAM_SPHERICAL_QUAD_CURVATURE_ID)
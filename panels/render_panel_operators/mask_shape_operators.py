@@ -12,10 +12,10 @@ from turbo_nerf.constants import (
     MASK_TYPE_CYLINDER,
     MASK_TYPE_ID,
     MASK_TYPE_SPHERE,
-    OBJ_TYPE_ID,
     OBJ_TYPE_MASK_SHAPE,
 )
 
+from turbo_nerf.blender_utility.obj_type_utility import set_nerf_obj_type
 from turbo_nerf.blender_utility.object_utility import add_cube, add_cylinder, add_empty, add_sphere, select_object
 
 # TODO: these should be in a different file
@@ -181,7 +181,7 @@ class BlenderNeRFAddMaskShapeOperator(bpy.types.Operator):
         mask_type = context.scene.nerf_render_panel_settings.mask_shape
         mask_base = add_empty(f"{MASK_TYPE_TO_NICE_NAME[mask_type]} Mask Object")
         
-        mask_base[OBJ_TYPE_ID] = OBJ_TYPE_MASK_SHAPE
+        set_nerf_obj_type(mask_base, OBJ_TYPE_MASK_SHAPE)
         mask_base[MASK_TYPE_ID] = mask_type
         mask_base[MASK_MODE_ID] = context.scene.nerf_render_panel_settings.mask_mode
         mask_base[MASK_FEATHER_ID] = 0.0
@@ -47,7 +47,7 @@ from turbo_nerf.constants import (
     NERF_OPACITY_ID,
 )
 from turbo_nerf.utility.render_camera_utils import bl2nerf_fl
-from turbo_nerf.utility.math import bl2nerf_mat, bl2nerf_pos
+from turbo_nerf.utility.math import DEFAULT_NGP_ORIGIN, DEFAULT_NGP_SCALE, bl2nerf_mat, bl2nerf_pos, blender_matrices_to_nerf
 
 def mat_to_list(m: mathutils.Matrix) -> list[float]:
     return [list(r) for r in m]
@@ -136,7 +136,7 @@ def serialize_active_camera(out_dims):
             "focus_target": list(ngp_focus_target),
             "near": cam_data.clip_start,
             "far": 1e5,
-            "focal_len": bl2nerf_fl(camera, out_dims)
+            "focal_len": bl2nerf_fl(cam_data, out_dims)
         }
     elif camera[RENDER_CAM_TYPE_ID] == RENDER_CAM_TYPE_SPHERICAL_QUADRILATERAL:
         cam_json = {
@@ -163,7 +163,16 @@ def serialize_active_camera(out_dims):
 def serialize_masks(snapshot=None):
     masks = [m for m in NeRFRenderManager.get_all_masks() if m.parent == snapshot]
     mask_json = []
-    for mask in masks:
+
+    # convert all mask transforms in one stacked call
+    mask_transforms = blender_matrices_to_nerf(
+        np.array([mask.matrix_local for mask in masks]).reshape(-1, 4, 4),
+        offset=np.zeros(3),
+        origin=DEFAULT_NGP_ORIGIN,
+        scale=DEFAULT_NGP_SCALE,
+    )
+
+    for mask, mask_transform in zip(masks, mask_transforms):
         specific_props = {}
         if mask[MASK_TYPE_ID] == MASK_TYPE_BOX:
             specific_props = {
@@ -184,7 +193,7 @@ def serialize_masks(snapshot=None):
             "mode": mask[MASK_MODE_ID],
             "feather": mask[MASK_FEATHER_ID],
             "opacity": mask[MASK_OPACITY_ID],
-            "transform": bl2nerf_mat(mask.matrix_local).tolist(),
+            "transform": mask_transform.tolist(),
             **specific_props
         })
     
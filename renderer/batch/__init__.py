@@ -0,0 +1 @@
+""" Batch rendering of animations and render JSON sequences """
@@ -0,0 +1,231 @@
+import bpy
+import numpy as np
+from pathlib import Path
+from time import perf_counter
+
+from turbo_nerf.blender_utility.logging_utility import log_report
+from turbo_nerf.constants.renderer import BATCH_RENDER_TIMER_INTERVAL, RENDER_CANCEL_CHECK_INTERVAL
+from turbo_nerf.renderer.batch.image_writer import BackgroundImageWriter
+from turbo_nerf.renderer.render_result_utils import get_buffer_as_array
+from turbo_nerf.renderer.render_waiter import RenderWaiter
+from turbo_nerf.renderer.renderables import get_nerf_objs, get_nerf_transform, get_renderable
+from turbo_nerf.utility.nerf_manager import NeRFManager
+from turbo_nerf.utility.pylib import PyTurboNeRF as tn
+from turbo_nerf.utility.render_camera_utils import bl2nerf_cam, camera_with_flipped_y, get_render_cam_error
+
+BATCH_OUTPUT_SUFFIXES = {
+    'PNG': ".png",
+    'OPEN_EXR': ".exr",
+}
+
+# Everything the bridge needs to render one frame, read from Blender before the frame is submitted
+class PreparedFrame:
+    def __init__(
+        self,
+        frame: int,
+        camera: tn.Camera,
+        nerf_transforms: list[tuple[tn.NeRF, tn.Transform4f]],
+        renderables: list[tn.Renderable],
+        output_path: Path,
+    ):
+        self.frame = frame
+        self.camera = camera
+        self.nerf_transforms = nerf_transforms
+        self.renderables = renderables
+        self.output_path = output_path
+
+def get_render_dims(scene: bpy.types.Scene) -> tuple[int, int]:
+    scale = scene.render.resolution_percentage / 100.0
+    size_x = int(scene.render.resolution_x * scale)
+    size_y = int(scene.render.resolution_y * scale)
+    return (size_x, size_y)
+
+class TurboNeRFBatchRenderOperator(bpy.types.Operator):
+    """Render the frame range with TurboNeRF, writing each frame to disk while the next one renders"""
+    
+    bl_idname = "turbo_nerf.batch_render_animation"
+    bl_label = "Batch Render Animation"
+    bl_options = {'REGISTER'}
+
+    @classmethod
+    def poll(cls, context):
+        return context.scene.camera is not None
+
+    # Returns None and reports an error if the frame's camera cannot be converted
+    def prepare_frame(self, context: bpy.types.Context, frame: int) -> PreparedFrame | None:
+        scene = context.scene
+        scene.frame_set(frame)
+
+        camera = bl2nerf_cam(scene.camera, self.dims, context)
+
+        if camera is None:
+            error = get_render_cam_error(scene.camera) or f"Could not convert {scene.camera.name} to a TurboNeRF camera"
+            self.report({'ERROR'}, f"Frame {frame}: {error}")
+            return None
+
+        camera = camera_with_flipped_y(camera)
+
+        nerf_objs = get_nerf_objs(scene)
+        
+        # transforms are applied to the NeRFs when the frame is submitted
+        nerf_transforms = [(NeRFManager.get_nerf_for_obj(o), get_nerf_transform(o)) for o in nerf_objs]
+        renderables = [get_renderable(o) for o in nerf_objs]
+
+        output_path = Path(scene.render.frame_path(frame=frame)).with_suffix(self.output_suffix)
+
+        return PreparedFrame(frame, camera, nerf_transforms, renderables, output_path)
+
+    # Prepares and submits the next frame of the range, or sets current_frame to None once all frames are submitted.
+    # Returns False if the next frame could not be prepared.
+    # Must only be called while nothing is rendering, frame_set runs the depsgraph handlers,
+    # and those write transforms and cameras to the NeRFs immediately.
+    def submit_next_frame(self, context: bpy.types.Context) -> bool:
+        if self.next_frame_index >= len(self.frames):
+            self.current_frame = None
+            return True
+        
+        prepared_frame = self.prepare_frame(context, self.frames[self.next_frame_index])
+        self.next_frame_index += 1
+
+        if prepared_frame is None:
+            self.current_frame = None
+            return False
+        
+        self.submit_frame(prepared_frame)
+        return True
+
+    def submit_frame(self, prepared_frame: PreparedFrame):
+        for nerf, transform in prepared_frame.nerf_transforms:
+            nerf.transform = transform
+
+        self.current_frame = prepared_frame
+        self.render_waiter = RenderWaiter()
+        self.render_waiter.notify_requested()
+        self.bridge.request_render(prepared_frame.camera, prepared_frame.renderables)
+
+    def add_render_observers(self):
+        # OnRenderComplete
+        def on_render_complete(args):
+            if self.render_waiter is not None:
+                self.render_waiter.notify_complete()
+        
+        self.render_observers = [
+            self.bridge.add_observer(tn.BlenderBridgeEvent.OnRenderComplete, on_render_complete)
+        ]
+
+    def remove_render_observers(self):
+        for obid in self.render_observers:
+            self.bridge.remove_observer(obid)
+        self.render_observers = []
+
+    def get_frames_per_minute(self) -> float:
+        elapsed = perf_counter() - self.start_time
+        if elapsed <= 0.0:
+            return 0.0
+        return 60.0 * self.n_frames_rendered / elapsed
+
+    def update_status(self, context: bpy.types.Context):
+        n_frames = len(self.frames)
+        context.window_manager.progress_update(self.n_frames_rendered)
+        context.workspace.status_text_set(
+            f"TurboNeRF batch render: {self.n_frames_rendered} / {n_frames} frames, {self.get_frames_per_minute():.1f} frames/min"
+        )
+
+    def execute(self, context):
+        scene = context.scene
+
+        self.frames = list(range(scene.frame_start, scene.frame_end + 1, scene.frame_step))
+
+        if len(self.frames) == 0:
+            self.report({'ERROR'}, "The frame range is empty")
+            return {'CANCELLED'}
+
+        self.original_frame = scene.frame_current
+        self.dims = get_render_dims(scene)
+        self.bridge = NeRFManager.bridge()
+        self.output_suffix = BATCH_OUTPUT_SUFFIXES[scene.tn_render_engine_final_render_settings.batch_output_format]
+        self.writer = BackgroundImageWriter()
+        self.n_frames_rendered = 0
+        self.next_frame_index = 0
+        self.current_frame = None
+        self.render_waiter = None
+        self.add_render_observers()
+
+        self.start_time = perf_counter()
+
+        if not self.submit_next_frame(context):
+            self.cleanup(context)
+            return {'CANCELLED'}
+
+        wm = context.window_manager
+        wm.progress_begin(0, len(self.frames))
+        self._timer = wm.event_timer_add(BATCH_RENDER_TIMER_INTERVAL, window=context.window)
+        wm.modal_handler_add(self)
+
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        if event.type == 'ESC' and event.value == 'PRESS':
+            self.bridge.cancel_render()
+            self.finish(context)
+            self.report({'WARNING'}, f"Batch render cancelled after {self.n_frames_rendered} frames")
+            return {'CANCELLED'}
+
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+        
+        # all frames are rendered, wait for the writer to catch up
+        if self.current_frame is None:
+            if not self.writer.is_idle():
+                return {'PASS_THROUGH'}
+            
+            self.finish(context)
+            self.report({'INFO'}, f"Rendered {self.n_frames_rendered} frames at {self.get_frames_per_minute():.1f} frames/min")
+            return {'FINISHED'}
+
+        if not self.render_waiter.is_complete:
+            if self.bridge.is_rendering():
+                return {'PASS_THROUGH'}
+            
+            # the bridge stopped without completing the frame, give a late completion event one more chance
+            if not self.render_waiter.wait(RENDER_CANCEL_CHECK_INTERVAL):
+                self.finish(context)
+                self.report({'ERROR'}, f"Batch render failed on frame {self.current_frame.frame} after {self.n_frames_rendered} frames")
+                return {'CANCELLED'}
+
+        # the render buffer is reused by the next frame, so it needs to be copied before submitting
+        (w, h) = self.current_frame.camera.resolution
+        rgba = np.array(get_buffer_as_array(self.bridge.get_render_rgba()), dtype=np.float32).reshape(h, w, 4)
+
+        # encoding and writing happen on the writer's threads while the next frame renders
+        self.writer.submit(self.current_frame.output_path, rgba)
+        self.n_frames_rendered += 1
+        
+        # the next frame is only prepared now, advancing the scene earlier would move the NeRFs of the frame that was rendering
+        if not self.submit_next_frame(context):
+            self.finish(context)
+            return {'CANCELLED'}
+        
+        self.update_status(context)
+
+        return {'PASS_THROUGH'}
+
+    def finish(self, context):
+        wm = context.window_manager
+        wm.event_timer_remove(self._timer)
+        wm.progress_end()
+        context.workspace.status_text_set(None)
+
+        self.cleanup(context)
+
+    # Removes the observers and waits for the writer to write the frames that were already rendered
+    def cleanup(self, context):
+        self.remove_render_observers()
+        self.writer.close()
+
+        for path, error in self.writer.errors:
+            log_report("ERROR", f"Failed to write {path}: {error}", self)
+
+        log_report("INFO", f"Batch render: {self.n_frames_rendered} frames, {self.writer.n_written} written, {self.get_frames_per_minute():.1f} frames/min")
+
+        context.scene.frame_set(self.original_frame)
@@ -0,0 +1,181 @@
+import queue
+import struct
+import threading
+import zlib
+from pathlib import Path
+
+import numpy as np
+
+from turbo_nerf.constants.renderer import IMAGE_WRITER_MAX_PENDING, IMAGE_WRITER_N_THREADS
+
+# Encodes and writes rendered frames on a pool of background threads, so the render loop never waits on image encoding.
+# Apart from constants this module only depends on numpy and the standard library, so it is safe to use outside of Blender's main thread.
+# zlib and numpy release the GIL while they work, so the threads encode in parallel.
+
+# Float RGBA buffers from the bridge are bottom-up (Blender's convention), image files are top-down.
+def rgba_to_top_down(rgba: np.ndarray) -> np.ndarray:
+    return np.ascontiguousarray(rgba[::-1])
+
+def _png_chunk(chunk_type: bytes, data: bytes) -> bytes:
+    chunk = chunk_type + data
+    return struct.pack(">I", len(data)) + chunk + struct.pack(">I", zlib.crc32(chunk) & 0xFFFFFFFF)
+
+# sRGB transfer function, for values in [0, 1]
+def linear_to_srgb(x: np.ndarray) -> np.ndarray:
+    return np.where(x <= 0.0031308, 12.92 * x, 1.055 * np.power(x, 1.0 / 2.4) - 0.055)
+
+# Encodes a (h, w, 4) linear float RGBA buffer as an 8-bit sRGB PNG, alpha stays linear
+def encode_png(rgba: np.ndarray, compress_level: int = 6) -> bytes:
+    (h, w, _) = rgba.shape
+    
+    pixels = np.clip(rgba_to_top_down(rgba), 0.0, 1.0)
+    pixels[:, :, :3] = linear_to_srgb(pixels[:, :, :3])
+    pixels = (pixels * 255.0 + 0.5).astype(np.uint8)
+
+    # every scanline starts with a filter type byte, we use 0 (no filter)
+    scanlines = np.zeros((h, 1 + 4 * w), dtype=np.uint8)
+    scanlines[:, 1:] = pixels.reshape(h, 4 * w)
+
+    header = struct.pack(">IIBBBBB", w, h, 8, 6, 0, 0, 0)
+
+    return b"".join([
+        b"\x89PNG\r\n\x1a\n",
+        _png_chunk(b"IHDR", header),
+        _png_chunk(b"IDAT", zlib.compress(scanlines.tobytes(), compress_level)),
+        _png_chunk(b"IEND", b""),
+    ])
+
+def _exr_attribute(name: str, attr_type: str, data: bytes) -> bytes:
+    return name.encode() + b"\0" + attr_type.encode() + b"\0" + struct.pack("<i", len(data)) + data
+
+# Encodes a (h, w, 4) float RGBA buffer as an uncompressed scanline OpenEXR image with half or full float channels
+def encode_exr(rgba: np.ndarray, use_half: bool = True) -> bytes:
+    (h, w, _) = rgba.shape
+
+    (pixel_type, dtype) = (1, "<f2") if use_half else (2, "<f4")
+
+    # channels are stored in alphabetical order
+    channel_names = ["A", "B", "G", "R"]
+    channel_order = [3, 2, 1, 0]
+
+    channels = b"".join(
+        name.encode() + b"\0" + struct.pack("<iB3xii", pixel_type, 0, 1, 1)
+        for name in channel_names
+    ) + b"\0"
+
+    window = struct.pack("<iiii", 0, 0, w - 1, h - 1)
+
+    header = b"".join([
+        struct.pack("<ii", 20000630, 2),
+        _exr_attribute("channels", "chlist", channels),
+        _exr_attribute("compression", "compression", b"\0"),
+        _exr_attribute("dataWindow", "box2i", window),
+        _exr_attribute("displayWindow", "box2i", window),
+        _exr_attribute("lineOrder", "lineOrder", b"\0"),
+        _exr_attribute("pixelAspectRatio", "float", struct.pack("<f", 1.0)),
+        _exr_attribute("screenWindowCenter", "v2f", struct.pack("<ff", 0.0, 0.0)),
+        _exr_attribute("screenWindowWidth", "float", struct.pack("<f", 1.0)),
+        b"\0",
+    ])
+
+    # each scanline is a block of (y, n_bytes) followed by every channel's values for that line
+    lines = rgba_to_top_down(rgba)[:, :, channel_order].transpose(0, 2, 1).astype(dtype)
+    lines = np.ascontiguousarray(lines).view(np.uint8).reshape(h, -1)
+    line_size = lines.shape[1]
+
+    block_headers = np.empty((h, 2), dtype="<i4")
+    block_headers[:, 0] = np.arange(h)
+    block_headers[:, 1] = line_size
+
+    blocks = np.concatenate([block_headers.view(np.uint8).reshape(h, 8), lines], axis=1)
+
+    block_size = 8 + line_size
+    offsets = len(header) + 8 * h + np.arange(h, dtype="<u8") * block_size
+
+    return header + offsets.astype("<u8").tobytes() + blocks.tobytes()
+
+ENCODERS = {
+    ".exr": encode_exr,
+    ".png": encode_png,
+}
+
+def write_image(path: Path, rgba: np.ndarray):
+    path = Path(path)
+    encoder = ENCODERS[path.suffix.lower()]
+    data = encoder(rgba)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    # write to a temporary file first so a partially written image never looks finished
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    tmp_path.replace(path)
+
+class BackgroundImageWriter:
+    def __init__(self, n_threads: int = IMAGE_WRITER_N_THREADS, max_pending: int = IMAGE_WRITER_MAX_PENDING):
+        # the queue is bounded, so submit() blocks instead of letting unwritten frames pile up in memory
+        self._queue = queue.Queue(maxsize=max(1, max_pending))
+        self._lock = threading.Lock()
+        self._threads = [
+            threading.Thread(target=self._run, name=f"TurboNeRF Image Writer {i}", daemon=True)
+            for i in range(max(1, n_threads))
+        ]
+        
+        self.n_written = 0
+        self.errors: list[tuple[Path, Exception]] = []
+
+        for thread in self._threads:
+            thread.start()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            
+            if item is None:
+                self._queue.task_done()
+                break
+
+            (path, rgba, on_written) = item
+            try:
+                write_image(path, rgba)
+                with self._lock:
+                    self.n_written += 1
+                
+                if on_written is not None:
+                    on_written(path)
+            except Exception as e:
+                with self._lock:
+                    self.errors.append((path, e))
+            finally:
+                self._queue.task_done()
+
+    # rgba must be a (h, w, 4) float array that the caller no longer modifies.
+    # on_written(path) is called on a writer thread once the image is completely on disk.
+    # Blocks while the queue is full.
+    def submit(self, path: Path, rgba: np.ndarray, on_written = None):
+        self._queue.put((Path(path), rgba, on_written))
+
+    # Returns False instead of blocking when the queue is full
+    def try_submit(self, path: Path, rgba: np.ndarray, on_written = None) -> bool:
+        try:
+            self._queue.put_nowait((Path(path), rgba, on_written))
+            return True
+        except queue.Full:
+            return False
+
+    def is_full(self) -> bool:
+        return self._queue.full()
+
+    def n_pending(self) -> int:
+        return self._queue.unfinished_tasks
+
+    def is_idle(self) -> bool:
+        return self.n_pending() == 0
+
+    # waits for all pending images to be written, then stops the writer threads
+    def close(self):
+        for _ in self._threads:
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join()
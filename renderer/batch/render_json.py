@@ -0,0 +1,77 @@
+import json
+from pathlib import Path
+
+import numpy as np
+
+from turbo_nerf.utility.pylib import PyTurboNeRF as tn
+from turbo_nerf.utility.render_camera_utils import camera_with_flipped_y
+
+# Reading of the render JSON files written by ExportRenderCamJSON:
+# { "w": int, "h": int, "frames": [{ "camera": { "transform", "near", "far", "focal_length", "fl_x"?, "fl_y"? }, "file_path"? }] }
+
+class RenderJSON:
+    def __init__(self, dims: tuple[int, int], frames: list[dict]):
+        self.dims = dims
+        self.frames = frames
+
+    @classmethod
+    def load(cls, path: Path) -> "RenderJSON":
+        with open(path, 'r') as json_file:
+            data = json.load(json_file)
+        
+        dims = (int(data["w"]), int(data["h"]))
+        frames = data["frames"]
+
+        for i, frame in enumerate(frames):
+            camera = frame.get("camera", {})
+            missing = [k for k in ("transform", "near", "far", "focal_length") if k not in camera]
+            if len(missing) > 0:
+                raise ValueError(f"Frame {i} of {path} has no camera {', '.join(missing)}, only ExportRenderCamJSON files are supported")
+        
+        return cls(dims, frames)
+
+    def __len__(self) -> int:
+        return len(self.frames)
+
+    # Output file name of a frame, relative to the output directory
+    def get_frame_file_name(self, index: int, suffix: str = ".png") -> str:
+        file_path = self.frames[index].get("file_path")
+        if file_path is None:
+            return f"{index:05d}{suffix}"
+        return str(Path(file_path).with_suffix(suffix))
+
+    # Returns the camera of a frame, flipped so the render buffer is bottom-up like Blender's render results
+    def get_frame_camera(self, index: int) -> tn.Camera:
+        cam_json = self.frames[index]["camera"]
+        (w, h) = self.dims
+        # older files only have focal_length
+        fl_x = cam_json.get("fl_x", cam_json["focal_length"])
+        fl_y = cam_json.get("fl_y", fl_x)
+
+        camera = tn.Camera(
+            resolution=self.dims,
+            near=cam_json["near"],
+            far=cam_json["far"],
+            focal_length=(fl_x, fl_y),
+            shift=(0, 0),
+            principal_point=(0.5 * w, 0.5 * h),
+            transform=tn.Transform4f(np.array(cam_json["transform"]))
+        )
+
+        return camera_with_flipped_y(camera)
+
+# Parses frame selections like "0-99,120,130-139" into a sorted list of frame indices
+def parse_frame_indices(selection: str, n_frames: int) -> list[int]:
+    indices = set()
+    for part in selection.split(","):
+        part = part.strip()
+        if part == "":
+            continue
+
+        if "-" in part:
+            start, end = part.split("-", 1)
+            indices.update(range(int(start), int(end) + 1))
+        else:
+            indices.add(int(part))
+    
+    return sorted(i for i in indices if 0 <= i < n_frames)
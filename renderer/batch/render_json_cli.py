@@ -0,0 +1,166 @@
+import argparse
+import sys
+import threading
+from pathlib import Path
+from time import perf_counter
+
+import numpy as np
+
+from turbo_nerf.constants.renderer import IMAGE_WRITER_MAX_PENDING, IMAGE_WRITER_N_THREADS, RENDER_CANCEL_CHECK_INTERVAL
+from turbo_nerf.renderer.batch.image_writer import BackgroundImageWriter
+from turbo_nerf.renderer.batch.render_json import RenderJSON, parse_frame_indices
+from turbo_nerf.renderer.batch.shard_coordinator import FRAME_DONE_PREFIX
+from turbo_nerf.renderer.render_result_utils import get_buffer_as_array
+from turbo_nerf.renderer.render_waiter import RenderWaiter
+from turbo_nerf.utility.nerf_manager import NeRFManager
+from turbo_nerf.utility.pylib import PyTurboNeRF as tn
+
+# Headless renderer for render JSON files, for render farm nodes.
+# Run with the TurboNeRF addon installed:
+#
+#   blender -b --python <addon dir>/renderer/batch/render_json_cli.py -- \
+#       --snapshot shot.turbo --render-json render.json --output-dir frames/
+#
+# Frames whose output image already exists are skipped, so rerunning the same command resumes a partial sequence.
+# Skipped frames are still reported as done, with a render time of 0.
+# Every finished frame prints a line "TURBO_NERF_FRAME_DONE <index> <render seconds> <path>" to stdout once its image is on disk.
+
+def get_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="render_json_cli",
+        description="Render the frames of a TurboNeRF render JSON file without the Blender UI",
+    )
+    parser.add_argument("--snapshot", type=Path, required=True, help="TurboNeRF .turbo snapshot to render")
+    parser.add_argument("--render-json", type=Path, required=True, help="Render JSON written by Export TurboNeRF Render JSON")
+    parser.add_argument("--output-dir", type=Path, required=True, help="Directory the rendered frames are written to")
+    parser.add_argument("--frames", type=str, default=None, help="Frame indices to render, for example 0-99,120. Defaults to all frames")
+    parser.add_argument("--overwrite", action="store_true", help="Render frames whose output image already exists")
+    parser.add_argument("--format", choices=["png", "exr"], default="png", help="Output image format, exr keeps the full float range as half floats")
+    parser.add_argument("--writer-threads", type=int, default=IMAGE_WRITER_N_THREADS, help="Number of threads that encode and write images")
+    parser.add_argument("--max-pending-writes", type=int, default=IMAGE_WRITER_MAX_PENDING, help="Maximum number of frames waiting to be written")
+    return parser
+
+# Blender passes the script's own arguments after "--"
+def get_script_args() -> list[str]:
+    if "--" in sys.argv:
+        return sys.argv[sys.argv.index("--") + 1:]
+    return []
+
+class RenderJSONRunner:
+    def __init__(self, args: argparse.Namespace):
+        self.args = args
+        self.bridge = NeRFManager.bridge()
+        self.render_json = RenderJSON.load(args.render_json)
+        self.writer = BackgroundImageWriter(n_threads=args.writer_threads, max_pending=args.max_pending_writes)
+        self.render_waiter: RenderWaiter = None
+        self.frame_times: list[float] = []
+        self.print_lock = threading.Lock()
+
+    def get_output_path(self, index: int) -> Path:
+        return self.args.output_dir / self.render_json.get_frame_file_name(index, f".{self.args.format}")
+
+    def get_selected_frames(self) -> list[int]:
+        n_frames = len(self.render_json)
+        if self.args.frames is None:
+            return list(range(n_frames))
+        return parse_frame_indices(self.args.frames, n_frames)
+    
+    def get_frames_to_render(self, selected_frames: list[int]) -> list[int]:
+        if self.args.overwrite:
+            return selected_frames
+        return [i for i in selected_frames if not self.get_output_path(i).exists()]
+
+    def submit_frame(self, index: int, renderables: list[tn.Renderable]):
+        camera = self.render_json.get_frame_camera(index)
+        self.render_waiter = RenderWaiter()
+        self.render_waiter.notify_requested()
+        self.bridge.request_render(camera, renderables)
+
+    # called by the writer once the frame's image is on disk, or for frames that were skipped because their image already exists
+    def print_frame_done(self, index: int, render_time: float, output_path: Path):
+        with self.print_lock:
+            print(f"{FRAME_DONE_PREFIX} {index} {render_time:.4f} {output_path}", flush=True)
+
+    def wait_for_frame(self) -> bool:
+        while not self.render_waiter.wait(RENDER_CANCEL_CHECK_INTERVAL):
+            # guard against a completion event that never arrives
+            if not self.bridge.is_rendering():
+                return self.render_waiter.wait(RENDER_CANCEL_CHECK_INTERVAL)
+        
+        return True
+    
+    def run(self) -> int:
+        selected_frames = self.get_selected_frames()
+        frames = self.get_frames_to_render(selected_frames)
+        n_skipped = len(selected_frames) - len(frames)
+
+        print(f"TurboNeRF: rendering {len(frames)} frames of {self.args.render_json} ({n_skipped} already done)")
+
+        # a frame can be on disk without the shard coordinator knowing, for example if a worker died right after writing it
+        frames_to_render = set(frames)
+        for index in selected_frames:
+            if index not in frames_to_render:
+                self.print_frame_done(index, 0.0, self.get_output_path(index))
+
+        if len(frames) == 0:
+            return 0
+
+        nerf = NeRFManager.load_nerf(self.args.snapshot)
+        renderables = [tn.Renderable(nerf, [])]
+        (w, h) = self.render_json.dims
+
+        def on_render_complete(args):
+            if self.render_waiter is not None:
+                self.render_waiter.notify_complete()
+        
+        obid = self.bridge.add_observer(tn.BlenderBridgeEvent.OnRenderComplete, on_render_complete)
+
+        start_time = perf_counter()
+        n_failed = 0
+
+        try:
+            for index in frames:
+                self.submit_frame(index, renderables)
+
+                if not self.wait_for_frame():
+                    print(f"TurboNeRF: frame {index} did not complete", file=sys.stderr)
+                    n_failed += 1
+                    continue
+                
+                # the render buffer is reused by the next frame, so it needs to be copied
+                rgba = np.array(get_buffer_as_array(self.bridge.get_render_rgba()), dtype=np.float32).reshape(h, w, 4)
+                
+                render_time = self.render_waiter.completed_at - self.render_waiter.requested_at
+                self.frame_times.append(render_time)
+
+                # blocks while the writer queue is full, so a slow disk cannot make the queued frames use up all memory
+                output_path = self.get_output_path(index)
+                self.writer.submit(
+                    output_path,
+                    rgba,
+                    on_written=lambda path, index=index, render_time=render_time: self.print_frame_done(index, render_time, path),
+                )
+        finally:
+            self.bridge.remove_observer(obid)
+            self.writer.close()
+        
+        for path, error in self.writer.errors:
+            print(f"TurboNeRF: failed to write {path}: {error}", file=sys.stderr)
+            n_failed += 1
+
+        elapsed = perf_counter() - start_time
+        if len(self.frame_times) > 0:
+            times = np.array(self.frame_times)
+            print(
+                f"TurboNeRF: {len(times)} frames in {elapsed:.1f} s ({60.0 * len(times) / elapsed:.1f} frames/min), "
+                f"render time mean {times.mean():.3f} s, min {times.min():.3f} s, max {times.max():.3f} s"
+            )
+        
+        return 1 if n_failed > 0 else 0
+
+def main(argv: list[str]) -> int:
+    args = get_arg_parser().parse_args(argv)
+    return RenderJSONRunner(args).run()
+
+if __name__ == "__main__":
+    sys.exit(main(get_script_args()))
@@ -0,0 +1,301 @@
+import argparse
+import json
+import os
+import queue
+import subprocess
+import sys
+import threading
+from pathlib import Path
+from time import perf_counter
+
+# Splits the frames of a render JSON into shards and renders them with several worker processes.
+# Each worker is a separate process with its own bridge, for example render_json_cli.py running in its own Blender.
+# Finished frames are recorded in a manifest file, so the coordinator can be restarted and frames of crashed workers are handed out again.
+#
+# This module only uses the standard library, so it runs with a plain python interpreter:
+#
+#   python shard_coordinator.py --render-json render.json --output-dir frames/ --workers 2 --gpus 0,1 -- \
+#       blender -b --python render_json_cli.py -- --snapshot shot.turbo --render-json render.json --output-dir frames/
+#
+# The worker command gets "--frames <indices>" appended and must print "FRAME_DONE_PREFIX <index> <seconds> <path>" lines
+# once a frame's image is completely written, also for frames it skips because their image already exists.
+# Frames are rendered in the order they are given. Only a worker that exits with an error uses up an attempt of the frame it stopped at.
+# A frame only counts as done if its reported output file exists.
+# stub_render_worker.py follows the same protocol without rendering anything, for trying out the coordinator on any machine.
+
+FRAME_DONE_PREFIX = "TURBO_NERF_FRAME_DONE"
+
+MANIFEST_FILE_NAME = "turbo_nerf_manifest.json"
+
+FRAME_STATUS_DONE = "done"
+FRAME_STATUS_FAILED = "failed"
+
+# Records the status of every frame of a sequence, written atomically after every change
+class ShardManifest:
+    def __init__(self, path: Path, n_frames: int):
+        self.path = Path(path)
+        self.n_frames = n_frames
+        self.frames: dict[int, str] = {}
+        self.attempts: dict[int, int] = {}
+        self.n_unreported: dict[int, int] = {}
+
+    @classmethod
+    def load_or_create(cls, path: Path, n_frames: int) -> "ShardManifest":
+        manifest = cls(path, n_frames)
+        
+        if manifest.path.exists():
+            with open(manifest.path, 'r') as f:
+                data = json.load(f)
+            
+            if data.get("n_frames") == n_frames:
+                manifest.frames = {int(i): status for i, status in data["frames"].items()}
+            
+            # failed frames get another chance when the coordinator is restarted
+            manifest.frames = {i: s for i, s in manifest.frames.items() if s == FRAME_STATUS_DONE}
+        
+        return manifest
+
+    def save(self):
+        data = {
+            "n_frames": self.n_frames,
+            "frames": {str(i): status for i, status in sorted(self.frames.items())},
+        }
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f".{self.path.name}.tmp")
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, self.path)
+    
+    def is_done(self, index: int) -> bool:
+        return self.frames.get(index) == FRAME_STATUS_DONE
+
+    def mark(self, index: int, status: str):
+        self.frames[index] = status
+        self.save()
+
+    def get_pending(self) -> list[int]:
+        return [i for i in range(self.n_frames) if i not in self.frames]
+
+# Splits frame indices into shards of at most shard_size frames
+def split_into_shards(indices: list[int], shard_size: int) -> list[list[int]]:
+    return [indices[i:i + shard_size] for i in range(0, len(indices), shard_size)]
+
+class ShardWorker:
+    def __init__(self, worker_id: int, gpu: str | None):
+        self.worker_id = worker_id
+        self.gpu = gpu
+        self.process: subprocess.Popen = None
+        self.shard: list[int] = []
+        self.done: set[int] = set()
+
+    def is_busy(self) -> bool:
+        return self.process is not None
+
+class ShardCoordinator:
+    def __init__(
+        self,
+        worker_command: list[str],
+        manifest: ShardManifest,
+        n_workers: int,
+        gpus: list[str] = None,
+        shard_size: int = 8,
+        max_attempts: int = 3,
+        log = print,
+    ):
+        self.worker_command = worker_command
+        self.manifest = manifest
+        self.shard_size = shard_size
+        self.max_attempts = max_attempts
+        self.log = log
+
+        gpus = gpus or []
+        self.workers = [
+            ShardWorker(i, gpus[i % len(gpus)] if len(gpus) > 0 else None)
+            for i in range(n_workers)
+        ]
+
+        self.pending_shards: list[list[int]] = []
+        self.events = queue.Queue()
+
+    def start_worker(self, worker: ShardWorker, shard: list[int]):
+        env = os.environ.copy()
+        if worker.gpu is not None:
+            env["CUDA_VISIBLE_DEVICES"] = worker.gpu
+        
+        command = self.worker_command + ["--frames", ",".join(str(i) for i in shard)]
+
+        worker.shard = shard
+        worker.done = set()
+        worker.process = subprocess.Popen(
+            command,
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=None,
+            text=True,
+            bufsize=1,
+        )
+
+        # worker output is read on a thread per worker, the main loop only consumes events
+        process = worker.process
+        def read_output():
+            for line in process.stdout:
+                parts = line.rstrip("\n").split(" ", 3)
+                if len(parts) == 4 and parts[0] == FRAME_DONE_PREFIX:
+                    self.events.put(("done", worker, process, (int(parts[1]), Path(parts[3]))))
+            
+            process.stdout.close()
+            self.events.put(("exit", worker, process, process.wait()))
+        
+        threading.Thread(target=read_output, name=f"TurboNeRF Shard Worker {worker.worker_id}", daemon=True).start()
+
+        self.log(f"worker {worker.worker_id}: frames {shard[0]}-{shard[-1]} ({len(shard)} frames)" + (f" on GPU {worker.gpu}" if worker.gpu is not None else ""))
+
+    def assign_shards(self):
+        for worker in self.workers:
+            if len(self.pending_shards) == 0:
+                return
+            
+            if not worker.is_busy():
+                self.start_worker(worker, self.pending_shards.pop(0))
+
+    def on_frame_done(self, worker: ShardWorker, index: int, output_path: Path) -> bool:
+        if index not in worker.shard:
+            return False
+        
+        # a frame without an image is left unfinished, so it gets rendered again
+        if not output_path.exists():
+            self.log(f"frame {index}: reported done, but {output_path} does not exist")
+            return False
+        
+        worker.done.add(index)
+        self.manifest.mark(index, FRAME_STATUS_DONE)
+        return True
+
+    def on_worker_exit(self, worker: ShardWorker, return_code: int):
+        unfinished = [i for i in worker.shard if i not in worker.done and not self.manifest.is_done(i)]
+        worker.process = None
+        worker.shard = []
+
+        if len(unfinished) == 0:
+            return
+        
+        self.log(f"worker {worker.worker_id}: exited with code {return_code}, {len(unfinished)} frames unfinished")
+
+        # a worker that exits cleanly did not crash on any frame, its unreported frames are handed out again without using up an attempt.
+        # they are only given up on if clean exits keep leaving them unreported, so a broken worker cannot keep the coordinator busy forever.
+        if return_code == 0:
+            retry = []
+            for index in unfinished:
+                self.manifest.n_unreported[index] = self.manifest.n_unreported.get(index, 0) + 1
+                if self.manifest.n_unreported[index] >= self.max_attempts:
+                    self.log(f"frame {index}: not reported by {self.max_attempts} workers that exited cleanly, giving up")
+                    self.manifest.mark(index, FRAME_STATUS_FAILED)
+                else:
+                    retry.append(index)
+            
+            self.log(f"worker {worker.worker_id}: requeueing {len(retry)} unreported frames")
+            self.pending_shards = split_into_shards(retry, self.shard_size) + self.pending_shards
+            return
+
+        # workers render their shard in order, so the first unfinished frame is the one the worker died on.
+        # only that frame uses up an attempt, the frames queued behind it were never tried.
+        crashed_index = unfinished[0]
+        self.manifest.attempts[crashed_index] = self.manifest.attempts.get(crashed_index, 0) + 1
+
+        retry = unfinished
+        if self.manifest.attempts[crashed_index] >= self.max_attempts:
+            self.log(f"frame {crashed_index}: failed {self.max_attempts} times, giving up")
+            self.manifest.mark(crashed_index, FRAME_STATUS_FAILED)
+            retry = unfinished[1:]
+        
+        # the rest goes to the front of the queue
+        self.pending_shards = split_into_shards(retry, self.shard_size) + self.pending_shards
+
+    # Renders all pending frames.  Returns the number of failed frames.
+    def run(self) -> int:
+        pending = self.manifest.get_pending()
+        n_total = self.manifest.n_frames
+
+        self.log(f"{n_total - len(pending)} of {n_total} frames already done, {len(pending)} to render with {len(self.workers)} workers")
+
+        # hand out smaller shards than frames / workers, so a slow or crashed worker holds up fewer frames
+        self.pending_shards = split_into_shards(pending, self.shard_size)
+
+        start_time = perf_counter()
+        n_done = 0
+
+        self.assign_shards()
+
+        try:
+            while any(w.is_busy() for w in self.workers):
+                (event, worker, process, value) = self.events.get()
+
+                # ignore stale events from a process that was already replaced
+                if process is not worker.process:
+                    continue
+                
+                if event == "done":
+                    if self.on_frame_done(worker, *value):
+                        n_done += 1
+                elif event == "exit":
+                    self.on_worker_exit(worker, value)
+                    self.assign_shards()
+        finally:
+            for worker in self.workers:
+                if worker.is_busy():
+                    worker.process.kill()
+
+        elapsed = perf_counter() - start_time
+        n_failed = sum(1 for s in self.manifest.frames.values() if s == FRAME_STATUS_FAILED)
+        
+        fpm = 60.0 * n_done / elapsed if elapsed > 0.0 else 0.0
+        self.log(f"{n_done} frames in {elapsed:.1f} s ({fpm:.1f} frames/min), {n_failed} failed")
+
+        return n_failed
+
+def get_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="shard_coordinator",
+        description="Render the frames of a TurboNeRF render JSON with several worker processes",
+    )
+    parser.add_argument("--render-json", type=Path, required=True, help="Render JSON whose frames are rendered")
+    parser.add_argument("--output-dir", type=Path, required=True, help="Directory the manifest is kept in, usually the workers' output directory")
+    parser.add_argument("--workers", type=int, default=1, help="Number of worker processes")
+    parser.add_argument("--gpus", type=str, default=None, help="Comma separated CUDA device ids, assigned to workers round robin")
+    parser.add_argument("--shard-size", type=int, default=8, help="Number of frames handed to a worker at once")
+    parser.add_argument("--max-attempts", type=int, default=3, help="Number of times a frame is tried before it counts as failed")
+    parser.add_argument("worker_command", nargs=argparse.REMAINDER, help="Worker command, after --")
+    return parser
+
+def main(argv: list[str]) -> int:
+    args = get_arg_parser().parse_args(argv)
+
+    worker_command = args.worker_command
+    if len(worker_command) > 0 and worker_command[0] == "--":
+        worker_command = worker_command[1:]
+    
+    if len(worker_command) == 0:
+        print("shard_coordinator: a worker command is required after --", file=sys.stderr)
+        return 2
+    
+    with open(args.render_json, 'r') as f:
+        n_frames = len(json.load(f)["frames"])
+    
+    manifest = ShardManifest.load_or_create(args.output_dir / MANIFEST_FILE_NAME, n_frames)
+    gpus = args.gpus.split(",") if args.gpus else None
+
+    coordinator = ShardCoordinator(
+        worker_command=worker_command,
+        manifest=manifest,
+        n_workers=max(1, args.workers),
+        gpus=gpus,
+        shard_size=max(1, args.shard_size),
+        max_attempts=max(1, args.max_attempts),
+        log=lambda msg: print(f"shard_coordinator: {msg}", flush=True),
+    )
+
+    return 1 if coordinator.run() > 0 else 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
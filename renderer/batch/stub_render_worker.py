@@ -0,0 +1,50 @@
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Stand-in for render_json_cli.py that speaks the same protocol without Blender or a GPU.
+# It "renders" a frame by sleeping and writing an empty file, and can crash on purpose to exercise the shard coordinator.
+# Like render_json_cli.py, frames whose file already exists are reported as done without rendering them:
+#
+#   python shard_coordinator.py --render-json render.json --output-dir out/ --workers 4 -- \
+#       python stub_render_worker.py --output-dir out/ --crash-probability 0.05
+
+# keep in sync with shard_coordinator.FRAME_DONE_PREFIX, this script must not depend on the addon being importable
+FRAME_DONE_PREFIX = "TURBO_NERF_FRAME_DONE"
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(prog="stub_render_worker")
+    parser.add_argument("--output-dir", type=Path, required=True)
+    parser.add_argument("--frames", type=str, required=True)
+    parser.add_argument("--frame-time", type=float, default=0.05, help="Seconds spent on each frame")
+    parser.add_argument("--crash-probability", type=float, default=0.0, help="Chance of exiting with an error before each frame")
+    parser.add_argument("--crash-frames", type=str, default="", help="Frame indices that always crash the worker, for example 3,7")
+    args, _ = parser.parse_known_args(argv)
+
+    args.output_dir.mkdir(parents=True, exist_ok=True)
+
+    crash_frames = {int(i) for i in args.crash_frames.split(",") if i != ""}
+
+    for index in [int(i) for i in args.frames.split(",") if i != ""]:
+        output_path = args.output_dir / f"{index:05d}.png"
+        if output_path.exists():
+            print(f"{FRAME_DONE_PREFIX} {index} 0.0000 {output_path}", flush=True)
+            continue
+        
+        if index in crash_frames or random.random() < args.crash_probability:
+            print(f"stub_render_worker: crashing before frame {index}", file=sys.stderr)
+            return 1
+        
+        start = time.perf_counter()
+        time.sleep(args.frame_time)
+
+        output_path.touch()
+
+        print(f"{FRAME_DONE_PREFIX} {index} {time.perf_counter() - start:.4f} {output_path}", flush=True)
+    
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,56 @@
+import numpy as np
+
+from turbo_nerf.utility.pylib import PyTurboNeRF as tn
+
+# Per-field tolerances used to decide whether two viewport cameras are different enough to request a new preview
+class CameraTolerance:
+    def __init__(
+        self,
+        transform: float = 0.0,
+        focal_length: float = 0.0,
+        near_far: float = 0.0,
+        shift: float = 0.0,
+    ):
+        self.transform = transform
+        self.focal_length = focal_length
+        self.near_far = near_far
+        self.shift = shift
+
+    @classmethod
+    def from_preview_props(cls, preview_props) -> "CameraTolerance":
+        if not preview_props.use_camera_tolerance:
+            return cls()
+        
+        return cls(
+            transform=preview_props.camera_transform_tolerance,
+            focal_length=preview_props.camera_focal_length_tolerance,
+            near_far=preview_props.camera_near_far_tolerance,
+            shift=preview_props.camera_shift_tolerance,
+        )
+
+# Snapshot of the fields of a tn.Camera that affect a preview, so cameras can be compared with tolerances
+class CameraFingerprint:
+    def __init__(self, cam: tn.Camera):
+        self.resolution = tuple(cam.resolution)
+        self.principal_point = tuple(cam.principal_point)
+        self.transform = np.array(cam.transform, dtype=np.float64)
+        self.focal_length = np.array(cam.focal_length, dtype=np.float64)
+        self.near_far = np.array([cam.near, cam.far], dtype=np.float64)
+        self.shift = np.array(cam.shift, dtype=np.float64)
+
+    def is_close_to(self, other: "CameraFingerprint", tolerance: CameraTolerance) -> bool:
+        if other is None:
+            return False
+        
+        if self.resolution != other.resolution or self.principal_point != other.principal_point:
+            return False
+
+        def is_within(a: np.ndarray, b: np.ndarray, eps: float) -> bool:
+            return np.max(np.abs(a - b)) <= eps
+        
+        return (
+            is_within(self.transform, other.transform, tolerance.transform)
+            and is_within(self.focal_length, other.focal_length, tolerance.focal_length)
+            and is_within(self.near_far, other.near_far, tolerance.near_far)
+            and is_within(self.shift, other.shift, tolerance.shift)
+        )
@@ -1,21 +1,55 @@
-import ctypes
-from time import sleep, time
+from pathlib import Path
+from time import time
 import weakref
 import bpy
 import bgl
 import numpy as np
-from turbo_nerf.blender_utility.obj_type_utility import get_closest_parent_of_type, get_nerf_obj_type, is_nerf_obj_type
+from turbo_nerf.blender_utility.logging_utility import log_report
+from turbo_nerf.blender_utility.obj_type_utility import get_nerf_obj_type
 from turbo_nerf.constants import NERF_ITEM_IDENTIFIER_ID, OBJ_TYPE_NERF
-from turbo_nerf.constants.math import NERF_ADJUSTMENT_MATRIX
-from turbo_nerf.effects.utils.serialization import get_spatial_effects_for_nerf_obj
+from turbo_nerf.constants.renderer import (
+    PREVIEW_IN_FLIGHT_TIMEOUT,
+    PREVIEW_MOTION_SETTLE_TIME,
+    PROGRESSIVE_RENDER_START_SCALE,
+    RENDER_CANCEL_CHECK_INTERVAL,
+    RENDER_PASS_DEPTH,
+    RENDER_PASS_OPACITY,
+)
+from turbo_nerf.renderer.panels.render_engine_final_render_panel import TurboNeRFRenderEngineFinalRenderPanel
 from turbo_nerf.renderer.panels.render_engine_raymarching_panel import TurboNeRFRenderEngineRaymarchingPanel
-
-from turbo_nerf.utility.render_camera_utils import bl2nerf_cam, bl2nerf_cam_train, camera_with_flipped_y
+from turbo_nerf.renderer.camera_fingerprint import CameraFingerprint, CameraTolerance
+from turbo_nerf.renderer.phase_profiler import phase_profiler
+from turbo_nerf.renderer.preview_resolution_governor import PreviewResolutionGovernor
+from turbo_nerf.renderer.render_result_utils import (
+    RenderBufferDirtyRows,
+    copy_channel_rows_into_render_pass,
+    copy_rows_into_render_pass,
+    get_buffer_as_array,
+    upsample_nearest,
+)
+from turbo_nerf.renderer.render_result_cache import RenderResultCache, get_render_cache_key
+from turbo_nerf.renderer.renderable_cache import RenderableCache
+from turbo_nerf.renderer.renderables import get_nerf_objs, get_nerf_transform, get_renderable, get_renderables
+from turbo_nerf.renderer.training_preview_scheduler import TrainingPreviewScheduler
+from turbo_nerf.renderer.render_waiter import RenderWaiter, render_latency_counter
+
+from turbo_nerf.utility.render_camera_utils import (
+    bl2nerf_cam,
+    camera_with_flipped_y,
+    camera_with_region,
+    camera_with_resolution,
+    bl2nerf_cam_view,
+    get_border_region,
+    get_multiview_names,
+    get_render_cam_error,
+    get_render_tiles,
+    get_scaled_dims,
+    get_scaled_region,
+    get_view_render_border,
+)
 from turbo_nerf.utility.nerf_manager import NeRFManager
 from turbo_nerf.utility.pylib import PyTurboNeRF as tn
 
-import threading
-
 class TurboNeRFRenderEngine(bpy.types.RenderEngine):
     # These three members are used by blender to set up the
     # RenderEngine; define its internal name, visible name and capabilities.
@@ -33,14 +67,29 @@ class TurboNeRFRenderEngine(bpy.types.RenderEngine):
         self.is_rendering = False
         self.current_region3d: bpy.types.RegionView3D = None
         self.latest_camera = None
+        self.latest_view_fingerprint: CameraFingerprint = None
         self.prev_view_dims = (0, 0)
+        self.prev_view_border = None
+        self.preview_border = None
+        self.preview_dims = (0, 0)
 
-        self.last_preview_time = 0
+        self.preview_scheduler = TrainingPreviewScheduler()
         self.bridge = NeRFManager.bridge()
         self.event_observers = []
         self.add_event_observers()
 
         self.is_first_view_update = True
+        self.renderable_cache = RenderableCache()
+        self.resolution_governor = PreviewResolutionGovernor()
+        self.is_refine_scheduled = False
+
+        # read on the bridge's callback threads, so it is set on the main thread before each final render
+        self.use_depth_pass = False
+
+        # at most one preview request is in flight, newer cameras wait for it to complete
+        self.preview_request_time = None
+        self.has_pending_preview = False
+        self.is_pending_redraw_scheduled = False
 
     # When the render engine instance is destroyed, this is called. Clean up any
     # render engine data here, for example stopping running render threads.
@@ -62,13 +111,18 @@ class TurboNeRFRenderEngine(bpy.types.RenderEngine):
             if wself is None:
                 return
 
-            preview_props = bpy.context.scene.nerf_preview_panel_props
-            # get current time in seconds
-            current_time = time()
+            # cheap early out between budgeted preview slots
+            if not wself.preview_scheduler.on_training_step():
+                return
 
-            time_since_last_update = current_time - wself.last_preview_time
+            preview_props = bpy.context.scene.nerf_preview_panel_props
+            should_preview = wself.preview_scheduler.take_slot(
+                is_enabled=preview_props.update_preview,
+                budget_fraction=preview_props.preview_time_budget,
+                min_interval=preview_props.time_between_preview_updates,
+            )
 
-            if preview_props.update_preview and time_since_last_update >= preview_props.time_between_preview_updates:
+            if should_preview:
                 wself.rerequest_preview(flags=tn.RenderFlags.Preview)
         
         obid = self.bridge.add_observer(BBE.OnTrainingStep, on_training_step)
@@ -89,6 +143,7 @@ class TurboNeRFRenderEngine(bpy.types.RenderEngine):
             wself = weak_self()
             if wself is None:
                 return
+            wself.resolution_governor.on_preview_progress()
             wself.bridge.enqueue_redraw()
 
         obid = self.bridge.add_observer(BBE.OnPreviewProgress, on_preview_progress)
@@ -99,6 +154,10 @@ class TurboNeRFRenderEngine(bpy.types.RenderEngine):
             wself = weak_self()
             if wself is None:
                 return
+            wself.resolution_governor.on_preview_complete()
+            wself.preview_scheduler.on_preview_complete()
+            # the preview is no longer in flight, the redraw requests a deferred camera if there is one
+            wself.preview_request_time = None
             wself.bridge.enqueue_redraw()
         
         obid = self.bridge.add_observer(BBE.OnPreviewComplete, on_preview_complete)
@@ -129,6 +188,7 @@ class TurboNeRFRenderEngine(bpy.types.RenderEngine):
             wself = weak_self()
             if wself is None:
                 return
+            wself.renderable_cache.invalidate_all()
             wself.rerequest_preview(flags=tn.RenderFlags.Final)
         
         obid = self.bridge.add_observer(BBE.OnDestroyNeRF, on_destroy_nerf)
@@ -142,13 +202,10 @@ class TurboNeRFRenderEngine(bpy.types.RenderEngine):
             self.event_observers = []
     
     def get_renderable(self, nerf_obj: bpy.types.Object) -> tn.Renderable:
-        nerf = NeRFManager.get_nerf_for_obj(nerf_obj)
-        spatial_effects = get_spatial_effects_for_nerf_obj(nerf_obj)
-        return tn.Renderable(nerf, spatial_effects)        
+        return get_renderable(nerf_obj)
         
     def get_renderables(self, context: bpy.types.Context):
-        renderables = [self.get_renderable(obj) for obj in context.scene.objects if is_nerf_obj_type(obj, OBJ_TYPE_NERF)]
-        return renderables
+        return get_renderables(context.scene)
 
     def update_renderables(self, depsgraph: bpy.types.Depsgraph, force_update=False):
         objects: list[bpy.types.Object]
@@ -169,9 +226,7 @@ class TurboNeRFRenderEngine(bpy.types.RenderEngine):
             if nerf_obj_type == OBJ_TYPE_NERF:
                 nerf_id = obj[NERF_ITEM_IDENTIFIER_ID]
                 nerf = NeRFManager.get_nerf_by_id(nerf_id)
-                # why do we need to multiply by NERF_ADJUSTMENT_MATRIX? idk, but it works.
-                mat = np.array(obj.matrix_world @ NERF_ADJUSTMENT_MATRIX)
-                nerf.transform = tn.Transform4f(mat).from_nerf()
+                nerf.transform = get_nerf_transform(obj)
 
     def get_render_modifiers(self, context: bpy.types.Context):
         preview_props = context.scene.nerf_preview_panel_props
@@ -186,14 +241,70 @@ class TurboNeRFRenderEngine(bpy.types.RenderEngine):
         if self.latest_camera is None:
             return
         
-        renderables = self.get_renderables(bpy.context)
+        renderables = self.renderable_cache.get_renderables(bpy.context.scene)
 
         if len(renderables) == 0:
             return
 
         modifiers = self.get_render_modifiers(bpy.context)
-        self.bridge.request_preview(self.latest_camera, renderables, flags, modifiers)
-        self.last_preview_time = time()
+        self.request_preview(self.latest_camera, renderables, flags, modifiers, self.resolution_governor.requested_scale)
+
+    def request_preview(self, camera, renderables, flags, modifiers, scale: float):
+        self.resolution_governor.on_preview_requested(scale)
+        self.preview_scheduler.on_preview_requested()
+        self.preview_request_time = time()
+        self.has_pending_preview = False
+        with phase_profiler.span("request_preview"):
+            self.bridge.request_preview(camera, renderables, flags, modifiers)
+    
+    def is_preview_in_flight(self) -> bool:
+        if self.preview_request_time is None:
+            return False
+        
+        return time() - self.preview_request_time < PREVIEW_IN_FLIGHT_TIMEOUT
+
+    # Makes sure a deferred preview gets requested even if the in-flight one never reports back
+    def schedule_pending_preview_redraw(self):
+        if self.is_pending_redraw_scheduled:
+            return
+        
+        self.is_pending_redraw_scheduled = True
+        weak_self = weakref.ref(self)
+
+        def redraw_pending_preview():
+            wself = weak_self()
+            if wself is None:
+                return None
+            
+            wself.is_pending_redraw_scheduled = False
+            if wself.has_pending_preview:
+                wself.tag_redraw()
+            return None
+        
+        bpy.app.timers.register(redraw_pending_preview, first_interval=PREVIEW_IN_FLIGHT_TIMEOUT)
+
+    # Redraws the viewport once the camera has stopped moving, so a downscaled preview gets refined at full resolution
+    def schedule_preview_refinement(self):
+        if self.is_refine_scheduled:
+            return
+        
+        self.is_refine_scheduled = True
+        weak_self = weakref.ref(self)
+
+        def refine_preview():
+            wself = weak_self()
+            if wself is None:
+                return None
+            
+            time_remaining = PREVIEW_MOTION_SETTLE_TIME - wself.resolution_governor.time_since_motion()
+            if time_remaining > 0:
+                return time_remaining
+            
+            wself.is_refine_scheduled = False
+            wself.tag_redraw()
+            return None
+        
+        bpy.app.timers.register(refine_preview, first_interval=PREVIEW_MOTION_SETTLE_TIME)
 
     # This is the method called by Blender for both final renders (F12) and
     # small preview for materials, world and lights.
@@ -205,9 +316,11 @@ class TurboNeRFRenderEngine(bpy.types.RenderEngine):
         # according to povray, this needs to be called
         scene.frame_set(scene.frame_current)
 
-        self.update_renderables(depsgraph)
+        with phase_profiler.span("update_renderables"):
+            self.update_renderables(depsgraph)
 
-        renderables = self.get_renderables(bpy.context)
+        with phase_profiler.span("get_renderables"):
+            renderables = self.get_renderables(bpy.context)
 
         if len(renderables) == 0:
             return
@@ -216,8 +329,12 @@ class TurboNeRFRenderEngine(bpy.types.RenderEngine):
         active_cam = scene.camera
         
         if active_cam is None:
-            # TODO: error?
-            print("ERROR: No active camera during render!")
+            self.report({'ERROR'}, "No active camera to render with")
+            return
+
+        cam_error = get_render_cam_error(active_cam)
+        if cam_error is not None:
+            self.report({'ERROR'}, cam_error)
             return
 
         scale = scene.render.resolution_percentage / 100.0
@@ -226,46 +343,235 @@ class TurboNeRFRenderEngine(bpy.types.RenderEngine):
 
         dims = (size_x, size_y)
 
-        # convert to TurboNeRF camera
-        camera = bl2nerf_cam(active_cam, dims)
-        camera = camera_with_flipped_y(camera)
+        final_render_settings = scene.tn_render_engine_final_render_settings
+        self.use_depth_pass = final_render_settings.use_depth_pass and NeRFManager.can_render_depth()
 
-        # launch render request
-        self.bridge.request_render(camera, renderables)
+        # one camera per view when rendering multiview (for example both stereo eyes)
+        # renderables and NeRF transforms are shared, so the views are requested back to back
+        view_cameras = self.get_view_cameras(scene, active_cam, dims)
+        n_views = len(view_cameras)
+
+        if n_views == 0:
+            return
+
+        render_waiter = None
+        for view_index, (view_name, camera) in enumerate(view_cameras):
+            view_waiter = self.render_view(
+                scene=scene,
+                camera=camera,
+                renderables=renderables,
+                settings=final_render_settings,
+                view=view_name,
+                progress_range=(view_index / n_views, (view_index + 1) / n_views),
+            )
+
+            # None means the view was loaded from the result cache
+            if view_waiter is None:
+                continue
+
+            render_waiter = view_waiter
+            if not render_waiter.is_complete:
+                break
+
+        if render_waiter is None:
+            self.update_stats("", "TurboNeRF: loaded from cache")
+            log_report("INFO", f"Frame {scene.frame_current}: loaded from cache")
+            return
+
+        # measure the time between the bridge finishing the frame and this method returning
+        render_latency_counter.add_frame(render_waiter)
+        if render_waiter.is_complete:
+            self.update_stats("", f"TurboNeRF: {render_latency_counter.summary()}")
+            log_report("INFO", f"Frame {scene.frame_current}: {render_latency_counter.summary()}")
+
+    # Returns (view name, camera) for every view that gets rendered, the view name is "" without multiview.
+    # Cameras are flipped, so pixel rows start at the bottom like blender's render results.
+    # Returns an empty list if the active camera cannot be converted.
+    def get_view_cameras(
+        self,
+        scene: bpy.types.Scene,
+        cam_obj: bpy.types.Object,
+        dims: tuple[int, int],
+    ) -> list[tuple[str, tn.Camera]]:
+        if not scene.render.use_multiview:
+            with phase_profiler.span("bl2nerf_cam"):
+                camera = bl2nerf_cam(cam_obj, dims)
+
+            if camera is None:
+                return []
+            
+            return [("", camera_with_flipped_y(camera))]
+        
+        view_cameras = []
+        for view_name in get_multiview_names(scene.render):
+            # the engine's camera queries answer for the active view
+            self.active_view_set(view_name)
+            model_matrix = self.camera_model_matrix(cam_obj)
+            shift_x = self.camera_shift_x(cam_obj)
+
+            with phase_profiler.span("bl2nerf_cam"):
+                camera = bl2nerf_cam_view(bpy.context, cam_obj, dims, model_matrix, shift_x)
+
+            if camera is None:
+                return []
+            
+            view_cameras.append((view_name, camera_with_flipped_y(camera)))
         
+        return view_cameras
+
+    # Renders one view of the frame, honoring the render border, render mode and result cache.
+    # Returns the RenderWaiter of the last request, or None if the view was loaded from the result cache.
+    def render_view(
+        self,
+        scene: bpy.types.Scene,
+        camera: tn.Camera,
+        renderables: list[tn.Renderable],
+        settings: bpy.types.PropertyGroup,
+        view: str = "",
+        progress_range: tuple[float, float] = (0.0, 1.0),
+    ) -> RenderWaiter | None:
+        dims = camera.resolution
+
+        # with a render border, blender's render result only covers the border
+        render = scene.render
+        if render.use_border:
+            border_offset, result_dims = get_border_region(
+                dims,
+                (render.border_min_x, render.border_min_y),
+                (render.border_max_x, render.border_max_y)
+            )
+        else:
+            border_offset, result_dims = (0, 0), dims
+
+        # split the frame into tiles, each one is requested as its own offset camera
+        if settings.render_mode == 'TILED':
+            tile_size = settings.tile_size
+            regions = get_render_tiles(result_dims, (tile_size, tile_size))
+        else:
+            regions = [((0, 0), result_dims)]
+
+        n_regions = len(regions)
+
+        # reuse a cached result if nothing that goes into the render requests has changed
+        result_cache = None
+        result_buffer = None
+        cache_key = None
+        # depth is not cached, so frames with a depth pass always get rendered
+        if settings.use_result_cache and not self.use_depth_pass:
+            cache_key = get_render_cache_key(camera, get_nerf_objs(bpy.context.scene), settings, [border_offset, result_dims])
+
+        if cache_key is not None:
+            result_cache = RenderResultCache(
+                cache_dir=Path(bpy.path.abspath(settings.result_cache_dir)),
+                max_size_bytes=settings.result_cache_max_size * 1024 * 1024,
+            )
+
+            result_shape = (result_dims[1], result_dims[0], 4)
+            cached_pixels = result_cache.get(cache_key, result_shape)
+
+            if cached_pixels is not None:
+                result = self.begin_result(0, 0, *result_dims, view=view)
+                self.copy_rows_into_result(result, result_dims[0], 0, result_dims[1], cached_pixels.reshape(-1))
+                self.end_result(result)
+                return None
+            
+            # rendered regions are gathered here so the whole result can be cached
+            result_buffer = np.zeros(result_shape, dtype=np.float32)
+
+        (progress_min, progress_max) = progress_range
+        progress_step = (progress_max - progress_min) / n_regions
+
+        for i, (offset, region_dims) in enumerate(regions):
+            if region_dims == dims:
+                region_camera = camera
+            else:
+                camera_offset = (border_offset[0] + offset[0], border_offset[1] + offset[1])
+                region_camera = camera_with_region(camera, camera_offset, region_dims)
+            
+            region_progress_range = (progress_min + i * progress_step, progress_min + (i + 1) * progress_step)
+
+            if settings.render_mode == 'PROGRESSIVE':
+                render_waiter = self.render_progressive(
+                    camera=region_camera,
+                    renderables=renderables,
+                    settings=settings,
+                    view=view,
+                    progress_range=region_progress_range,
+                    result_buffer=result_buffer,
+                )
+            else:
+                render_waiter = self.render_region(
+                    camera=region_camera,
+                    renderables=renderables,
+                    offset=offset,
+                    settings=settings,
+                    view=view,
+                    progress_range=region_progress_range,
+                    result_buffer=result_buffer,
+                )
+
+            if not render_waiter.is_complete:
+                break
+
+        if result_cache is not None and render_waiter.is_complete:
+            result_cache.put(cache_key, result_buffer)
+        
+        return render_waiter
+
+    # Renders a camera into the sub-rectangle of the render result that starts at offset.
+    # The camera's resolution defines the size of the sub-rectangle.
+    # If result_buffer is given, the finished region is also copied into it at offset.
+    # Returns the RenderWaiter for the request, its is_complete flag is False if the render was cancelled.
+    def render_region(
+        self,
+        camera: tn.Camera,
+        renderables: list[tn.Renderable],
+        offset: tuple[int, int],
+        settings: bpy.types.PropertyGroup,
+        view: str = "",
+        progress_range: tuple[float, float] = (0.0, 1.0),
+        result_buffer: np.ndarray = None,
+    ) -> RenderWaiter:
+        (x, y) = offset
+        (size_x, size_y) = camera.resolution
+        (progress_min, progress_max) = progress_range
+
         # begin render result
-        result = self.begin_result(0, 0, size_x, size_y)
+        result = self.begin_result(x, y, size_x, size_y, view=view)
+
+        # render events signal this so we can return as soon as the region is done
+        render_waiter = RenderWaiter()
 
         # register render events
         render_events = []
 
+        # only the rows the bridge has written since the last update get copied into the result
+        dirty_rows = RenderBufferDirtyRows(size_x, size_y, settings.min_update_interval)
+
         # OnRenderProgress
-        def on_render_progress(args):
+        def on_render_progress(args, is_complete=False):
             # get latest from the render buffer
-            rgba_buf = self.bridge.get_render_rgba()
-            n_pixels = self.bridge.get_render_n_pixels()
-
-            # this is a total hack from https://devtalk.blender.org/t/pass-a-render-result-as-a-numpy-array-to-bpy-types-renderengine/11615/8?u=jperl
-            # and I love it :] thank you @Kinwailo
+            progress = self.bridge.get_render_progress()
+            rows = dirty_rows.take_dirty_rows(progress, force=is_complete)
+
+            if rows is not None:
+                # copy image data into the renderpass.rect buffer!
+                rgba = get_buffer_as_array(self.bridge.get_render_rgba())
+                with phase_profiler.span("copy_render_rows"):
+                    self.copy_rows_into_result(result, size_x, *rows, rgba, self.get_render_depth())
+        
+                self.update_result(result)
 
-            # interpret the buffer as a numpy array (no copying!)
-            rgba_view = memoryview(rgba_buf)
-            img = np.asarray(rgba_view)
-
-            # convert to raw data
-            img = img.ctypes.data_as(ctypes.c_void_p)
-            
-            # copy image data into the renderpass.rect buffer!
-            render_pass = result.layers[0].passes["Combined"]
-            dst = render_pass.as_pointer() + 96
-            dst = ctypes.cast(dst, ctypes.POINTER(ctypes.c_void_p))
-            float_size = ctypes.sizeof(ctypes.c_float)
-            ctypes.memmove(dst.contents, img, 4 * float_size * n_pixels)
-    
-            self.update_result(result)
+            # the cached frame needs the whole region, even if every row already reached the result on progress events
+            if is_complete and result_buffer is not None:
+                rgba = get_buffer_as_array(self.bridge.get_render_rgba())
+                n_floats = size_x * size_y * 4
+                result_buffer[y:y + size_y, x:x + size_x] = rgba[:n_floats].reshape(size_y, size_x, 4)
 
             # update the progress bar
-            self.update_progress(self.bridge.get_render_progress())
+            self.update_progress(progress_min + progress * (progress_max - progress_min))
+
+            render_waiter.notify_progress()
         
         # add OnRenderProgress observer
         event_id = self.bridge.add_observer(tn.BlenderBridgeEvent.OnRenderProgress, on_render_progress)
@@ -273,21 +579,19 @@ class TurboNeRFRenderEngine(bpy.types.RenderEngine):
 
         # OnRenderComplete
         def on_render_complete(args):
-            on_render_progress(None)
+            on_render_progress(None, is_complete=True)
+            render_waiter.notify_complete()
 
         # add OnRenderComplete observer
         event_id = self.bridge.add_observer(tn.BlenderBridgeEvent.OnRenderComplete, on_render_complete)
         render_events.append(event_id)
 
-        # keep alive until render is complete
-        while self.bridge.is_rendering():
-            # check for cancel
-            if self.test_break():
-                self.bridge.cancel_render()
-                break
-            
-            # I have no idea why, but this keeps blender responsive
-            sleep(0.1)
+        # launch render request
+        render_waiter.notify_requested()
+        with phase_profiler.span("request_render"):
+            self.bridge.request_render(camera, renderables)
+
+        self.wait_for_render(render_waiter)
 
         # end result
         self.end_result(result)
@@ -296,6 +600,151 @@ class TurboNeRFRenderEngine(bpy.types.RenderEngine):
         for obid in render_events:
             self.bridge.remove_observer(obid)
 
+        return render_waiter
+
+    # Renders the camera in passes of increasing resolution, starting at PROGRESSIVE_RENDER_START_SCALE.
+    # Each completed pass is upsampled into the whole render result, so cancelling keeps the last completed pass.
+    # If result_buffer is given, the last completed pass is also copied into it.
+    # Returns the RenderWaiter of the last requested pass.
+    def render_progressive(
+        self,
+        camera: tn.Camera,
+        renderables: list[tn.Renderable],
+        settings: bpy.types.PropertyGroup,
+        view: str = "",
+        progress_range: tuple[float, float] = (0.0, 1.0),
+        result_buffer: np.ndarray = None,
+    ) -> RenderWaiter:
+        dims = camera.resolution
+        (range_min, range_max) = progress_range
+        (size_x, size_y) = dims
+
+        scales = []
+        scale = PROGRESSIVE_RENDER_START_SCALE
+        while scale < settings.progressive_max_scale:
+            scales.append(scale)
+            scale *= 2.0
+        scales.append(settings.progressive_max_scale)
+
+        # progress is weighted by the number of pixels in each pass
+        pass_dims = [get_scaled_dims(dims, scale) for scale in scales]
+        pass_n_pixels = [w * h for (w, h) in pass_dims]
+        n_pixels_total = sum(pass_n_pixels)
+        n_pixels_done = 0
+
+        result = self.begin_result(0, 0, size_x, size_y, view=view)
+
+        for (pass_w, pass_h), n_pixels in zip(pass_dims, pass_n_pixels):
+            progress_min = range_min + (range_max - range_min) * n_pixels_done / n_pixels_total
+            progress_max = range_min + (range_max - range_min) * (n_pixels_done + n_pixels) / n_pixels_total
+
+            render_waiter = RenderWaiter()
+            render_events = []
+
+            # OnRenderProgress
+            def on_render_progress(args):
+                progress = self.bridge.get_render_progress()
+                self.update_progress(progress_min + progress * (progress_max - progress_min))
+                render_waiter.notify_progress()
+            
+            event_id = self.bridge.add_observer(tn.BlenderBridgeEvent.OnRenderProgress, on_render_progress)
+            render_events.append(event_id)
+
+            # OnRenderComplete
+            def on_render_complete(args):
+                render_waiter.notify_complete()
+            
+            event_id = self.bridge.add_observer(tn.BlenderBridgeEvent.OnRenderComplete, on_render_complete)
+            render_events.append(event_id)
+
+            # launch render request for this pass
+            render_waiter.notify_requested()
+            with phase_profiler.span("request_render"):
+                self.bridge.request_render(camera_with_resolution(camera, (pass_w, pass_h)), renderables)
+
+            self.wait_for_render(render_waiter)
+
+            for obid in render_events:
+                self.bridge.remove_observer(obid)
+
+            if not render_waiter.is_complete:
+                break
+
+            # upsample the pass into the render result
+            rgba = get_buffer_as_array(self.bridge.get_render_rgba())
+            depth = self.get_render_depth()
+            with phase_profiler.span("copy_render_rows"):
+                upsampled = upsample_nearest(rgba, (pass_w, pass_h), dims, 4)
+                if depth is not None:
+                    depth = upsample_nearest(depth, (pass_w, pass_h), dims, 1)
+                self.copy_rows_into_result(result, size_x, 0, size_y, upsampled, depth)
+            
+            self.update_result(result)
+
+            if result_buffer is not None:
+                result_buffer[:] = upsampled.reshape(result_buffer.shape)
+
+            n_pixels_done += n_pixels
+        
+        self.end_result(result)
+
+        return render_waiter
+
+    # Copies rows of the bridge's flat RGBA (and optionally depth) buffers into the Combined pass and the extra passes of a result.
+    # Single channel passes are written with the same memmove as Combined, opacity is gathered from the alpha channel first.
+    def copy_rows_into_result(
+        self,
+        result: bpy.types.RenderResult,
+        width: int,
+        row_start: int,
+        row_end: int,
+        rgba: np.ndarray,
+        depth: np.ndarray = None,
+    ):
+        passes = result.layers[0].passes
+        copy_rows_into_render_pass(passes["Combined"], rgba, width, row_start, row_end)
+
+        opacity_pass = passes.get(RENDER_PASS_OPACITY)
+        if opacity_pass is not None:
+            copy_channel_rows_into_render_pass(opacity_pass, rgba, width, 4, 3, row_start, row_end)
+        
+        depth_pass = passes.get(RENDER_PASS_DEPTH)
+        if depth_pass is not None and depth is not None:
+            copy_rows_into_render_pass(depth_pass, depth, width, row_start, row_end)
+
+    # Returns the bridge's depth buffer as a flat array, or None if the frame has no depth pass
+    def get_render_depth(self) -> np.ndarray | None:
+        if not self.use_depth_pass:
+            return None
+        
+        return get_buffer_as_array(self.bridge.get_render_depth())
+
+    # Registers the passes this engine writes, so they show up as compositor sockets
+    def update_render_passes(self, scene=None, renderlayer=None):
+        self.register_pass(scene, renderlayer, "Combined", 4, "RGBA", 'COLOR')
+
+        settings = scene.tn_render_engine_final_render_settings
+        if settings.use_depth_pass and NeRFManager.can_render_depth():
+            self.register_pass(scene, renderlayer, RENDER_PASS_DEPTH, 1, "Z", 'VALUE')
+        
+        if settings.use_opacity_pass:
+            self.register_pass(scene, renderlayer, RENDER_PASS_OPACITY, 1, "A", 'VALUE')
+
+    # Blocks until the render_waiter is notified, the render is cancelled, or the bridge stops rendering
+    def wait_for_render(self, render_waiter: RenderWaiter):
+        # keep alive until render is complete
+        # waiting on the event releases the GIL, which is what keeps blender responsive
+        while not render_waiter.wait(RENDER_CANCEL_CHECK_INTERVAL):
+            # check for cancel
+            if self.test_break():
+                self.bridge.cancel_render()
+                break
+
+            # guard against a completion event that never arrives
+            if not self.bridge.is_rendering():
+                render_waiter.wait(RENDER_CANCEL_CHECK_INTERVAL)
+                break
+
     # For viewport renders, this method gets called once at the start and
     # whenever the scene or 3D viewport changes. This method is where data
     # should be read from Blender in the same thread. Typically a render
@@ -303,7 +752,10 @@ class TurboNeRFRenderEngine(bpy.types.RenderEngine):
     def view_update(self, context, depsgraph: bpy.types.Depsgraph):
         self.update_renderables(depsgraph, force_update=self.is_first_view_update)
         if self.is_first_view_update:
+            self.renderable_cache.invalidate_all()
             self.is_first_view_update = False
+        else:
+            self.renderable_cache.update(depsgraph)
 
     # For viewport renders, this method is called whenever Blender redraws
     # the 3D viewport. The renderer is expected to quickly draw the render
@@ -311,7 +763,8 @@ class TurboNeRFRenderEngine(bpy.types.RenderEngine):
     # Blender will draw overlays for selection and editing on top of the
     # rendered image automatically.
     def view_draw(self, context, depsgraph):
-        renderables = self.get_renderables(bpy.context)
+        with phase_profiler.span("get_renderables"):
+            renderables = self.renderable_cache.get_renderables(context.scene)
 
         if len(renderables) == 0:
             return
@@ -320,8 +773,6 @@ class TurboNeRFRenderEngine(bpy.types.RenderEngine):
         region = context.region
         dimensions = region.width, region.height
         
-        self.bridge.resize_preview_surface(region.width, region.height)
-        
         # Get current camera
         current_region3d: bpy.types.RegionView3D = None
         for area in context.screen.areas:
@@ -332,28 +783,83 @@ class TurboNeRFRenderEngine(bpy.types.RenderEngine):
         if current_region3d is None:
             return
 
-        camera = bl2nerf_cam(current_region3d, dimensions, context)
+        with phase_profiler.span("bl2nerf_cam"):
+            view_camera = bl2nerf_cam(current_region3d, dimensions, context)
 
-        if camera is None:
+        if view_camera is None:
             return
         
         # Determine if the user initiated this view_draw call
         
-        has_new_camera = True if self.latest_camera is None else camera != self.latest_camera
+        preview_props = context.scene.nerf_preview_panel_props
+        view_fingerprint = CameraFingerprint(view_camera)
+        tolerance = CameraTolerance.from_preview_props(preview_props)
+
+        has_new_camera = not view_fingerprint.is_close_to(self.latest_view_fingerprint, tolerance)
         has_new_dims = dimensions != self.prev_view_dims
+
+        # only the pixels inside the viewport's render border get requested
+        view_border = get_view_render_border(context, region, current_region3d)
+        has_new_border = view_border != self.prev_view_border
         is_any_nerf_dirty =  np.any([r.nerf.is_dirty() and r.nerf.can_render for r in renderables])
 
-        user_initiated = has_new_camera or has_new_dims or is_any_nerf_dirty
+        # Pick the preview resolution, previews are only downscaled while the camera moves
+        governor = self.resolution_governor
+        if has_new_camera:
+            governor.notify_motion()
+
+        scale = 1.0
+        if preview_props.use_dynamic_resolution:
+            governor.set_target(
+                target_frame_time=0.001 * preview_props.target_frame_time,
+                min_scale=preview_props.min_resolution_scale,
+            )
+            scale = governor.get_scale()
+        
+        needs_refinement = scale != governor.requested_scale
+
+        user_initiated = has_new_camera or has_new_dims or has_new_border or is_any_nerf_dirty or needs_refinement or self.has_pending_preview
+
+        # coalesce requests while a preview is in flight, the next redraw requests the latest camera
+        if user_initiated and self.is_preview_in_flight():
+            self.has_pending_preview = True
+            self.schedule_pending_preview_redraw()
+            user_initiated = False
+
+        if user_initiated:
+            if scale < 1.0:
+                request_dims = get_scaled_dims(dimensions, scale)
+                with phase_profiler.span("bl2nerf_cam"):
+                    camera = bl2nerf_cam(current_region3d, request_dims, context)
+                self.schedule_preview_refinement()
+            else:
+                request_dims = dimensions
+                camera = view_camera
+            
+            self.preview_dims = request_dims
+            self.preview_border = view_border
+
+            if view_border is not None:
+                (x, y), self.preview_dims = get_scaled_region(view_border, request_dims, scale)
+                # the preview camera's pixel rows start at the top, region coordinates start at the bottom
+                camera_offset = (x, request_dims[1] - (y + self.preview_dims[1]))
+                camera = camera_with_region(camera, camera_offset, self.preview_dims)
+            
+            self.latest_camera = camera
+        
+        self.bridge.resize_preview_surface(*self.preview_dims)
 
         if user_initiated:
             flags = tn.RenderFlags.Preview
-            if not NeRFManager.is_training(): # and not context.screen.is_animation_playing:
+            # downscaled previews are temporary, so they skip the final pass
+            if scale == 1.0 and not NeRFManager.is_training(): # and not context.screen.is_animation_playing:
                 flags = flags | tn.RenderFlags.Final
 
             modifiers = self.get_render_modifiers(context)
 
             # launch preview request
-            self.bridge.request_preview(camera, renderables, flags, modifiers)
+            self.request_preview(camera, renderables, flags, modifiers, scale)
+            self.latest_view_fingerprint = view_fingerprint
 
         scene = depsgraph.scene
 
@@ -361,12 +867,24 @@ class TurboNeRFRenderEngine(bpy.types.RenderEngine):
         bgl.glBlendFunc(bgl.GL_ONE, bgl.GL_ONE_MINUS_SRC_ALPHA)
         self.bind_display_space_shader(scene)
         
-        self.bridge.draw()
+        # draw a render border preview into its own sub-rectangle of the viewport
+        if self.preview_border is not None:
+            viewport = bgl.Buffer(bgl.GL_INT, 4)
+            bgl.glGetIntegerv(bgl.GL_VIEWPORT, viewport)
+            ((x, y), (w, h)) = self.preview_border
+            bgl.glViewport(viewport[0] + x, viewport[1] + y, w, h)
+
+        with phase_profiler.span("draw"):
+            self.bridge.draw()
+
+        if self.preview_border is not None:
+            bgl.glViewport(*viewport)
+
         self.unbind_display_space_shader()
         bgl.glDisable(bgl.GL_BLEND)
 
-        self.latest_camera = camera
         self.prev_view_dims = dimensions
+        self.prev_view_border = view_border
 
 
 # RenderEngines also need to tell UI Panels that they are compatible with.
@@ -392,6 +910,7 @@ def register_nerf_render_engine():
     # Register the RenderEngine
     bpy.utils.register_class(TurboNeRFRenderEngine)
     bpy.utils.register_class(TurboNeRFRenderEngineRaymarchingPanel)
+    bpy.utils.register_class(TurboNeRFRenderEngineFinalRenderPanel)
 
     for panel in get_panels():
         panel.COMPAT_ENGINES.add('TURBO_NERF_RENDERER')
@@ -400,6 +919,7 @@ def register_nerf_render_engine():
 def unregister_nerf_render_engine():
     bpy.utils.unregister_class(TurboNeRFRenderEngine)
     bpy.utils.unregister_class(TurboNeRFRenderEngineRaymarchingPanel)
+    bpy.utils.unregister_class(TurboNeRFRenderEngineFinalRenderPanel)
 
     for panel in get_panels():
         if 'CUSTOM' in panel.COMPAT_ENGINES:
@@ -3,9 +3,8 @@ import numpy as np
 from pathlib import Path
 
 from turbo_nerf.blender_utility.object_utility import add_cube, add_empty
-from turbo_nerf.blender_utility.obj_type_utility import get_nerf_obj_type
+from turbo_nerf.blender_utility.obj_type_utility import get_all_objs_of_type, get_nerf_obj_type, set_nerf_obj_type
 from turbo_nerf.constants import (
-    OBJ_TYPE_ID,
     OBJ_TYPE_NERF,
     NERF_AABB_CENTER_ID,
     NERF_AABB_SIZE_ID,
@@ -41,7 +40,7 @@ class NeRFSnapshotManager():
 
     @classmethod
     def get_all_snapshots(cls):
-        return [obj for obj in bpy.data.objects if cls.is_nerf_snapshot(obj)]
+        return get_all_objs_of_type(OBJ_TYPE_NERF)
 
     @classmethod
     def is_nerf_snapshot(cls, obj):
@@ -50,7 +49,7 @@ class NeRFSnapshotManager():
     @classmethod
     def add_snapshot(cls, snapshot_path: Path, collection=None):
         snapshot_base: bpy.types.Object = add_empty("NeRF Snapshot", collection=collection, type='ARROWS')
-        snapshot_base[OBJ_TYPE_ID] = OBJ_TYPE_NERF
+        set_nerf_obj_type(snapshot_base, OBJ_TYPE_NERF)
 
         # TODO: copy snapshot into blender project folder?
         snapshot_base[NERF_PATH_ID] = str(snapshot_path.absolute())
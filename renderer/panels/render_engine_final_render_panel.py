@@ -0,0 +1,157 @@
+import bpy
+
+from turbo_nerf.constants.renderer import (
+    PROGRESSIVE_RENDER_START_SCALE,
+    RENDER_MIN_UPDATE_INTERVAL_DEFAULT,
+    RENDER_RESULT_CACHE_DIR_DEFAULT,
+    RENDER_RESULT_CACHE_MAX_SIZE_DEFAULT,
+    RENDER_TILE_SIZE_DEFAULT,
+)
+from turbo_nerf.renderer.batch.batch_render_operator import TurboNeRFBatchRenderOperator
+from turbo_nerf.utility.nerf_manager import NeRFManager
+
+class TurboNeRFRenderEngineFinalRenderSettings(bpy.types.PropertyGroup):
+    """Final render settings for the Turbo NeRF render engine."""
+
+    render_mode: bpy.props.EnumProperty(
+        name="Render Mode",
+        description="How the frame is requested from the renderer",
+        items=[
+            ('FULL_FRAME', "Full Frame", "Render the whole frame in a single request"),
+            ('TILED', "Tiled", "Render the frame tile by tile, memory use scales with the tile size instead of the frame size"),
+            ('PROGRESSIVE', "Progressive", "Render the frame at a quarter resolution first, then refine it in passes that double the resolution"),
+        ],
+        default='FULL_FRAME',
+    )
+
+    tile_size: bpy.props.IntProperty(
+        name="Tile Size",
+        description="Width and height of each tile in pixels",
+        default=RENDER_TILE_SIZE_DEFAULT,
+        min=64,
+        max=16384,
+        subtype='PIXEL',
+    )
+
+    progressive_max_scale: bpy.props.FloatProperty(
+        name="Max Resolution",
+        description="Stop refining once a pass reaches this fraction of the output resolution. The result is upsampled to the output resolution",
+        default=1.0,
+        min=PROGRESSIVE_RENDER_START_SCALE,
+        max=1.0,
+        subtype='FACTOR',
+    )
+
+    min_update_interval: bpy.props.FloatProperty(
+        name="Min Update Interval",
+        description="Minimum time in seconds between render result updates while a final render is in progress",
+        default=RENDER_MIN_UPDATE_INTERVAL_DEFAULT,
+        min=0.0,
+        max=10.0,
+        precision=2,
+        subtype='TIME_ABSOLUTE',
+    )
+
+    def update_render_passes(self, context):
+        context.view_layer.update_render_passes()
+
+    use_depth_pass: bpy.props.BoolProperty(
+        name="Depth Pass",
+        description="Add a Depth pass for compositing. Requires a version of PyTurboNeRF that renders depth",
+        default=False,
+        update=update_render_passes,
+    )
+
+    use_opacity_pass: bpy.props.BoolProperty(
+        name="Opacity Pass",
+        description="Add an Opacity pass with the accumulated ray weight of the NeRFs",
+        default=False,
+        update=update_render_passes,
+    )
+
+    batch_output_format: bpy.props.EnumProperty(
+        name="Batch Format",
+        description="Image format of frames written by Batch Render Animation",
+        items=[
+            ('PNG', "PNG", "8-bit sRGB RGBA PNG"),
+            ('OPEN_EXR', "OpenEXR", "Uncompressed half float linear RGBA OpenEXR"),
+        ],
+        default='PNG',
+    )
+
+    use_result_cache: bpy.props.BoolProperty(
+        name="Cache Results",
+        description="Reuse rendered frames from disk when the camera, NeRFs, training steps and spatial effects are unchanged",
+        default=False,
+    )
+
+    result_cache_dir: bpy.props.StringProperty(
+        name="Cache Directory",
+        description="Directory that cached render results are stored in",
+        default=RENDER_RESULT_CACHE_DIR_DEFAULT,
+        subtype='DIR_PATH',
+    )
+
+    result_cache_max_size: bpy.props.IntProperty(
+        name="Cache Size (MB)",
+        description="Least recently used results are removed once the cache grows beyond this size",
+        default=RENDER_RESULT_CACHE_MAX_SIZE_DEFAULT,
+        min=1,
+    )
+
+class TurboNeRFRenderEngineFinalRenderPanel(bpy.types.Panel):
+    """Panel for Turbo NeRF final render settings."""
+
+    bl_label = "Turbo NeRF Final Render"
+    bl_idname = "TURBO_NERF_PT_render_engine_final_render_settings"
+    bl_space_type = "PROPERTIES"
+    bl_region_type = "WINDOW"
+    bl_context = "render"
+
+    @classmethod
+    def poll(cls, context):
+        return context.scene.render.engine == "TURBO_NERF_RENDERER"
+
+    def draw(self, context):
+        layout = self.layout
+        layout.use_property_split = True
+        layout.use_property_decorate = False
+
+        scene = context.scene
+        ui_props = scene.tn_render_engine_final_render_settings
+
+        layout.prop(ui_props, "render_mode")
+
+        if ui_props.render_mode == 'TILED':
+            layout.prop(ui_props, "tile_size")
+        
+        if ui_props.render_mode == 'PROGRESSIVE':
+            layout.prop(ui_props, "progressive_max_scale")
+
+        layout.prop(ui_props, "min_update_interval")
+
+        col = layout.column(heading="Passes")
+        if NeRFManager.can_render_depth():
+            col.prop(ui_props, "use_depth_pass")
+        col.prop(ui_props, "use_opacity_pass")
+
+        layout.prop(ui_props, "use_result_cache")
+        if ui_props.use_result_cache:
+            layout.prop(ui_props, "result_cache_dir")
+            layout.prop(ui_props, "result_cache_max_size")
+
+        layout.separator()
+        layout.prop(ui_props, "batch_output_format")
+        layout.operator(TurboNeRFBatchRenderOperator.bl_idname, icon='RENDER_ANIMATION')
+    
+    @classmethod
+    def register(cls):
+        bpy.utils.register_class(TurboNeRFBatchRenderOperator)
+        bpy.utils.register_class(TurboNeRFRenderEngineFinalRenderSettings)
+        bpy.types.Scene.tn_render_engine_final_render_settings = bpy.props.PointerProperty(type=TurboNeRFRenderEngineFinalRenderSettings)
+    
+    @classmethod
+    def unregister(cls):
+        bpy.utils.unregister_class(TurboNeRFBatchRenderOperator)
+        bpy.utils.unregister_class(TurboNeRFRenderEngineFinalRenderSettings)
+        del bpy.types.Scene.tn_render_engine_final_render_settings
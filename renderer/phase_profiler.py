@@ -0,0 +1,84 @@
+from contextlib import contextmanager
+from pathlib import Path
+from time import perf_counter
+import csv
+
+import numpy as np
+
+from turbo_nerf.constants.renderer import PHASE_PROFILER_N_SAMPLES
+
+# Fixed-size ring buffer of durations (in seconds) for a single phase
+class PhaseSamples:
+    def __init__(self, n_samples: int = PHASE_PROFILER_N_SAMPLES):
+        self.durations = np.zeros(n_samples, dtype=np.float64)
+        self.n_total = 0
+
+    def add(self, duration: float):
+        self.durations[self.n_total % len(self.durations)] = duration
+        self.n_total += 1
+
+    # Returns the retained durations, oldest first
+    def get_recent(self) -> np.ndarray:
+        n_samples = len(self.durations)
+        if self.n_total <= n_samples:
+            return self.durations[:self.n_total]
+        
+        # once the buffer wrapped, the oldest sample is the one the next add overwrites
+        cursor = self.n_total % n_samples
+        return np.concatenate((self.durations[cursor:], self.durations[:cursor]))
+
+    # Index of the first sample returned by get_recent, counted from the first sample ever added
+    def get_first_recent_index(self) -> int:
+        return max(self.n_total - len(self.durations), 0)
+    
+    def get_percentiles(self, percentiles: list[float]) -> np.ndarray:
+        recent = self.get_recent()
+        if len(recent) == 0:
+            return np.zeros(len(percentiles))
+        return np.percentile(recent, percentiles)
+
+# Times the phases of TurboNeRFRenderEngine.  Disabled by default, so spans cost a single attribute check.
+class PhaseProfiler:
+    def __init__(self):
+        self.is_enabled = False
+        self.phases: dict[str, PhaseSamples] = {}
+
+    def add_sample(self, phase: str, duration: float):
+        samples = self.phases.get(phase)
+        if samples is None:
+            samples = self.phases[phase] = PhaseSamples()
+        samples.add(duration)
+
+    @contextmanager
+    def span(self, phase: str):
+        if not self.is_enabled:
+            yield
+            return
+        
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.add_sample(phase, perf_counter() - start)
+
+    def clear(self):
+        self.phases = {}
+
+    # Returns (phase, n_total, p50, p95) for each phase, in seconds
+    def get_summary(self) -> list[tuple[str, int, float, float]]:
+        summary = []
+        for phase, samples in self.phases.items():
+            p50, p95 = samples.get_percentiles([50, 95])
+            summary.append((phase, samples.n_total, p50, p95))
+        return summary
+
+    # Writes every retained sample, one row per sample in the order they were taken
+    def write_csv(self, path: Path):
+        with open(path, 'w', newline='') as csv_file:
+            writer = csv.writer(csv_file)
+            writer.writerow(["phase", "sample", "duration_ms"])
+            for phase, samples in self.phases.items():
+                for i, duration in enumerate(samples.get_recent(), start=samples.get_first_recent_index()):
+                    writer.writerow([phase, i, 1000.0 * duration])
+
+phase_profiler = PhaseProfiler()
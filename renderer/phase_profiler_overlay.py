@@ -0,0 +1,41 @@
+import bpy
+import blf
+
+from turbo_nerf.renderer.phase_profiler import phase_profiler
+
+# Draws the p50/p95 of each profiled render engine phase in the corner of the 3D viewport
+
+class PhaseProfilerOverlay:
+    draw_handler = None
+
+    @classmethod
+    def draw(cls):
+        font_id = 0
+        line_height = 16
+        x = 20
+        y = 60
+
+        blf.size(font_id, 12)
+        blf.color(font_id, 1.0, 1.0, 1.0, 0.9)
+
+        summary = phase_profiler.get_summary()
+        for phase, n_total, p50, p95 in reversed(summary):
+            blf.position(font_id, x, y, 0)
+            blf.draw(font_id, f"{phase}: p50 {1000.0 * p50:.2f} ms  p95 {1000.0 * p95:.2f} ms  (n={n_total})")
+            y += line_height
+        
+        blf.position(font_id, x, y, 0)
+        blf.draw(font_id, "TurboNeRF render phases")
+
+    @classmethod
+    def enable(cls):
+        phase_profiler.is_enabled = True
+        if cls.draw_handler is None:
+            cls.draw_handler = bpy.types.SpaceView3D.draw_handler_add(cls.draw, (), 'WINDOW', 'POST_PIXEL')
+
+    @classmethod
+    def disable(cls):
+        phase_profiler.is_enabled = False
+        if cls.draw_handler is not None:
+            bpy.types.SpaceView3D.draw_handler_remove(cls.draw_handler, 'WINDOW')
+            cls.draw_handler = None
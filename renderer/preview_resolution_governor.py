@@ -0,0 +1,98 @@
+from time import perf_counter
+import math
+
+from turbo_nerf.constants.renderer import PREVIEW_LATENCY_SMOOTHING, PREVIEW_MOTION_SETTLE_TIME
+
+# Picks the resolution scale of viewport previews so that they keep up with camera motion.
+# Preview cost is assumed to be proportional to the number of pixels, so a latency measured at scale s
+# predicts a full resolution latency of latency / s^2.
+# The scale only moves when a preview timing is recorded, so it adapts per preview and not per viewport redraw.
+
+class PreviewResolutionGovernor:
+    def __init__(self):
+        self.scale = 1.0
+        self.requested_scale = 1.0
+        self.target_frame_time = None
+        self.min_scale = 1.0
+        self.full_res_latency = None
+        self.request_time = None
+        self.last_motion_time = None
+        self.has_early_sample = False
+
+    def reset(self):
+        self.scale = 1.0
+        self.full_res_latency = None
+
+    def notify_motion(self):
+        self.last_motion_time = perf_counter()
+    
+    def time_since_motion(self) -> float:
+        if self.last_motion_time is None:
+            return math.inf
+        return perf_counter() - self.last_motion_time
+
+    def is_moving(self) -> bool:
+        return self.time_since_motion() < PREVIEW_MOTION_SETTLE_TIME
+
+    def add_latency_sample(self, latency: float):
+        full_res_latency = latency / (self.requested_scale ** 2)
+        if self.full_res_latency is None:
+            self.full_res_latency = full_res_latency
+        else:
+            a = PREVIEW_LATENCY_SMOOTHING
+            self.full_res_latency = a * full_res_latency + (1.0 - a) * self.full_res_latency
+        
+        self.update_scale()
+
+    # Sets the preview time to aim for and the lowest scale to use, from the viewport preview settings
+    def set_target(self, target_frame_time: float, min_scale: float):
+        self.target_frame_time = target_frame_time
+        self.min_scale = min_scale
+
+    def update_scale(self):
+        if self.target_frame_time is None or self.full_res_latency is None or self.full_res_latency <= 0.0:
+            return
+        
+        desired_scale = math.sqrt(self.target_frame_time / self.full_res_latency)
+
+        # move halfway towards the desired scale to avoid oscillating between resolutions
+        scale = 0.5 * (self.scale + desired_scale)
+        self.scale = min(max(scale, self.min_scale), 1.0)
+
+    def on_preview_requested(self, scale: float):
+        now = perf_counter()
+
+        # a preview that is superseded before it completes took at least this long
+        if self.request_time is not None:
+            elapsed = now - self.request_time
+            if self.full_res_latency is None or elapsed > self.full_res_latency * self.requested_scale ** 2:
+                self.add_latency_sample(elapsed)
+
+        self.requested_scale = scale
+        self.request_time = now
+        self.has_early_sample = False
+
+    # A preview that is still in progress after its predicted latency is already known to be too slow
+    def on_preview_progress(self):
+        if self.request_time is None or self.has_early_sample or self.full_res_latency is None:
+            return
+        
+        elapsed = perf_counter() - self.request_time
+        if elapsed > self.full_res_latency * self.requested_scale ** 2:
+            self.add_latency_sample(elapsed)
+            self.has_early_sample = True
+
+    def on_preview_complete(self):
+        if self.request_time is None:
+            return
+        
+        self.add_latency_sample(perf_counter() - self.request_time)
+        self.request_time = None
+
+    # Returns the scale to request the next preview at.  Previews are only scaled down while the camera is moving.
+    def get_scale(self) -> float:
+        if not self.is_moving():
+            return 1.0
+        
+        # the minimum scale may have been raised since the scale was last updated
+        return min(max(self.scale, self.min_scale), 1.0)
@@ -0,0 +1,178 @@
+import hashlib
+import os
+from pathlib import Path
+
+import bpy
+import numpy as np
+
+from turbo_nerf.blender_utility.logging_utility import log_report
+from turbo_nerf.constants import NERF_PATH_ID
+from turbo_nerf.effects.utils.common import EFFECT_TYPES_BY_ID
+from turbo_nerf.renderer.renderables import get_nerf_transform
+from turbo_nerf.utility.nerf_manager import NeRFManager
+from turbo_nerf.utility.pylib import PyTurboNeRF as tn
+
+# Disk cache of final render results, addressed by a hash of everything that goes into the render request.
+# Each entry is a .npy file holding the (height, width, channels) float32 pixels in render pass order.
+# Reading an entry touches its mtime, so eviction removes the least recently used entries first.
+
+class RenderResultCache:
+    def __init__(self, cache_dir: Path, max_size_bytes: int):
+        self.cache_dir = Path(cache_dir)
+        self.max_size_bytes = max_size_bytes
+
+    def get_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.npy"
+
+    def get(self, key: str, shape: tuple[int, ...]) -> np.ndarray | None:
+        path = self.get_path(key)
+        if not path.exists():
+            return None
+        
+        try:
+            pixels = np.load(path)
+        except (OSError, ValueError) as e:
+            log_report("WARNING", f"Could not read cached render {path}: {e}")
+            return None
+
+        if pixels.shape != shape or pixels.dtype != np.float32:
+            return None
+        
+        os.utime(path)
+        return pixels
+    
+    def put(self, key: str, pixels: np.ndarray):
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self.get_path(key)
+
+        # write to a temp file first so a cancelled write never leaves a truncated entry behind
+        tmp_path = path.with_name(f"{path.stem}.tmp.npy")
+        np.save(tmp_path, pixels.astype(np.float32, copy=False))
+        os.replace(tmp_path, path)
+
+        self.evict()
+    
+    # removes the least recently used entries until the cache fits in max_size_bytes
+    def evict(self):
+        entries = []
+        for path in self.cache_dir.glob("*.npy"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        
+        total_size = sum(size for _, size, _ in entries)
+        
+        for _, size, path in sorted(entries):
+            if total_size <= self.max_size_bytes:
+                break
+            
+            path.unlink(missing_ok=True)
+            total_size -= size
+
+# Adds a value of any of the types that make up a render request to a hash.
+# Unknown types raise a TypeError, so a new kind of value can never end up in a key as something session specific like a memory address.
+def hash_value(hasher, value):
+    if isinstance(value, np.generic):
+        value = value.item()
+    
+    if isinstance(value, (bool, int, float, str)) or value is None:
+        hasher.update(repr(value).encode())
+    elif isinstance(value, dict):
+        for k in sorted(value):
+            hash_value(hasher, k)
+            hash_value(hasher, value[k])
+    elif isinstance(value, (list, tuple)):
+        hasher.update(b"[")
+        for v in value:
+            hash_value(hasher, v)
+        hasher.update(b"]")
+    elif isinstance(value, np.ndarray):
+        hash_value(hasher, value.shape)
+        hasher.update(np.ascontiguousarray(value, dtype=np.float64).tobytes())
+    elif isinstance(value, tn.Transform4f):
+        hash_value(hasher, np.array(value))
+    elif isinstance(value, tn.BoundingBox):
+        hash_value(hasher, [value.min_x, value.min_y, value.min_z, value.max_x, value.max_y, value.max_z])
+    else:
+        raise TypeError(f"Cannot hash a value of type {type(value).__name__} for the render result cache")
+
+def hash_camera(hasher, camera: tn.Camera):
+    hash_value(hasher, [
+        tuple(camera.resolution),
+        camera.near,
+        camera.far,
+        tuple(camera.focal_length),
+        tuple(camera.principal_point),
+        tuple(camera.shift),
+        np.array(camera.transform),
+    ])
+
+    dist_params = camera.dist_params
+    hash_value(hasher, [getattr(dist_params, k, None) for k in ("k1", "k2", "k3", "p1", "p2")])
+
+# Returns what a NeRF was loaded from, which stays the same across sessions unlike its nerf id.
+# Returns None for a NeRF that was neither loaded from a snapshot nor created from a dataset.
+def get_nerf_source(nerf_obj: bpy.types.Object, nerf: tn.NeRF) -> str | None:
+    snapshot_path = nerf_obj.get(NERF_PATH_ID)
+    if snapshot_path is not None:
+        return f"snapshot:{snapshot_path}"
+    
+    if nerf.dataset is not None:
+        return f"dataset:{nerf.dataset.file_path}"
+    
+    return None
+
+# Returns the hash of one NeRF object's contribution to a render, or None if its NeRF cannot be identified across sessions
+def get_nerf_obj_digest(nerf_obj: bpy.types.Object) -> str | None:
+    nerf = NeRFManager.get_nerf_for_obj(nerf_obj)
+
+    nerf_source = get_nerf_source(nerf_obj, nerf)
+    if nerf_source is None:
+        return None
+    
+    hasher = hashlib.sha256()
+    # the render bbox crops the NeRF
+    hash_value(hasher, [nerf_source, nerf.training_step, get_nerf_transform(nerf_obj), nerf.render_bbox])
+    
+    for props in nerf_obj.tn_nerf_spatial_effects_list:
+        effect_id = props.effect_id
+        if effect_id not in EFFECT_TYPES_BY_ID:
+            continue
+
+        effect_type = EFFECT_TYPES_BY_ID[effect_id]
+        hash_value(hasher, [effect_id, effect_type.get_tn_constructor_kwargs(props, nerf_obj)])
+    
+    return hasher.hexdigest()
+
+# Returns the settings of a final render that change its pixels
+def get_render_settings_values(settings: bpy.types.PropertyGroup) -> list:
+    max_scale = settings.progressive_max_scale if settings.render_mode == 'PROGRESSIVE' else 1.0
+    min_step_size = NeRFManager.get_bridge_object_property("renderer", "min_step_size")
+
+    return [settings.render_mode, max_scale, min_step_size]
+
+# Returns the cache key of a final render of camera with the given NeRF objects and final render settings.
+# extra holds anything else that changes the pixels, like the render border.
+# Returns None if the render cannot be cached because one of the NeRFs cannot be identified across sessions.
+def get_render_cache_key(
+    camera: tn.Camera,
+    nerf_objs: list[bpy.types.Object],
+    settings: bpy.types.PropertyGroup,
+    extra: list,
+) -> str | None:
+    nerf_obj_digests = [get_nerf_obj_digest(nerf_obj) for nerf_obj in nerf_objs]
+    if None in nerf_obj_digests:
+        return None
+    
+    hasher = hashlib.sha256()
+
+    hash_camera(hasher, camera)
+
+    # sorted, so the key does not depend on the order the objects are found in
+    hash_value(hasher, sorted(nerf_obj_digests))
+    hash_value(hasher, get_render_settings_values(settings))
+    hash_value(hasher, extra)
+
+    return hasher.hexdigest()
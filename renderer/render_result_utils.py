@@ -0,0 +1,128 @@
+import ctypes
+import math
+from time import perf_counter
+
+import bpy
+import numpy as np
+
+from turbo_nerf.constants.renderer import RENDER_PASS_RECT_PTR_OFFSET
+
+# Helpers for writing bridge buffers directly into Blender render passes.
+# this is a total hack from https://devtalk.blender.org/t/pass-a-render-result-as-a-numpy-array-to-bpy-types-renderengine/11615/8?u=jperl
+# and I love it :] thank you @Kinwailo
+
+FLOAT_SIZE = ctypes.sizeof(ctypes.c_float)
+
+def get_render_pass_rect_address(render_pass: bpy.types.RenderPass) -> int:
+    dst = render_pass.as_pointer() + RENDER_PASS_RECT_PTR_OFFSET
+    dst = ctypes.cast(dst, ctypes.POINTER(ctypes.c_void_p))
+    return dst.contents.value
+
+# interpret a bridge buffer as a flat numpy array (no copying!)
+def get_buffer_as_array(buffer) -> np.ndarray:
+    return np.asarray(memoryview(buffer)).reshape(-1)
+
+# copies rows [row_start, row_end) of a flat float buffer into the same rows of the render pass
+def copy_rows_into_render_pass(
+    render_pass: bpy.types.RenderPass,
+    src: np.ndarray,
+    width: int,
+    row_start: int,
+    row_end: int,
+):
+    if row_end <= row_start:
+        return
+
+    row_size = width * render_pass.channels * FLOAT_SIZE
+    offset = row_start * row_size
+    n_bytes = (row_end - row_start) * row_size
+
+    dst_address = get_render_pass_rect_address(render_pass) + offset
+    src_address = src.ctypes.data + offset
+    
+    ctypes.memmove(dst_address, src_address, n_bytes)
+
+# copies one channel of rows [row_start, row_end) of a flat interleaved buffer into a single channel render pass
+def copy_channel_rows_into_render_pass(
+    render_pass: bpy.types.RenderPass,
+    src: np.ndarray,
+    width: int,
+    src_channels: int,
+    channel: int,
+    row_start: int,
+    row_end: int,
+):
+    if row_end <= row_start:
+        return
+    
+    # the channel is strided in src, so it needs to be gathered before it can be copied
+    start = row_start * width * src_channels
+    end = row_end * width * src_channels
+    values = np.ascontiguousarray(src[start + channel:end:src_channels], dtype=np.float32)
+
+    dst_address = get_render_pass_rect_address(render_pass) + row_start * width * FLOAT_SIZE
+    
+    ctypes.memmove(dst_address, values.ctypes.data, values.nbytes)
+
+# nearest-neighbor upsampling of a flat buffer with the given number of channels from src_dims to dst_dims
+def upsample_nearest(
+    src: np.ndarray,
+    src_dims: tuple[int, int],
+    dst_dims: tuple[int, int],
+    channels: int = 4,
+) -> np.ndarray:
+    (src_w, src_h) = src_dims
+    (dst_w, dst_h) = dst_dims
+
+    img = src[:src_w * src_h * channels].reshape(src_h, src_w, channels)
+
+    rows = np.arange(dst_h) * src_h // dst_h
+    cols = np.arange(dst_w) * src_w // dst_w
+
+    return np.ascontiguousarray(img[rows][:, cols], dtype=np.float32).reshape(-1)
+
+# Tracks which rows of the bridge's render buffer were written since the last copy.
+# The bridge renders pixels in linear order, so the render progress tells us how many rows are done.
+# Only those rows get copied on progress events, and on completion only the rows that were not copied yet.
+
+class RenderBufferDirtyRows:
+    def __init__(self, width: int, height: int, min_update_interval: float = 0.0):
+        self.width = width
+        self.height = height
+        self.min_update_interval = min_update_interval
+        self.next_row = 0
+        self.last_update_time = None
+
+    def reset(self):
+        self.next_row = 0
+        self.last_update_time = None
+
+    def is_update_due(self) -> bool:
+        if self.last_update_time is None:
+            return True
+        return perf_counter() - self.last_update_time >= self.min_update_interval
+
+    # returns the range of rows to copy for the given render progress, or None if the update should be skipped.
+    # force takes every remaining row regardless of progress and update interval, for when the render is complete.
+    def take_dirty_rows(self, progress: float, force: bool = False) -> tuple[int, int] | None:
+        if not force and not self.is_update_due():
+            return None
+        
+        row_start = self.next_row
+
+        if force:
+            row_end = self.height
+            next_row = self.height
+        else:
+            rows_done = min(max(progress, 0.0), 1.0) * self.height
+            row_end = math.ceil(rows_done)
+            # the last row may only be partially written, so it gets copied again next time
+            next_row = math.floor(rows_done)
+
+        if row_end <= row_start:
+            return None
+        
+        self.next_row = next_row
+        self.last_update_time = perf_counter()
+
+        return row_start, row_end
@@ -0,0 +1,76 @@
+import threading
+from time import perf_counter
+
+# A wait primitive for final renders.
+# The bridge's render observers signal it, so render() wakes up as soon as the frame is done
+# instead of sleeping through a fixed polling interval.
+
+class RenderWaiter:
+    def __init__(self):
+        self._event = threading.Event()
+        self.is_complete = False
+        self.requested_at = None
+        self.completed_at = None
+
+    def notify_requested(self):
+        self.requested_at = perf_counter()
+
+    def notify_progress(self):
+        self._event.set()
+
+    def notify_complete(self):
+        self.completed_at = perf_counter()
+        self.is_complete = True
+        self._event.set()
+
+    # Blocks until the next progress or completion event, or until the timeout elapses.
+    # Returns True once the render is complete.
+    def wait(self, timeout: float) -> bool:
+        self._event.wait(timeout)
+        self._event.clear()
+        return self.is_complete
+
+# Keeps track of how long render() takes to return after the bridge reports a completed frame.
+
+class RenderLatencyCounter:
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.n_frames = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+        self.last_latency = 0.0
+        self.last_render_time = 0.0
+
+    def add_frame(self, waiter: RenderWaiter, finished_at: float = None):
+        if waiter.completed_at is None:
+            return
+
+        if finished_at is None:
+            finished_at = perf_counter()
+
+        latency = finished_at - waiter.completed_at
+        
+        self.n_frames += 1
+        self.total_latency += latency
+        self.max_latency = max(self.max_latency, latency)
+        self.last_latency = latency
+
+        if waiter.requested_at is not None:
+            self.last_render_time = waiter.completed_at - waiter.requested_at
+
+    @property
+    def mean_latency(self) -> float:
+        if self.n_frames == 0:
+            return 0.0
+        return self.total_latency / self.n_frames
+
+    def summary(self) -> str:
+        return (
+            f"render {1000.0 * self.last_render_time:.1f} ms, "
+            f"completion latency {1000.0 * self.last_latency:.2f} ms "
+            f"(mean {1000.0 * self.mean_latency:.2f} ms, max {1000.0 * self.max_latency:.2f} ms over {self.n_frames} frames)"
+        )
+
+render_latency_counter = RenderLatencyCounter()
@@ -0,0 +1,65 @@
+import bpy
+
+from turbo_nerf.blender_utility.obj_type_utility import get_closest_parent_of_type
+from turbo_nerf.constants import NERF_ITEM_IDENTIFIER_ID, OBJ_TYPE_NERF
+from turbo_nerf.renderer.renderables import get_nerf_objs, get_renderable
+from turbo_nerf.utility.pylib import PyTurboNeRF as tn
+
+# Caches renderables by NeRF id so viewport redraws don't rebuild them.
+# Entries are only invalidated by depsgraph updates to a NeRF object, its effect properties or its children.
+# The list of NeRF objects is rescanned when objects are added to or removed from the scene.
+
+class RenderableCache:
+    def __init__(self):
+        self.nerf_objs: list[bpy.types.Object] | None = None
+        self.renderables: dict[int, tn.Renderable] = {}
+
+    def invalidate_all(self):
+        self.nerf_objs = None
+        self.renderables = {}
+    
+    def invalidate_nerf_id(self, nerf_id: int):
+        if nerf_id in self.renderables:
+            del self.renderables[nerf_id]
+
+    def update(self, depsgraph: bpy.types.Depsgraph):
+        for update in depsgraph.updates:
+            id = update.id
+
+            # objects were added or removed
+            if isinstance(id, (bpy.types.Scene, bpy.types.Collection)):
+                self.nerf_objs = None
+                continue
+
+            if not isinstance(id, bpy.types.Object):
+                continue
+            
+            # effect properties live on the NeRF object, so they are covered by this too
+            nerf_obj = get_closest_parent_of_type(id, OBJ_TYPE_NERF)
+            if nerf_obj is not None:
+                self.invalidate_nerf_id(nerf_obj[NERF_ITEM_IDENTIFIER_ID])
+
+    def get_cached_renderables(self, scene: bpy.types.Scene) -> list[tn.Renderable]:
+        if self.nerf_objs is None:
+            self.nerf_objs = get_nerf_objs(scene)
+
+        renderables = []
+        for nerf_obj in self.nerf_objs:
+            nerf_id = nerf_obj[NERF_ITEM_IDENTIFIER_ID]
+            
+            renderable = self.renderables.get(nerf_id)
+            if renderable is None:
+                renderable = get_renderable(nerf_obj)
+                self.renderables[nerf_id] = renderable
+            
+            renderables.append(renderable)
+        
+        return renderables
+
+    def get_renderables(self, scene: bpy.types.Scene) -> list[tn.Renderable]:
+        try:
+            return self.get_cached_renderables(scene)
+        except ReferenceError:
+            # cached objects were freed (undo, file load), start over
+            self.invalidate_all()
+            return self.get_cached_renderables(scene)
@@ -0,0 +1,28 @@
+import bpy
+import numpy as np
+
+from turbo_nerf.blender_utility.obj_type_utility import is_nerf_obj_type
+from turbo_nerf.constants import OBJ_TYPE_NERF
+from turbo_nerf.constants.math import NERF_ADJUSTMENT_MATRIX
+from turbo_nerf.effects.utils.serialization import get_spatial_effects_for_nerf_obj
+from turbo_nerf.utility.nerf_manager import NeRFManager
+from turbo_nerf.utility.pylib import PyTurboNeRF as tn
+
+# Helpers for turning NeRF objects in a scene into renderables for the bridge
+
+def get_nerf_objs(scene: bpy.types.Scene) -> list[bpy.types.Object]:
+    return [obj for obj in scene.objects if is_nerf_obj_type(obj, OBJ_TYPE_NERF)]
+
+def get_renderable(nerf_obj: bpy.types.Object) -> tn.Renderable:
+    nerf = NeRFManager.get_nerf_for_obj(nerf_obj)
+    spatial_effects = get_spatial_effects_for_nerf_obj(nerf_obj)
+    return tn.Renderable(nerf, spatial_effects)
+
+def get_renderables(scene: bpy.types.Scene) -> list[tn.Renderable]:
+    return [get_renderable(obj) for obj in get_nerf_objs(scene)]
+
+# The transform of the NeRF representation on the CUDA side
+def get_nerf_transform(nerf_obj: bpy.types.Object) -> tn.Transform4f:
+    # why do we need to multiply by NERF_ADJUSTMENT_MATRIX? idk, but it works.
+    mat = np.array(nerf_obj.matrix_world @ NERF_ADJUSTMENT_MATRIX)
+    return tn.Transform4f(mat).from_nerf()
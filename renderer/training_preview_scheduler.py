@@ -0,0 +1,103 @@
+from time import perf_counter
+import math
+
+from turbo_nerf.constants.renderer import PREVIEW_SCHEDULER_MAX_TOKENS, PREVIEW_SCHEDULER_SMOOTHING
+
+# Time split between training and previews, shown in the preview panel
+class TrainingPreviewStats:
+    step_time = 0.0
+    preview_cost = 0.0
+    preview_time_fraction = 0.0
+    steps_until_preview = 0
+
+training_preview_stats = TrainingPreviewStats()
+
+def ema(value: float | None, sample: float) -> float:
+    if value is None:
+        return sample
+    return PREVIEW_SCHEDULER_SMOOTHING * sample + (1.0 - PREVIEW_SCHEDULER_SMOOTHING) * value
+
+# Token bucket that decides on which training steps a preview is requested.
+# Tokens are seconds of GPU time, they refill at budget_fraction of wall time and every preview spends its measured cost.
+# Between budgeted slots on_training_step only increments a counter and compares it with next_preview_step.
+
+class TrainingPreviewScheduler:
+    def __init__(self):
+        self.step = 0
+        self.next_preview_step = 0
+        
+        self.last_slot_step = None
+        self.last_slot_time = None
+        self.step_time = None
+        self.preview_cost = None
+        self.tokens = 0.0
+
+        self.preview_request_time = None
+        self.preview_time_since_slot = 0.0
+    
+    def reset(self):
+        self.__init__()
+
+    # Returns True if the caller should request a preview for this training step
+    def on_training_step(self) -> bool:
+        self.step += 1
+        return self.step >= self.next_preview_step
+
+    # Called on a slot, with the current preview settings.  Returns True if a preview fits in the budget.
+    def take_slot(self, is_enabled: bool, budget_fraction: float, min_interval: float) -> bool:
+        now = perf_counter()
+
+        if self.last_slot_time is not None:
+            elapsed = now - self.last_slot_time
+            n_steps = self.step - self.last_slot_step
+            if n_steps > 0:
+                self.step_time = ema(self.step_time, elapsed / n_steps)
+            
+            if elapsed > 0.0:
+                training_preview_stats.preview_time_fraction = ema(
+                    training_preview_stats.preview_time_fraction,
+                    min(self.preview_time_since_slot / elapsed, 1.0)
+                )
+
+            self.tokens += budget_fraction * elapsed
+
+        self.last_slot_step = self.step
+        self.last_slot_time = now
+        self.preview_time_since_slot = 0.0
+
+        # the first preview is free, it measures the preview cost
+        cost = 0.0 if self.preview_cost is None else self.preview_cost
+        self.tokens = min(self.tokens, PREVIEW_SCHEDULER_MAX_TOKENS * max(cost, min_interval * budget_fraction))
+
+        should_preview = is_enabled and self.tokens >= cost
+
+        # seconds until the next slot
+        wait_time = min_interval
+        if is_enabled and budget_fraction > 0.0:
+            tokens_left = self.tokens - cost if should_preview else self.tokens
+            wait_time = max(wait_time, (cost - tokens_left) / budget_fraction)
+        
+        step_time = self.step_time or 0.0
+        n_steps = 1 if step_time <= 0.0 else max(1, math.ceil(wait_time / step_time))
+        self.next_preview_step = self.step + n_steps
+
+        training_preview_stats.step_time = step_time
+        training_preview_stats.preview_cost = cost
+        training_preview_stats.steps_until_preview = n_steps
+
+        return should_preview
+
+    # Every preview spends tokens, including the ones requested by the viewport
+    def on_preview_requested(self):
+        self.preview_request_time = perf_counter()
+    
+    def on_preview_complete(self):
+        if self.preview_request_time is None:
+            return
+        
+        cost = perf_counter() - self.preview_request_time
+        self.preview_request_time = None
+
+        self.preview_cost = ema(self.preview_cost, cost)
+        self.preview_time_since_slot += cost
+        self.tokens -= cost
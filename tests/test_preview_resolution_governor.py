@@ -0,0 +1,62 @@
+import importlib.util
+import sys
+import types
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# preview_resolution_governor.py only needs two constants, they are provided by a fake module.
+# The repository root is the addon package itself, run with: python -m unittest discover -s tests
+
+MODULE_PATH = Path(__file__).resolve().parent.parent / "renderer" / "preview_resolution_governor.py"
+
+def load_preview_resolution_governor():
+    fake_modules = {
+        "turbo_nerf.constants.renderer": types.SimpleNamespace(PREVIEW_LATENCY_SMOOTHING=0.5, PREVIEW_MOTION_SETTLE_TIME=60.0),
+    }
+
+    with mock.patch.dict(sys.modules, fake_modules):
+        spec = importlib.util.spec_from_file_location("preview_resolution_governor", MODULE_PATH)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+
+    return module
+
+prg = load_preview_resolution_governor()
+
+class PreviewResolutionGovernorTest(unittest.TestCase):
+    def setUp(self):
+        self.governor = prg.PreviewResolutionGovernor()
+        self.governor.set_target(target_frame_time=0.01, min_scale=0.1)
+        self.governor.notify_motion()
+
+    def test_full_resolution_when_still(self):
+        self.governor.last_motion_time = None
+        self.governor.add_latency_sample(1.0)
+        self.assertEqual(self.governor.get_scale(), 1.0)
+
+    def test_get_scale_does_not_change_scale(self):
+        self.governor.add_latency_sample(1.0)
+        scale = self.governor.get_scale()
+
+        for _ in range(10):
+            self.assertEqual(self.governor.get_scale(), scale)
+
+    def test_scale_moves_once_per_sample(self):
+        self.governor.add_latency_sample(1.0)
+        first_scale = self.governor.get_scale()
+        self.assertAlmostEqual(first_scale, 0.55)
+
+        self.governor.add_latency_sample(1.0)
+        self.assertLess(self.governor.get_scale(), first_scale)
+
+    def test_min_scale(self):
+        for _ in range(20):
+            self.governor.add_latency_sample(100.0)
+        self.assertAlmostEqual(self.governor.get_scale(), 0.1)
+
+        self.governor.set_target(target_frame_time=0.01, min_scale=0.5)
+        self.assertAlmostEqual(self.governor.get_scale(), 0.5)
+
+if __name__ == "__main__":
+    unittest.main()
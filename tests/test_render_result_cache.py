@@ -0,0 +1,101 @@
+import importlib.util
+import sys
+import types
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+
+# render_result_cache.py needs Blender and PyTurboNeRF, the parts the cache key touches are replaced with small fakes.
+# The repository root is the addon package itself, run with: python -m unittest discover -s tests
+
+MODULE_PATH = Path(__file__).resolve().parent.parent / "renderer" / "render_result_cache.py"
+
+class FakeBoundingBox:
+    def __init__(self, size: float = 16.0):
+        (self.min_x, self.min_y, self.min_z) = (-0.5 * size,) * 3
+        (self.max_x, self.max_y, self.max_z) = (0.5 * size,) * 3
+
+class FakeTransform4f:
+    def __init__(self, matrix):
+        self.matrix = np.array(matrix, dtype=np.float64)
+
+    def __array__(self, dtype=None, copy=None):
+        return self.matrix if dtype is None else self.matrix.astype(dtype)
+
+class FakeCamera:
+    def __init__(self):
+        self.resolution = (64, 48)
+        self.near = 0.1
+        self.far = 100.0
+        self.focal_length = (50.0, 50.0)
+        self.principal_point = (32.0, 24.0)
+        self.shift = (0.0, 0.0)
+        self.transform = FakeTransform4f(np.eye(4))
+        self.dist_params = types.SimpleNamespace(k1=0.0, k2=0.0, k3=0.0, p1=0.0, p2=0.0)
+
+class FakeNeRFObject(dict):
+    tn_nerf_spatial_effects_list = []
+
+def load_render_result_cache(nerf: types.SimpleNamespace):
+    tn = types.SimpleNamespace(BoundingBox=FakeBoundingBox, Transform4f=FakeTransform4f, Camera=FakeCamera, NeRF=object)
+    bpy = types.ModuleType("bpy")
+    bpy.types = types.SimpleNamespace(Object=object, PropertyGroup=object)
+
+    fake_modules = {
+        "bpy": bpy,
+        "turbo_nerf.blender_utility.logging_utility": types.SimpleNamespace(log_report=lambda *args: None),
+        "turbo_nerf.constants": types.SimpleNamespace(NERF_PATH_ID="snapshot_path"),
+        "turbo_nerf.effects.utils.common": types.SimpleNamespace(EFFECT_TYPES_BY_ID={}),
+        "turbo_nerf.renderer.renderables": types.SimpleNamespace(get_nerf_transform=lambda obj: FakeTransform4f(np.eye(4))),
+        "turbo_nerf.utility.nerf_manager": types.SimpleNamespace(NeRFManager=types.SimpleNamespace(
+            get_nerf_for_obj=lambda obj: nerf,
+            get_bridge_object_property=lambda obj_name, prop_name: 0.005,
+        )),
+        "turbo_nerf.utility.pylib": types.SimpleNamespace(PyTurboNeRF=tn),
+    }
+
+    with mock.patch.dict(sys.modules, fake_modules):
+        spec = importlib.util.spec_from_file_location("render_result_cache", MODULE_PATH)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    
+    return module
+
+class RenderCacheKeyTest(unittest.TestCase):
+    def setUp(self):
+        self.nerf = types.SimpleNamespace(training_step=1000, dataset=None, render_bbox=FakeBoundingBox())
+        self.rrc = load_render_result_cache(self.nerf)
+        self.nerf_obj = FakeNeRFObject(snapshot_path="/shots/shot.turbo")
+        self.settings = types.SimpleNamespace(render_mode='FULL', progressive_max_scale=1.0)
+
+    def get_key(self) -> str:
+        return self.rrc.get_render_cache_key(FakeCamera(), [self.nerf_obj], self.settings, [(0, 0), (64, 48)])
+
+    def test_key_is_stable(self):
+        self.assertEqual(self.get_key(), self.get_key())
+
+    def test_crop_changes_key(self):
+        key = self.get_key()
+
+        self.nerf.render_bbox = FakeBoundingBox()
+        self.nerf.render_bbox.max_z = 2.0
+
+        self.assertNotEqual(self.get_key(), key)
+
+    def test_training_step_changes_key(self):
+        key = self.get_key()
+        self.nerf.training_step += 1
+        self.assertNotEqual(self.get_key(), key)
+
+    def test_unidentifiable_nerf_is_not_cached(self):
+        self.nerf_obj = FakeNeRFObject()
+        self.assertIsNone(self.get_key())
+
+    def test_unknown_type_is_rejected(self):
+        with self.assertRaises(TypeError):
+            self.rrc.hash_value(self.rrc.hashlib.sha256(), object())
+
+if __name__ == "__main__":
+    unittest.main()
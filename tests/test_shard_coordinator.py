@@ -0,0 +1,133 @@
+import importlib.util
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# shard_coordinator.py and stub_render_worker.py only use the standard library,
+# so they are loaded straight from their files instead of through the addon package (which needs Blender).
+# The repository root is the addon package itself, run with: python -m unittest discover -s tests
+
+BATCH_DIR = Path(__file__).resolve().parent.parent / "renderer" / "batch"
+STUB_WORKER = BATCH_DIR / "stub_render_worker.py"
+
+def load_shard_coordinator():
+    spec = importlib.util.spec_from_file_location("shard_coordinator", BATCH_DIR / "shard_coordinator.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+sc = load_shard_coordinator()
+
+class ShardCoordinatorTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.output_dir = Path(self.tmp_dir.name)
+        self.manifest_path = self.output_dir / sc.MANIFEST_FILE_NAME
+        self.messages = []
+    
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+    
+    def run_coordinator(self, n_frames: int, *worker_args: str, n_workers: int = 2, shard_size: int = 4, max_attempts: int = 3) -> int:
+        manifest = sc.ShardManifest.load_or_create(self.manifest_path, n_frames)
+        coordinator = sc.ShardCoordinator(
+            worker_command=[sys.executable, str(STUB_WORKER), "--output-dir", str(self.output_dir), "--frame-time", "0.001", *worker_args],
+            manifest=manifest,
+            n_workers=n_workers,
+            shard_size=shard_size,
+            max_attempts=max_attempts,
+            log=self.messages.append,
+        )
+        return coordinator.run()
+
+    def load_manifest_frames(self) -> dict[int, str]:
+        with open(self.manifest_path, 'r') as f:
+            return {int(i): status for i, status in json.load(f)["frames"].items()}
+
+    def test_renders_all_frames(self):
+        n_failed = self.run_coordinator(10)
+
+        self.assertEqual(n_failed, 0)
+        self.assertEqual(self.load_manifest_frames(), {i: sc.FRAME_STATUS_DONE for i in range(10)})
+        for i in range(10):
+            self.assertTrue((self.output_dir / f"{i:05d}.png").exists())
+
+    def test_crashing_frame_only_fails_itself(self):
+        # frame 1 crashes every worker it is given to, the frames queued behind it must still be rendered
+        n_failed = self.run_coordinator(8, "--crash-frames", "1", n_workers=1, max_attempts=3)
+
+        frames = self.load_manifest_frames()
+        self.assertEqual(n_failed, 1)
+        self.assertEqual(frames[1], sc.FRAME_STATUS_FAILED)
+        self.assertEqual([i for i, s in frames.items() if s == sc.FRAME_STATUS_DONE], [0, 2, 3, 4, 5, 6, 7])
+        self.assertIn("frame 1: failed 3 times, giving up", self.messages)
+
+    def test_random_crashes_are_retried(self):
+        n_failed = self.run_coordinator(24, "--crash-probability", "0.2", n_workers=3, max_attempts=100)
+
+        self.assertEqual(n_failed, 0)
+        self.assertEqual(len(self.load_manifest_frames()), 24)
+
+    def test_resumes_from_manifest(self):
+        self.run_coordinator(8, "--crash-frames", "5", max_attempts=1)
+        self.assertEqual(self.load_manifest_frames()[5], sc.FRAME_STATUS_FAILED)
+
+        # a restarted coordinator skips finished frames and gives failed ones another chance
+        self.messages = []
+        n_failed = self.run_coordinator(8)
+
+        self.assertEqual(n_failed, 0)
+        self.assertIn("7 of 8 frames already done, 1 to render with 2 workers", self.messages)
+        self.assertEqual(self.load_manifest_frames(), {i: sc.FRAME_STATUS_DONE for i in range(8)})
+
+    def test_existing_output_is_reported_done(self):
+        # the image is on disk, but the manifest does not know, as if a worker died between writing and reporting it
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        (self.output_dir / "00002.png").touch()
+
+        n_failed = self.run_coordinator(6, max_attempts=1)
+
+        self.assertEqual(n_failed, 0)
+        self.assertEqual(self.load_manifest_frames(), {i: sc.FRAME_STATUS_DONE for i in range(6)})
+        self.assertFalse(any("giving up" in msg for msg in self.messages))
+
+    def test_clean_exit_requeues_without_attempt(self):
+        manifest = sc.ShardManifest.load_or_create(self.manifest_path, 4)
+        coordinator = sc.ShardCoordinator(worker_command=[], manifest=manifest, n_workers=1, shard_size=4, log=self.messages.append)
+        worker = coordinator.workers[0]
+        worker.shard = [0, 1, 2]
+        worker.done = {0}
+        manifest.mark(0, sc.FRAME_STATUS_DONE)
+
+        coordinator.on_worker_exit(worker, 0)
+
+        self.assertEqual(coordinator.pending_shards, [[1, 2]])
+        self.assertEqual(manifest.attempts, {})
+
+        # a crash does use up an attempt, only for the frame the worker stopped at
+        worker.shard = [1, 2]
+        worker.done = set()
+        coordinator.pending_shards = []
+        coordinator.on_worker_exit(worker, 1)
+
+        self.assertEqual(coordinator.pending_shards, [[1, 2]])
+        self.assertEqual(manifest.attempts, {1: 1})
+
+    def test_frame_without_output_is_not_done(self):
+        manifest = sc.ShardManifest.load_or_create(self.manifest_path, 4)
+        coordinator = sc.ShardCoordinator(worker_command=[], manifest=manifest, n_workers=1, log=self.messages.append)
+        worker = coordinator.workers[0]
+        worker.shard = [0, 1]
+
+        self.assertFalse(coordinator.on_frame_done(worker, 0, self.output_dir / "missing.png"))
+        self.assertFalse(manifest.is_done(0))
+
+        output_path = self.output_dir / "00001.png"
+        output_path.touch()
+        self.assertTrue(coordinator.on_frame_done(worker, 1, output_path))
+        self.assertTrue(manifest.is_done(1))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,36 @@
+import bpy
+
+from turbo_nerf.constants.renderer import CAMERA_INTRINSICS_CACHE_MAX_ENTRIES
+
+# Memoizes values derived from a camera datablock's lens, sensor and shift settings (focal lengths, shift scales).
+# Entries are grouped per datablock and dropped when the depsgraph reports that datablock as updated.
+# Animated or driven datablocks can change without an update we see, so they always bypass the cache.
+
+class CameraIntrinsicsCache:
+    def __init__(self):
+        self.entries: dict[int, dict] = {}
+    
+    def get(self, cam_data: bpy.types.Camera, key: tuple, compute):
+        if cam_data.animation_data is not None:
+            return compute()
+        
+        cam_entries = self.entries.setdefault(cam_data.original.as_pointer(), {})
+
+        if key in cam_entries:
+            return cam_entries[key]
+        
+        # the viewport asks for a new resolution whenever the region or preview scale changes
+        if len(cam_entries) >= CAMERA_INTRINSICS_CACHE_MAX_ENTRIES:
+            cam_entries.clear()
+        
+        value = compute()
+        cam_entries[key] = value
+        return value
+    
+    def invalidate(self, cam_data: bpy.types.Camera):
+        self.entries.pop(cam_data.original.as_pointer(), None)
+    
+    def clear(self):
+        self.entries.clear()
+
+camera_intrinsics_cache = CameraIntrinsicsCache()
@@ -4,20 +4,37 @@ import numpy as np
 DEFAULT_NGP_SCALE = 1.0
 DEFAULT_NGP_ORIGIN = np.array([0.0, 0.0, 0.0])
 
-def blender_matrix_to_nerf(bl_matrix: np.array, offset, origin, scale) -> np.array:
-    result = np.array(bl_matrix)
-    result[:, 1:3] *= -1
-    result[:3, 3] = (result[:3, 3] + offset) * scale + origin
-    result[:3, :] = np.roll(result[:3, :], -1, axis=0)
+# Stacked conversions, these take arrays of shape (..., 4, 4) so thousands of matrices convert in one call
+
+def blender_matrices_to_nerf(bl_matrices: np.array, offset, origin, scale) -> np.array:
+    result = np.array(bl_matrices, dtype=np.float64)
+    result[..., :, 1:3] *= -1
+    result[..., :3, 3] = (result[..., :3, 3] + offset) * scale + origin
+    result[..., :3, :] = np.roll(result[..., :3, :], -1, axis=-2)
     return result
 
-def nerf_matrix_to_blender(nerf_matrix: np.array, offset, origin, scale) -> np.array:
-    result = np.array(nerf_matrix)
-    result[:3, :] = np.roll(result[:3, :], 1, axis=0)
-    result[:3, 3] = (result[:3, 3] - origin) / scale - offset
-    result[:, 1:3] *= -1
+def nerf_matrices_to_blender(nerf_matrices: np.array, offset, origin, scale) -> np.array:
+    result = np.array(nerf_matrices, dtype=np.float64)
+    result[..., :3, :] = np.roll(result[..., :3, :], 1, axis=-2)
+    result[..., :3, 3] = (result[..., :3, 3] - origin) / scale - offset
+    result[..., :, 1:3] *= -1
     return result
 
+# points of shape (..., 3)
+def bl2nerf_positions(
+        xyz: np.array,
+        origin = DEFAULT_NGP_ORIGIN,
+        scale = DEFAULT_NGP_SCALE
+    ) -> np.array:
+    xyz_cycled = np.asarray(xyz, dtype=np.float64)[..., [1, 2, 0]]
+    return scale * xyz_cycled + origin
+
+def blender_matrix_to_nerf(bl_matrix: np.array, offset, origin, scale) -> np.array:
+    return blender_matrices_to_nerf(bl_matrix, offset, origin, scale)
+
+def nerf_matrix_to_blender(nerf_matrix: np.array, offset, origin, scale) -> np.array:
+    return nerf_matrices_to_blender(nerf_matrix, offset, origin, scale)
+
 def nerf2bl_mat(bl_matrix: mathutils.Matrix, offset = np.array([0.0, 0.0, 0.0]), origin = DEFAULT_NGP_ORIGIN, scale = DEFAULT_NGP_SCALE) -> np.array:
     return nerf_matrix_to_blender(np.array(bl_matrix), offset, origin, scale)
 
@@ -29,8 +46,7 @@ def bl2nerf_pos(
         origin = DEFAULT_NGP_ORIGIN,
         scale = DEFAULT_NGP_SCALE
     ) -> np.array:
-    xyz_cycled = np.array([xyz[1], xyz[2], xyz[0]])
-    return scale * xyz_cycled + origin
+    return bl2nerf_positions(xyz, origin, scale)
 
 def clamp(x, min, max):
     if x < min:
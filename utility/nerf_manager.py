@@ -40,6 +40,11 @@ class NeRFManager():
 
         return cls._bridge
 
+    # Older versions of PyTurboNeRF only render color
+    @classmethod
+    def can_render_depth(cls):
+        return hasattr(cls.bridge(), "get_render_depth")
+
     @classmethod
     def import_dataset(cls, dataset_path):
         dataset = tn.Dataset(file_path=dataset_path)
@@ -1,7 +1,13 @@
 import bpy
 import math
+import mathutils
 import numpy as np
 
+from bpy_extras.view3d_utils import location_3d_to_region_2d
+
+from turbo_nerf.blender_utility.logging_utility import log_report
+from turbo_nerf.constants.renderer import RENDER_CAM_FAR_DEFAULT, RENDER_CAM_PARALLEL_RAYS_DISTANCE
+from turbo_nerf.utility.camera_intrinsics_cache import camera_intrinsics_cache
 from turbo_nerf.utility.pylib import PyTurboNeRF as tn
 
 from turbo_nerf.constants import (
@@ -20,9 +26,28 @@ from turbo_nerf.constants import (
     CAMERA_P1_ID,
     CAMERA_P2_ID,
     CAMERA_SHOW_IMAGE_PLANES_ID,
+    RENDER_CAM_NEAR_ID,
+    RENDER_CAM_QUAD_HEX_BACK_SENSOR_SIZE_ID,
+    RENDER_CAM_QUAD_HEX_FRONT_SENSOR_SIZE_ID,
+    RENDER_CAM_QUAD_HEX_SENSOR_LENGTH_ID,
+    RENDER_CAM_SENSOR_HEIGHT_ID,
+    RENDER_CAM_SENSOR_WIDTH_ID,
+    RENDER_CAM_SPHERICAL_QUAD_CURVATURE_ID,
+    RENDER_CAM_TYPE_ID,
+    RENDER_CAM_TYPE_PERSPECTIVE,
+    RENDER_CAM_TYPE_QUADRILATERAL_HEXAHEDRON,
+    RENDER_CAM_TYPE_SPHERICAL_QUADRILATERAL,
 )
 
+# focal length in pixels, memoized per camera datablock and output resolution
 def bl2nerf_fl(cam_data: bpy.types.Camera, output_dimensions: tuple[int, int]) -> float:
+    return camera_intrinsics_cache.get(
+        cam_data,
+        ("fl", *output_dimensions),
+        lambda: compute_bl2nerf_fl(cam_data, output_dimensions),
+    )
+
+def compute_bl2nerf_fl(cam_data: bpy.types.Camera, output_dimensions: tuple[int, int]) -> float:
     (nerf_w, nerf_h) = output_dimensions
     # calculate focal len
     bl_sw = cam_data.sensor_width
@@ -58,11 +83,37 @@ def bl2nerf_fl(cam_data: bpy.types.Camera, output_dimensions: tuple[int, int]) -
 
     return px_f
 
-def bl2nerf_shift(context: bpy.types.Context, cam_data: bpy.types.Camera, fl_x: float, img_dims: tuple[int, int]):
+# lens shift defaults to the camera's own, multiview renders pass the per-view shift_x from the render engine
+def bl2nerf_shift(
+    context: bpy.types.Context,
+    cam_data: bpy.types.Camera,
+    fl_x: float,
+    img_dims: tuple[int, int],
+    shift: tuple[float, float] = None,
+):
+    if shift is None:
+        shift = (cam_data.shift_x, cam_data.shift_y)
+    
     render = context.scene.render
-    out_res_x = render.resolution_x
-    out_res_y = render.resolution_y
-    cam_fl = bl2nerf_fl(cam_data, (out_res_x, out_res_y))
+    out_res = (render.resolution_x, render.resolution_y)
+
+    (u, v) = camera_intrinsics_cache.get(
+        cam_data,
+        ("shift", fl_x, *out_res, *img_dims),
+        lambda: compute_bl2nerf_shift_scale(cam_data, fl_x, out_res, img_dims),
+    )
+    
+    return u * shift[0], v * shift[1]
+
+# the factors that convert blender's lens shift into a fraction of the image size
+def compute_bl2nerf_shift_scale(
+    cam_data: bpy.types.Camera,
+    fl_x: float,
+    out_res: tuple[int, int],
+    img_dims: tuple[int, int],
+) -> tuple[float, float]:
+    (out_res_x, out_res_y) = out_res
+    cam_fl = bl2nerf_fl(cam_data, out_res)
 
     cam_angle_x = 2.0 * math.atan2(0.5 * out_res_x, cam_fl)
     
@@ -78,7 +129,7 @@ def bl2nerf_shift(context: bpy.types.Context, cam_data: bpy.types.Camera, fl_x:
         u = cam_res_y / img_dims[0]
         v = cam_res_y / img_dims[1]
     
-    return u * cam_data.shift_x, v * cam_data.shift_y
+    return u, v
 
 # converts aperture fstop to aperture size
 def bl2nerf_fstop2size(fstop: float) -> float:
@@ -132,40 +183,76 @@ def bl2nerf_cam_regionview3d(
         transform=bl_camera_matrix.from_nerf()
     )
 
-def bl2nerf_cam_train(cam_obj: bpy.types.Object, relative_to: bpy.types.Object = None):
-    c2w: np.ndarray
-    if relative_to is None:
-        c2w = np.array(cam_obj.matrix_world)
-    else:
-        c2w = np.array(relative_to.matrix_world.inverted() @ cam_obj.matrix_world)
-
-    transform = tn.Transform4f(c2w).from_nerf()
-
-    dist_params = tn.DistortionParams(
-        k1=cam_obj[CAMERA_K1_ID],
-        k2=cam_obj[CAMERA_K2_ID],
-        k3=cam_obj[CAMERA_K3_ID],
-        p1=cam_obj[CAMERA_P1_ID],
-        p2=cam_obj[CAMERA_P2_ID]
-    )
-
-    cam = tn.Camera(
-        resolution=(cam_obj[CAMERA_IMAGE_W_ID], cam_obj[CAMERA_IMAGE_H_ID]),
-        near=cam_obj[CAMERA_NEAR_ID],
-        far=cam_obj[CAMERA_FAR_ID],
-        focal_length=(cam_obj[CAMERA_FL_X_ID], cam_obj[CAMERA_FL_Y_ID]),
-        shift=(0, 0),
-        principal_point=(cam_obj[CAMERA_CX_ID], cam_obj[CAMERA_CY_ID]),
-        transform=transform,
-        dist_params=dist_params
-    )
+# per-camera ID properties read by bl2nerf_cams_train, in the order of the intrinsics array columns
+TRAIN_CAM_INTRINSIC_IDS = (
+    CAMERA_IMAGE_W_ID,
+    CAMERA_IMAGE_H_ID,
+    CAMERA_NEAR_ID,
+    CAMERA_FAR_ID,
+    CAMERA_FL_X_ID,
+    CAMERA_FL_Y_ID,
+    CAMERA_CX_ID,
+    CAMERA_CY_ID,
+    CAMERA_K1_ID,
+    CAMERA_K2_ID,
+    CAMERA_K3_ID,
+    CAMERA_P1_ID,
+    CAMERA_P2_ID,
+)
 
-    cam.show_image_planes = cam_obj[CAMERA_SHOW_IMAGE_PLANES_ID]
+# converts many training cameras at once
+# intrinsics are gathered into one array and all transforms are made relative with a single stacked matmul
+def bl2nerf_cams_train(cam_objs: list[bpy.types.Object], relative_to: bpy.types.Object = None) -> list[tn.Camera]:
+    n_cams = len(cam_objs)
+    if n_cams == 0:
+        return []
+    
+    c2w = np.empty((n_cams, 4, 4), dtype=np.float64)
+    intrinsics = np.empty((n_cams, len(TRAIN_CAM_INTRINSIC_IDS)), dtype=np.float64)
+    show_image_planes = [False] * n_cams
+
+    for i, cam_obj in enumerate(cam_objs):
+        c2w[i] = cam_obj.matrix_world
+        intrinsics[i] = [cam_obj[prop_id] for prop_id in TRAIN_CAM_INTRINSIC_IDS]
+        show_image_planes[i] = cam_obj[CAMERA_SHOW_IMAGE_PLANES_ID]
+
+    if relative_to is not None:
+        c2w = np.array(relative_to.matrix_world.inverted()) @ c2w
+
+    cams = []
+    for i in range(n_cams):
+        (w, h, near, far, fl_x, fl_y, cx, cy, k1, k2, k3, p1, p2) = intrinsics[i].tolist()
+
+        cam = tn.Camera(
+            resolution=(int(w), int(h)),
+            near=near,
+            far=far,
+            focal_length=(fl_x, fl_y),
+            shift=(0, 0),
+            principal_point=(cx, cy),
+            transform=tn.Transform4f(c2w[i]).from_nerf(),
+            dist_params=tn.DistortionParams(k1=k1, k2=k2, k3=k3, p1=p1, p2=p2)
+        )
+
+        cam.show_image_planes = show_image_planes[i]
+        cams.append(cam)
+    
+    return cams
 
-    return cam
+def bl2nerf_cam_train(cam_obj: bpy.types.Object, relative_to: bpy.types.Object = None):
+    return bl2nerf_cams_train([cam_obj], relative_to=relative_to)[0]
 
-def bl2nerf_cam_perspective(context: bpy.types.Context, cam_obj: bpy.types.Object, img_dims: tuple[int, int]):
-    view_matrix = np.array(cam_obj.matrix_world)
+def bl2nerf_cam_perspective(
+    context: bpy.types.Context,
+    cam_obj: bpy.types.Object,
+    img_dims: tuple[int, int],
+    matrix_world = None,
+    shift_x: float = None,
+):
+    if matrix_world is None:
+        matrix_world = cam_obj.matrix_world
+    
+    view_matrix = np.array(matrix_world)
 
     bl_camera_matrix = tn.Transform4f(view_matrix)
 
@@ -176,7 +263,10 @@ def bl2nerf_cam_perspective(context: bpy.types.Context, cam_obj: bpy.types.Objec
     fl_x = bl2nerf_fl(cam_data, img_dims)
     fl_y = fl_x
 
-    shift_x, shift_y = bl2nerf_shift(context, cam_data, fl_x, img_dims)
+    if shift_x is None:
+        shift_x = cam_data.shift_x
+    
+    shift_x, shift_y = bl2nerf_shift(context, cam_data, fl_x, img_dims, (shift_x, cam_data.shift_y))
 
     return tn.Camera(
         resolution=img_dims,
@@ -188,6 +278,136 @@ def bl2nerf_cam_perspective(context: bpy.types.Context, cam_obj: bpy.types.Objec
         transform=bl_camera_matrix.from_nerf()
     )
 
+# TurboNeRF cameras are pinholes, so the quadrilateral rigs are decoded into the pinhole camera their rays pass through.
+# The geometry comes straight from the rig's properties, the per-node drivers are not evaluated.
+# Rigs with parallel rays are rendered with a pinhole far behind their sensor (see RENDER_CAM_PARALLEL_RAYS_DISTANCE).
+# Rigs a pinhole cannot render (converging rays, curved spherical sensors) are rejected, get_render_cam_error says why.
+
+# Returns a pinhole whose rays are parallel to the rig's axis to within RENDER_CAM_PARALLEL_RAYS_DISTANCE,
+# sensor_z is where the sensor sits along the rig's z axis, near is measured from there
+def get_parallel_rays_camera(
+    cam_obj: bpy.types.Object,
+    img_dims: tuple[int, int],
+    sensor_size: tuple[float, float],
+    sensor_z: float,
+    near: float,
+) -> tn.Camera:
+    distance = RENDER_CAM_PARALLEL_RAYS_DISTANCE * max(sensor_size)
+    matrix_world = np.array(cam_obj.matrix_world) @ np.array(mathutils.Matrix.Translation((0.0, 0.0, sensor_z + distance)))
+
+    return tn.Camera(
+        resolution=img_dims,
+        near=distance + near,
+        far=distance + RENDER_CAM_FAR_DEFAULT,
+        focal_length=(img_dims[0] * distance / sensor_size[0], img_dims[1] * distance / sensor_size[1]),
+        shift=(0.0, 0.0),
+        principal_point=(0.5 * img_dims[0], 0.5 * img_dims[1]),
+        transform=tn.Transform4f(matrix_world).from_nerf()
+    )
+
+def get_quadrilateral_hexahedron_error(cam_obj: bpy.types.Object) -> str | None:
+    front_size = np.array(cam_obj[RENDER_CAM_QUAD_HEX_FRONT_SENSOR_SIZE_ID], dtype=np.float64)
+    back_size = np.array(cam_obj[RENDER_CAM_QUAD_HEX_BACK_SENSOR_SIZE_ID], dtype=np.float64)
+    sensor_length = float(cam_obj[RENDER_CAM_QUAD_HEX_SENSOR_LENGTH_ID])
+
+    if sensor_length <= 0.0:
+        return "the sensor length must be positive"
+    
+    if np.any(back_size < 0.0) or np.any(front_size <= 0.0):
+        return "sensor sizes must be positive"
+    
+    if np.allclose(front_size, back_size):
+        return None
+    
+    if np.any(front_size < back_size):
+        return "converging rays (front face smaller than the back face) cannot be rendered, TurboNeRF only has pinhole cameras"
+    
+    if np.any(np.isclose(front_size, back_size)):
+        return "rays must either be parallel on both axes, or spread out on both axes"
+    
+    # a pinhole only exists if the rays of both axes cross the camera axis at the same point
+    apex_dist = back_size / (front_size - back_size)
+    if not math.isclose(apex_dist[0], apex_dist[1], rel_tol=1e-4, abs_tol=1e-6):
+        return "the front and back faces must have the same aspect ratio, so all rays meet in one point"
+    
+    return None
+
+# rays run from the back face to the front face, z- is forward in blender
+def bl2nerf_cam_quadrilateral_hexahedron(context: bpy.types.Context, cam_obj: bpy.types.Object, img_dims: tuple[int, int]):
+    error = get_quadrilateral_hexahedron_error(cam_obj)
+    if error is not None:
+        log_report("ERROR", f"{cam_obj.name}: {error}")
+        return None
+    
+    front_size = np.array(cam_obj[RENDER_CAM_QUAD_HEX_FRONT_SENSOR_SIZE_ID], dtype=np.float64)
+    back_size = np.array(cam_obj[RENDER_CAM_QUAD_HEX_BACK_SENSOR_SIZE_ID], dtype=np.float64)
+    sensor_length = float(cam_obj[RENDER_CAM_QUAD_HEX_SENSOR_LENGTH_ID])
+    near = cam_obj[RENDER_CAM_NEAR_ID]
+
+    # equal faces, the rays are parallel (orthographic)
+    if np.allclose(front_size, back_size):
+        return get_parallel_rays_camera(cam_obj, img_dims, tuple(back_size), 0.5 * sensor_length, near)
+
+    # how much the rays spread out per unit of sensor length, on each axis
+    spread = front_size - back_size
+
+    # the rays cross the camera axis behind the back face, the pinhole sits there
+    apex_dist = float(sensor_length * back_size[0] / spread[0])
+    apex_z = 0.5 * sensor_length + apex_dist
+
+    matrix_world = np.array(cam_obj.matrix_world) @ np.array(mathutils.Matrix.Translation((0.0, 0.0, apex_z)))
+
+    fl_x = float(img_dims[0] * sensor_length / spread[0])
+    fl_y = float(img_dims[1] * sensor_length / spread[1])
+
+    return tn.Camera(
+        resolution=img_dims,
+        near=apex_dist + near,
+        far=RENDER_CAM_FAR_DEFAULT,
+        focal_length=(fl_x, fl_y),
+        shift=(0.0, 0.0),
+        principal_point=(0.5 * img_dims[0], 0.5 * img_dims[1]),
+        transform=tn.Transform4f(matrix_world).from_nerf()
+    )
+
+def get_spherical_quadrilateral_error(cam_obj: bpy.types.Object) -> str | None:
+    if float(cam_obj[RENDER_CAM_SENSOR_WIDTH_ID]) <= 0.0 or float(cam_obj[RENDER_CAM_SENSOR_HEIGHT_ID]) <= 0.0:
+        return "the sensor size must be positive"
+    
+    # nodes on a curved sensor are spaced evenly in angle, which no pinhole can reproduce
+    if float(cam_obj[RENDER_CAM_SPHERICAL_QUAD_CURVATURE_ID]) != 0.0:
+        return "curved sensors are equiangular projections, TurboNeRF can only render them with a curvature of 0"
+    
+    return None
+
+# without curvature the nodes lie on a flat sensor and all look straight ahead
+def bl2nerf_cam_spherical_quadrilateral(context: bpy.types.Context, cam_obj: bpy.types.Object, img_dims: tuple[int, int]):
+    error = get_spherical_quadrilateral_error(cam_obj)
+    if error is not None:
+        log_report("ERROR", f"{cam_obj.name}: {error}")
+        return None
+    
+    sensor_size = (float(cam_obj[RENDER_CAM_SENSOR_WIDTH_ID]), float(cam_obj[RENDER_CAM_SENSOR_HEIGHT_ID]))
+
+    return get_parallel_rays_camera(cam_obj, img_dims, sensor_size, 0.0, cam_obj[RENDER_CAM_NEAR_ID])
+
+CAM_TYPE_ERRORS = {
+    RENDER_CAM_TYPE_QUADRILATERAL_HEXAHEDRON: get_quadrilateral_hexahedron_error,
+    RENDER_CAM_TYPE_SPHERICAL_QUADRILATERAL: get_spherical_quadrilateral_error,
+}
+
+# Returns why a camera object cannot be rendered by TurboNeRF, or None if it can
+def get_render_cam_error(cam_obj: bpy.types.Object) -> str | None:
+    get_error = CAM_TYPE_ERRORS.get(cam_obj.get(RENDER_CAM_TYPE_ID))
+    if get_error is None:
+        return None
+    
+    error = get_error(cam_obj)
+    if error is None:
+        return None
+    
+    return f"{cam_obj.name}: {error}"
+
 def bl2nerf_cam(
     source: bpy.types.RegionView3D | bpy.types.Object,
     img_dims: tuple[int, int],
@@ -203,8 +423,8 @@ def bl2nerf_cam(
     elif isinstance(source, bpy.types.Object):
         camera_model = CAM_TYPE_BLENDER_PERSPECTIVE
         
-        # elif RENDER_CAM_TYPE_ID in source:
-        #     camera_model = source[RENDER_CAM_TYPE_ID]
+        if RENDER_CAM_TYPE_ID in source:
+            camera_model = source[RENDER_CAM_TYPE_ID]
         
         if camera_model not in CAM_TYPE_DECODERS:
             camera_model = CAM_TYPE_BLENDER_PERSPECTIVE
@@ -216,6 +436,27 @@ def bl2nerf_cam(
         print(f"INVALID CAMERA SOURCE: {source}")
         return None
 
+# converts one view of a multiview render, the render engine supplies the view's model matrix and shift_x
+def bl2nerf_cam_view(
+    context: bpy.types.Context,
+    cam_obj: bpy.types.Object,
+    img_dims: tuple[int, int],
+    model_matrix,
+    shift_x: float,
+) -> tn.Camera:
+    # the quadrilateral rigs have no stereo settings, every view sees the same camera
+    if cam_obj.type != 'CAMERA':
+        return bl2nerf_cam(cam_obj, img_dims, context)
+    
+    return bl2nerf_cam_perspective(context, cam_obj, img_dims, matrix_world=model_matrix, shift_x=shift_x)
+
+# names of the views blender expects in the render result when multiview is enabled
+def get_multiview_names(render: bpy.types.RenderSettings) -> list[str]:
+    if render.views_format == 'STEREO_3D':
+        return [view.name for view in render.views if view.name in ('left', 'right')]
+    
+    return [view.name for view in render.views if view.use]
+
 def camera_with_flipped_y(cam: tn.Camera) -> tn.Camera:
     yflip = np.array(cam.transform)
     yflip[:, 1] *= -1.0
@@ -235,6 +476,150 @@ def camera_with_flipped_y(cam: tn.Camera) -> tn.Camera:
         dist_params=cam.dist_params
     )
 
+# Returns a camera that only renders the pixels of the region that starts at offset and has the given dims.
+# Pixel coordinates are relative to cam, so for a y-flipped camera the offset is measured from the bottom.
+def camera_with_region(cam: tn.Camera, offset: tuple[int, int], dims: tuple[int, int]) -> tn.Camera:
+    (full_w, full_h) = cam.resolution
+    (x, y) = offset
+    (w, h) = dims
+
+    cx, cy = cam.principal_point
+
+    # shift is relative to the image size, so it needs to be rescaled to the region size
+    shift_x, shift_y = cam.shift
+    shift_x *= full_w / w
+    shift_y *= full_h / h
+
+    return tn.Camera(
+        resolution=dims,
+        near=cam.near,
+        far=cam.far,
+        focal_length=cam.focal_length,
+        principal_point=(cx - x, cy - y),
+        shift=(shift_x, shift_y),
+        transform=cam.transform,
+        dist_params=cam.dist_params
+    )
+
+# Returns a camera with the same field of view as cam, rendering at a different resolution
+def camera_with_resolution(cam: tn.Camera, dims: tuple[int, int]) -> tn.Camera:
+    (w, h) = cam.resolution
+    sx = dims[0] / w
+    sy = dims[1] / h
+
+    fl_x, fl_y = cam.focal_length
+    cx, cy = cam.principal_point
+
+    # shift is relative to the image size, so it stays the same
+    return tn.Camera(
+        resolution=dims,
+        near=cam.near,
+        far=cam.far,
+        focal_length=(fl_x * sx, fl_y * sy),
+        principal_point=(cx * sx, cy * sy),
+        shift=cam.shift,
+        transform=cam.transform,
+        dist_params=cam.dist_params
+    )
+
+# Scales image dimensions, never going below one pixel
+def get_scaled_dims(dims: tuple[int, int], scale: float) -> tuple[int, int]:
+    return (max(1, int(round(dims[0] * scale))), max(1, int(round(dims[1] * scale))))
+
+# Scales a pixel rectangle given as (offset, dims), keeping it inside the scaled image
+def get_scaled_region(
+    region: tuple[tuple[int, int], tuple[int, int]],
+    img_dims: tuple[int, int],
+    scale: float
+) -> tuple[tuple[int, int], tuple[int, int]]:
+    ((x, y), dims) = region
+    (img_w, img_h) = img_dims
+    (w, h) = get_scaled_dims(dims, scale)
+
+    x = min(int(x * scale), img_w - 1)
+    y = min(int(y * scale), img_h - 1)
+
+    return (x, y), (min(w, img_w - x), min(h, img_h - y))
+
+# Splits an image into tiles of at most tile_dims, row by row starting from the origin.
+# Returns a list of (offset, dims) tuples.
+def get_render_tiles(img_dims: tuple[int, int], tile_dims: tuple[int, int]) -> list[tuple[tuple[int, int], tuple[int, int]]]:
+    (img_w, img_h) = img_dims
+    (tile_w, tile_h) = tile_dims
+
+    tiles = []
+    for y in range(0, img_h, tile_h):
+        for x in range(0, img_w, tile_w):
+            w = min(tile_w, img_w - x)
+            h = min(tile_h, img_h - y)
+            tiles.append(((x, y), (w, h)))
+    
+    return tiles
+
+# Pixel rectangle of a render border given in fractions of img_dims, truncated the same way Blender does.
+# Coordinates start at the bottom left.  Returns (offset, dims).
+def get_border_region(
+    img_dims: tuple[int, int],
+    border_min: tuple[float, float],
+    border_max: tuple[float, float]
+) -> tuple[tuple[int, int], tuple[int, int]]:
+    (img_w, img_h) = img_dims
+
+    x_min = int(border_min[0] * img_w)
+    y_min = int(border_min[1] * img_h)
+    x_max = int(border_max[0] * img_w)
+    y_max = int(border_max[1] * img_h)
+
+    return (x_min, y_min), (max(1, x_max - x_min), max(1, y_max - y_min))
+
+# Returns the render border of a 3D viewport in region pixels as (offset, dims), or None if it has no render border.
+# Outside of camera view this is the viewport's own render region, in camera view it is the scene's border inside the camera frame.
+def get_view_render_border(
+    context: bpy.types.Context,
+    region: bpy.types.Region,
+    region_view_3d: bpy.types.RegionView3D
+) -> tuple[tuple[int, int], tuple[int, int]] | None:
+    img_dims = (region.width, region.height)
+
+    if region_view_3d.view_perspective != 'CAMERA':
+        view = context.space_data
+        if not view.use_render_border:
+            return None
+
+        return get_border_region(
+            img_dims,
+            (view.render_border_min_x, view.render_border_min_y),
+            (view.render_border_max_x, view.render_border_max_y)
+        )
+
+    render = context.scene.render
+    cam_obj = context.scene.camera
+    if not render.use_border or cam_obj is None:
+        return None
+    
+    # find the camera frame in region pixels
+    frame = [cam_obj.matrix_world @ v for v in cam_obj.data.view_frame(scene=context.scene)]
+    frame_2d = [location_3d_to_region_2d(region, region_view_3d, v) for v in frame]
+    if any(v is None for v in frame_2d):
+        return None
+    
+    frame_2d = np.array([tuple(v) for v in frame_2d])
+    (frame_x, frame_y) = frame_2d.min(axis=0)
+    (frame_w, frame_h) = frame_2d.max(axis=0) - frame_2d.min(axis=0)
+
+    x_min = max(0, int(frame_x + render.border_min_x * frame_w))
+    y_min = max(0, int(frame_y + render.border_min_y * frame_h))
+    x_max = min(img_dims[0], int(frame_x + render.border_max_x * frame_w))
+    y_max = min(img_dims[1], int(frame_y + render.border_max_y * frame_h))
+
+    if x_max <= x_min or y_max <= y_min:
+        return None
+    
+    return (x_min, y_min), (x_max - x_min, y_max - y_min)
+
 CAM_TYPE_DECODERS = {
-    CAM_TYPE_BLENDER_PERSPECTIVE: bl2nerf_cam_perspective
+    CAM_TYPE_BLENDER_PERSPECTIVE: bl2nerf_cam_perspective,
+    RENDER_CAM_TYPE_PERSPECTIVE: bl2nerf_cam_perspective,
+    RENDER_CAM_TYPE_QUADRILATERAL_HEXAHEDRON: bl2nerf_cam_quadrilateral_hexahedron,
+    RENDER_CAM_TYPE_SPHERICAL_QUADRILATERAL: bl2nerf_cam_spherical_quadrilateral,
 }